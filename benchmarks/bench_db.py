@@ -0,0 +1,144 @@
+# benchmarks/bench_db.py
+"""
+data.database con las conexiones reutilizadas del ConnectionManager frente
+a abrir y cerrar una conexión por llamada (como antes), con el mismo SQL.
+Crea una base de datos temporal con --sessions sesiones (3 apps y un
+timeline cada una):
+
+    python benchmarks/bench_db.py [--sessions 100000] [--calls 2000]
+"""
+import argparse
+import contextlib
+import datetime
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from data import database
+
+
+class PerCallReader:
+    """Sustituto de database._read(): una conexión nueva por consulta."""
+
+    class _Rows:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def fetchall(self):
+            return self.rows
+
+        def fetchone(self):
+            return self.rows[0] if self.rows else None
+
+    def execute(self, sql, params=()):
+        conn = sqlite3.connect(database.DB_PATH)
+        try:
+            return self._Rows(conn.execute(sql, params).fetchall())
+        finally:
+            conn.close()
+
+
+@contextlib.contextmanager
+def per_call_write():
+    """Sustituto de database._write(): conexión nueva, commit y cierre."""
+    conn = sqlite3.connect(database.DB_PATH)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+@contextlib.contextmanager
+def per_call_connections():
+    saved = database._read, database._write
+    reader = PerCallReader()
+    database._read, database._write = (lambda: reader), per_call_write
+    try:
+        yield
+    finally:
+        database._read, database._write = saved
+
+
+def populate(sessions, rnd):
+    start = datetime.datetime(2024, 1, 1)
+    rows, apps, timelines = [], [], []
+    for i in range(1, sessions + 1):
+        begin = start + datetime.timedelta(minutes=37 * i)
+        end = begin + datetime.timedelta(minutes=25)
+        rows.append((i, begin.isoformat(), end.isoformat(), 1500, rnd.randint(0, 100), "code.exe(900s)", 1500))
+        apps += [(i, name, f"{name} {i % 97}", rnd.randint(5, 900))
+                 for name in ("code.exe", "chrome.exe", "slack.exe")]
+        timelines.append((i, 30, bytes(rnd.randint(0, 100) for _ in range(51))))
+    with database._write() as conn:
+        conn.executemany(
+            "INSERT INTO sessions (id, start_time, end_time, duration_seconds, final_score, apps_used, "
+            "target_seconds, start_epoch, end_epoch) VALUES (?, ?, ?, ?, ?, ?, ?, "
+            f"{database.EPOCH_SQL.format('?2')}, {database.EPOCH_SQL.format('?3')})", rows)
+        conn.executemany("INSERT INTO session_apps (session_id, app_name, app_title, total_seconds) "
+                         "VALUES (?, ?, ?, ?)", apps)
+        conn.executemany("INSERT INTO session_timelines (session_id, interval_seconds, samples) "
+                         "VALUES (?, ?, ?)", timelines)
+        for n in range(20):
+            conn.execute("INSERT INTO rules (kind, pattern, category, weight) VALUES (?, ?, ?, ?)",
+                         ("keyword", f"proyecto{n}", "productive", 1.0))
+
+
+def median_us(fn, calls):
+    samples = []
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e6
+
+
+def save_full_session():
+    session_id = database.save_session("2030-01-01T10:00:00", "2030-01-01T10:25:00", 1500, 80, "code.exe(900s)",
+                                       target_seconds=1500)
+    database.save_session_apps(session_id, [("code.exe", "main.py", 900), ("chrome.exe", "Docs", 300)])
+    database.save_session_timeline(session_id, 30, bytes(range(51)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = os.path.join(tmp, "focusly.db")
+        database.init_db()
+        t0 = time.perf_counter()
+        populate(args.sessions, rnd)
+        print(f"{args.sessions} sesiones creadas en {time.perf_counter() - t0:.1f} s")
+
+        def ids():
+            return rnd.randint(1, args.sessions)
+
+        cases = [
+            ("get_session_timeline", lambda: database.get_session_timeline(ids()), args.calls),
+            ("get_rules", database.get_rules, args.calls),
+            ("get_session", lambda: database.get_session(ids()), args.calls),
+            ("get_session_apps", lambda: database.get_session_apps(ids()), args.calls),
+            ("get_latest_sessions(50)", lambda: database.get_latest_sessions(50), args.calls),
+            ("save_session + apps + timeline", save_full_session, max(1, args.calls // 10)),
+        ]
+        print(f"{'llamada':<32} {'por llamada (us)':>17} {'reutilizadas (us)':>18}")
+        for name, fn, calls in cases:
+            with per_call_connections():
+                per_call = median_us(fn, calls)
+            pooled = median_us(fn, calls)
+            print(f"{name:<32} {per_call:>17.0f} {pooled:>18.0f}")
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
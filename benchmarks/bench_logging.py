@@ -0,0 +1,99 @@
+# benchmarks/bench_logging.py
+"""
+Coste por tick del camino del score (ScoringEngine.update y
+FocusScorer.check_score_notification, lo que hace CoreWorker.publish) con
+los loggers de focusly en INFO (DEBUG desactivado) y en DEBUG, frente a la
+versión anterior con print() en cada tick. La salida (print y handler de
+consola) va a os.devnull, como una terminal que no se mira:
+
+    python benchmarks/bench_logging.py [--ticks 20000] [--repeat 5]
+"""
+import argparse
+import contextlib
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from core import log
+from core.focus_scorer import FocusScorer
+from core.scoring_engine import ScoringEngine
+
+
+class PrintScorer(FocusScorer):
+    """check_score_notification como antes de core.log: un print por llamada."""
+
+    def check_score_notification(self, current_score):
+        try:
+            print(f"[SCORE CHECK] Score: {current_score}% | Último: {self.last_notified_score}%")
+            if current_score % 5 == 0 and current_score < self.last_notified_score:
+                print(f"✅ NOTIFICANDO {current_score}%")
+                self.distraction_detected.emit("score_alert", self._get_notification_message(current_score), 0)
+                self.last_notified_score = current_score
+            elif current_score > self.last_notified_score:
+                print(f"🔼 Score subió a {current_score}%, reseteando notificaciones")
+                self.last_notified_score = current_score
+        except Exception as e:
+            print("[FocusScorer] Error en notificación de score:", e)
+
+
+def make_engine(scorer_cls):
+    scorer = scorer_cls()
+    engine = ScoringEngine(scorer, strategy="points")
+    engine.start_session()
+    for proc, title, seconds in [("code.exe", "main.py", 600), ("chrome.exe", "YouTube", 120),
+                                 ("slack.exe", "general", 60)]:
+        engine.push(proc, title, seconds)
+    return engine
+
+
+def tick_logging(engine, i):
+    score = engine.update(600 + i)
+    engine.scorer.check_score_notification(score)
+
+
+def tick_print(engine, i):
+    # el cálculo por puntos de main_window también imprimía dos líneas por tick
+    score = engine.update(600 + i)
+    print(f"[SCORE PUNTOS] Objetivo: {engine.target_minutes}min | "
+          f"Distracción: {engine.strategy.distracting_seconds / 60:.1f}min")
+    print(f"[SCORE PUNTOS] Puntos/min: {100 / engine.target_minutes:.1f} | Score: {score}%")
+    engine.scorer.check_score_notification(score)
+
+
+def per_tick_us(tick, engine, ticks, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for i in range(ticks):
+            tick(engine, i)
+        best = min(best, time.perf_counter() - t0)
+    return best / ticks * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        log.configure(level=logging.INFO)  # el handler de consola escribe en devnull
+        results.append(("print() en cada tick", per_tick_us(tick_print, make_engine(PrintScorer),
+                                                            args.ticks, args.repeat)))
+        results.append(("logging, DEBUG desactivado", per_tick_us(tick_logging, make_engine(FocusScorer),
+                                                                  args.ticks, args.repeat)))
+        log.set_level("", "DEBUG")
+        results.append(("logging, DEBUG activado", per_tick_us(tick_logging, make_engine(FocusScorer),
+                                                               args.ticks, args.repeat)))
+        log.set_level("", "INFO")
+    print(f"{'camino del tick':<30} {'us/tick':>9}")
+    for name, us in results:
+        print(f"{name:<30} {us:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
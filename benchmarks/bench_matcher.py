@@ -0,0 +1,86 @@
+# benchmarks/bench_matcher.py
+"""
+KeywordMatcher (una regex compilada) frente al clasificador anterior
+(un `k in texto` por palabra y por lista), con las listas por defecto y con
+listas grandes de usuario. Comprueba además que las máscaras coinciden.
+
+    python benchmarks/bench_matcher.py [--titles 2000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from core.focus_scorer import (FocusScorer, build_matcher, BROWSER_KEYWORDS, WEBSITE_DISTRACTORS,
+                               GAME_PROCESSES, MEDIA_PLAYERS)
+from core.keyword_matcher import PRODUCTIVE, DISTRACTOR, BROWSER, WEBSITE, GAME, MEDIA
+
+APPS = ["code.exe", "chrome.exe", "firefox.exe", "explorer.exe", "slack.exe", "steam.exe",
+        "vlc.exe", "winword.exe", "teams.exe", "python.exe"]
+WORDS = ["main.py", "README", "YouTube", "Inbox", "Pull request #42", "Jira", "Reddit - front page",
+         "Quarterly report", "Untitled", "Netflix", "docs", "meeting notes", "Spotify Premium"]
+
+
+def naive_flags(productive, distractors, proc, title):
+    """Máscara completa con el método anterior: una búsqueda de subcadena por palabra."""
+    lowp = (proc or "").lower()
+    lowt = (title or "").strip().lower()
+    mask = 0
+    if any(k in lowp or k in lowt for k in productive):
+        mask |= PRODUCTIVE
+    if any(k in lowp or k in lowt for k in distractors):
+        mask |= DISTRACTOR
+    if any(k in lowp for k in BROWSER_KEYWORDS):
+        mask |= BROWSER
+    if any(k in lowt for k in WEBSITE_DISTRACTORS):
+        mask |= WEBSITE
+    if any(k in lowp for k in GAME_PROCESSES):
+        mask |= GAME
+    if any(k in lowp for k in MEDIA_PLAYERS):
+        mask |= MEDIA
+    return mask
+
+
+def synthetic_events(n, rnd):
+    return [(rnd.choice(APPS), " - ".join(rnd.sample(WORDS, 2)) + f" {rnd.randint(0, 999)}")
+            for _ in range(n)]
+
+
+def per_call_us(fn, events, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for proc, title in events:
+            fn(proc, title)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(events) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    events = synthetic_events(args.titles, rnd)
+    defaults = FocusScorer()
+    print(f"{'palabras':>9} {'anterior (us)':>14} {'matcher (us)':>13} {'distintas':>10}")
+    for extra in (0, 200, 1000):
+        productive = defaults.productive + [f"proyecto{i}" for i in range(extra // 2)]
+        distractors = defaults.distractors + [f"ocio{i}" for i in range(extra - extra // 2)]
+        matcher = build_matcher(productive, distractors)
+        mismatches = sum(naive_flags(productive, distractors, p, t) != matcher.match(p.lower(), t.lower())
+                         for p, t in events)
+        old = per_call_us(lambda p, t: naive_flags(productive, distractors, p, t), events, args.repeat)
+        new = per_call_us(lambda p, t: matcher.match(p.lower(), t.strip().lower()), events, args.repeat)
+        total = (len(productive) + len(distractors) + len(BROWSER_KEYWORDS) + len(WEBSITE_DISTRACTORS)
+                 + len(GAME_PROCESSES) + len(MEDIA_PLAYERS))
+        print(f"{total:>9} {old:>14.1f} {new:>13.1f} {mismatches:>10}")
+
+
+if __name__ == "__main__":
+    main()
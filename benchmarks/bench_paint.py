@@ -0,0 +1,78 @@
+# benchmarks/bench_paint.py
+"""
+Coste de paintEvent de PatternBackground y CircleScore con la caché de
+pixmaps y sin ella. Sin caché, el fondo dibuja el patrón directamente en
+cada paintEvent (como antes de cachearlo) y el anillo vuelve a generar el
+disco de fondo antes de cada paint. Offscreen:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_paint.py [--frames 300]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QPoint, QRect
+from PySide6.QtGui import QPainter, QPixmap, QRegion
+from PySide6.QtWidgets import QApplication
+
+from ui.main_window import CircleScore, PatternBackground
+
+
+class DirectBackground(PatternBackground):
+    """PatternBackground sin pixmap: todo el patrón en cada paintEvent."""
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        self._draw_pattern(p)
+        p.end()
+
+
+def paint_us(widget, frames, region=None, cached=True, step=None):
+    """Mediana en microsegundos de QWidget.render() (un paintEvent por frame)."""
+    target = QPixmap(widget.size())
+    region = region or QRegion(widget.rect())
+    samples = []
+    for i in range(frames):
+        if step is not None:
+            step(i)
+        if not cached:
+            widget._cache_key = None
+        t0 = time.perf_counter()
+        widget.render(target, QPoint(), region)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    background, direct = PatternBackground(), DirectBackground()
+    for widget in (background, direct):
+        widget.resize(1000, 620)
+    circle = CircleScore(size=120)
+    # repintado típico cada segundo: el rectángulo del label del timer
+    dirty = QRegion(QRect(350, 120, 300, 80))
+    step = lambda i: circle.setValue(i % 101)
+    cases = [
+        ("fondo 1000x620 completo", paint_us(direct, args.frames), paint_us(background, args.frames)),
+        ("fondo bajo un rect 300x80", paint_us(direct, args.frames, dirty),
+         paint_us(background, args.frames, dirty)),
+        ("CircleScore cambiando de valor", paint_us(circle, args.frames, cached=False, step=step),
+         paint_us(circle, args.frames, step=step)),
+    ]
+    print(f"{'caso':<32} {'sin caché (us)':>15} {'con caché (us)':>15}")
+    for name, uncached, cached in cases:
+        print(f"{name:<32} {uncached:>15.0f} {cached:>15.0f}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
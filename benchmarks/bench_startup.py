@@ -0,0 +1,82 @@
+# benchmarks/bench_startup.py
+"""
+Tiempo hasta la ventana principal interactiva (lo que sigue al splash en
+run_app): FocuslyMain() + show() + processEvents(), sobre bases de datos
+generadas con historiales de distinto tamaño. Con el warm-up ya terminado
+(como cuando el splash dura lo suficiente) y sin él (init_db y
+recuperación del diario dentro del constructor). Offscreen:
+
+    python benchmarks/bench_startup.py [--sizes 0 1000 5000] [--runs 5]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+
+from bench_db import populate
+from core.warmup import WarmupJob
+from data import database
+from ui.main_window import FocuslyMain
+
+
+def time_to_interactive_ms(app, warmup):
+    """Una apertura de la ventana principal; se cierra (hilos y DB) al terminar."""
+    t0 = time.perf_counter()
+    window = FocuslyMain(warmup=warmup)
+    window.show()
+    app.processEvents()
+    elapsed = (time.perf_counter() - t0) * 1000
+    window.close()
+    window.deleteLater()
+    # processEvents() no entrega DeferredDelete: sin esto las ventanas se
+    # acumulan y cada setStyleSheet de la siguiente es más lento
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    app.processEvents()
+    return elapsed
+
+
+def run_size(app, sessions, runs):
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_PATH = os.path.join(tmp, "focusly.db")
+        database.init_db()
+        populate(sessions, random.Random(7))
+        database.close()
+        cold, warm = [], []
+        for _ in range(runs):
+            cold.append(time_to_interactive_ms(app, None))
+            warmup = WarmupJob()
+            warmup.start()
+            warmup.wait()  # el splash sigue en pantalla mientras tanto
+            warm.append(time_to_interactive_ms(app, warmup))
+        database.close()
+    return statistics.median(cold), statistics.median(warm)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 1000, 5000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # la primera ventana paga la carga de estilos, fuentes y plugins de Qt
+    # (sobre una base de datos vacía temporal, no la focusly.db del usuario)
+    run_size(app, 0, 1)
+    print(f"{'sesiones':>9} {'sin warm-up (ms)':>17} {'con warm-up (ms)':>17}")
+    for sessions in args.sizes:
+        cold, warm = run_size(app, sessions, args.runs)
+        print(f"{sessions:>9} {cold:>17.0f} {warm:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,61 +1,228 @@
 # src/core/app_tracker.py
 from PySide6.QtCore import QThread, Signal
-import time
-import psutil
+import os
+import threading
+from core.tracker_backends import TrackerBackend, TraceWriter, default_backend
+from core.log import get_logger
+
+log = get_logger("tracker")
 
-# Import Windows APIs if on Windows
-try:
-    import win32gui
-    import win32process
-except Exception:
-    win32gui = None
-    win32process = None
 
 class AppTracker(QThread):
     """
-    Hilo que emite la app/ventana activa cada segundo.
-    Señal: active_changed(process_name, window_title)
+    Hilo que vigila la app/ventana activa a través de un TrackerBackend.
+    Señales:
+      active_changed(process_name, window_title)
+      active_interval(process_name, window_title, start_monotonic, end_monotonic)
+    - Backend por defecto (default_backend): Win32 por sondeo, X11 por eventos,
+      o ReplayBackend si FOCUSLY_REPLAY_TRACE apunta a una traza
+    - trace_path (o FOCUSLY_TRACE_RECORD): graba las transiciones en una traza
+      reproducible con ReplayBackend
+    - change_only=True: active_changed solo se emite en transiciones; el tiempo
+      de permanencia llega por active_interval al cerrar cada ventana y como
+      latido (heartbeat) cada heartbeat_interval mientras siga activa. Los
+      intervalos son consecutivos y no se solapan, usan time.monotonic().
+    - change_only=False: comportamiento anterior, active_changed en cada muestra
+    - Sondeo adaptativo (backends no basados en eventos): si la misma ventana
+      sigue activa más de backoff_after segundos, el intervalo crece por
+      backoff_factor hasta max_poll_interval; vuelve a poll_interval en el
+      primer cambio. current_interval expone el intervalo vigente. Los
+      latidos se emiten en las muestras, así que no añaden despertares.
+    - Hilo persistente: resume() / pause() / shutdown() responden en
+      milisegundos; en pausa el hilo duerme en una condición (sin sondeo) y
+      nunca se vuelve a crear el QThread.
     """
     active_changed = Signal(str, str)
+    active_interval = Signal(str, str, float, float)
 
-    def __init__(self, poll_interval=1.0):
+    def __init__(self, poll_interval=1.0, heartbeat_interval=5.0, change_only=True,
+                 backend: TrackerBackend = None, trace_path=None,
+                 max_poll_interval=None, backoff_after=60.0, backoff_factor=1.5):
         super().__init__()
-        self.poll_interval = poll_interval
-        self._running = False
+        self.poll_interval = poll_interval  # intervalo mínimo (sondeo rápido)
+        self.max_poll_interval = max(poll_interval, max_poll_interval or poll_interval)
+        self.backoff_after = backoff_after
+        self.backoff_factor = backoff_factor
+        self._interval = poll_interval
+        self._changed_at = None  # reloj del backend en el último cambio de ventana
+        self.heartbeat_interval = heartbeat_interval
+        self.change_only = change_only
+        self.backend = backend or default_backend()
+        self.trace_path = trace_path or os.environ.get("FOCUSLY_TRACE_RECORD")
+        self._trace = None
+        self._cond = threading.Condition()
+        self._paused = True
+        self._shutdown = False
         self._last_process = None
         self._last_title = None
+        self._segment_start = None  # reloj del backend al inicio del tramo abierto
+
+    @property
+    def process_cache(self):
+        """Caché de metadatos de proceso del backend (None si no usa)."""
+        return getattr(self.backend, "process_cache", None)
+
+    def clock(self):
+        """Reloj de los intervalos emitidos (time.monotonic salvo en replay)."""
+        return self.backend.clock()
+
+    @property
+    def current_interval(self):
+        """Intervalo de sondeo vigente en segundos (para instrumentación)."""
+        return self._interval
+
+    def _adapt_interval(self, changed, now):
+        """Vuelve al sondeo rápido en un cambio; si no, retrocede tras backoff_after."""
+        if changed:
+            self._changed_at = now
+            self._interval = self.poll_interval
+        elif self._changed_at is not None and now - self._changed_at >= self.backoff_after:
+            self._interval = min(self.max_poll_interval, self._interval * self.backoff_factor)
+
+    # ------------------ emisión ------------------
+    def _observe(self, proc, title, now):
+        """Procesa una muestra (proc, title) tomada en `now` (monotonic)."""
+        if self._segment_start is None:
+            self._last_process, self._last_title = proc, title
+            self._segment_start = now
+            self._adapt_interval(True, now)
+            self._record(proc, title)
+            self.active_changed.emit(proc, title)
+            return
 
+        if proc != self._last_process or title != self._last_title:
+            # cerrar el intervalo de la ventana anterior y abrir uno nuevo
+            self.active_interval.emit(self._last_process, self._last_title, self._segment_start, now)
+            self._last_process, self._last_title = proc, title
+            self._segment_start = now
+            self._adapt_interval(True, now)
+            self._record(proc, title)
+            self.active_changed.emit(proc, title)
+            return
+
+        if not self.change_only:
+            self.active_changed.emit(proc, title)
+        else:
+            self._adapt_interval(False, now)
+        self._heartbeat(now)
+
+    def _heartbeat(self, now):
+        """Emite el tramo acumulado de la ventana actual si toca latido."""
+        if self._segment_start is None:
+            return
+        if now - self._segment_start >= self.heartbeat_interval:
+            self.active_interval.emit(self._last_process, self._last_title, self._segment_start, now)
+            self._segment_start = now
+
+    def _next_wait(self, now):
+        """Segundos (reloj del backend) hasta la próxima vez que hay que despertar."""
+        if not self.change_only or self._segment_start is None:
+            return self.poll_interval
+        if self.backend.event_driven:
+            return max(0.0, self._segment_start + self.heartbeat_interval - now)
+        return self._interval
+
+    def _record(self, proc, title):
+        if self._trace is not None:
+            self._trace.write(proc, title)
+
+    # ------------------ bucle ------------------
     def run(self):
-        self._running = True
-        while self._running:
+        backend = self.backend
+        try:
+            backend.open()
+        except Exception as e:
+            log.error("backend error: %s", e)
+            return
+        if self.trace_path:
             try:
-                if win32gui:
-                    hwnd = win32gui.GetForegroundWindow()
-                    title = win32gui.GetWindowText(hwnd) if hwnd else ""
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    proc_name = None
-                    try:
-                        proc = psutil.Process(pid)
-                        proc_name = proc.name()
-                    except Exception:
-                        proc_name = None
-                    
-                    current_proc = proc_name or ""
-                    current_title = title or ""
-                    
-                    # ⭐⭐ SIEMPRE emitir, incluso si es la misma ventana ⭐⭐
-                    self.active_changed.emit(current_proc, current_title)
-                    self._last_process = current_proc
-                    self._last_title = current_title
-                    
-                else:
-                    # Fallback: emit nothing on non-windows for now
-                    pass
+                self._trace = TraceWriter(self.trace_path)
             except Exception as e:
-                print("AppTracker error:", e)
-            time.sleep(self.poll_interval)
+                log.error("trace error: %s", e)
+        try:
+            while self._wait_until_resumed():
+                self._run_active(backend)
+                if backend.finished:
+                    break
+        finally:
+            backend.close()
+            if self._trace is not None:
+                self._record(self._last_process or "", self._last_title or "")
+                self._trace.close()
+                self._trace = None
 
-    def stop(self):
-        self._running = False
+    def _wait_until_resumed(self):
+        """Duerme mientras esté en pausa. False si hay que terminar el hilo."""
+        with self._cond:
+            while self._paused and not self._shutdown:
+                self._cond.wait()
+            return not self._shutdown
+
+    def _active(self):
+        return not self._paused and not self._shutdown
+
+    def _run_active(self, backend):
+        """Un tramo de tracking entre resume() y pause()/shutdown()."""
+        self._last_process = None
+        self._last_title = None
+        self._segment_start = None
+        self._changed_at = None
+        self._interval = self.poll_interval
+        changed = True
+        while self._active() and not backend.finished:
+            try:
+                now = backend.clock()
+                if changed or not backend.event_driven:
+                    sample = backend.sample()
+                    if sample is not None and self._active():
+                        self._observe(sample[0] or "", sample[1] or "", now)
+                elif self.change_only:
+                    self._heartbeat(now)
+                elif self._segment_start is not None:
+                    self._observe(self._last_process, self._last_title, now)
+                changed = backend.wait(self._next_wait(backend.clock()))
+            except Exception as e:
+                log.error("error: %s", e)
+                backend.wait(self.poll_interval)
+                changed = True
+        if backend.finished and self._segment_start is not None:
+            # fin de la traza: cerrar el último intervalo
+            end = backend.clock()
+            if end > self._segment_start:
+                self.active_interval.emit(self._last_process, self._last_title, self._segment_start, end)
+
+    # ------------------ control (desde el hilo de la GUI) ------------------
+    @property
+    def is_paused(self):
+        return self._paused
+
+    def resume(self):
+        """Reanuda el tracking; arranca el hilo la primera vez."""
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+        if not self.isRunning():
+            self.start()
+
+    def pause(self):
+        """
+        Pausa el tracking sin destruir el hilo. El tramo abierto NO se emite:
+        quien consume los intervalos cierra la cola con su propio clock().
+        """
+        with self._cond:
+            self._paused = True
+            self._cond.notify_all()
+        self.backend.wake()
+
+    def shutdown(self, timeout_ms=2000):
+        """Termina el hilo (salida de la app)."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        self.backend.wake()
         self.quit()
-        self.wait()
+        return self.wait(timeout_ms)
+
+    def stop(self):
+        """Compatibilidad: equivale a shutdown()."""
+        self.shutdown()
@@ -2,8 +2,64 @@
 import os
 import pygame
 import time
+from core.log import get_logger
+
+log = get_logger("audio")
 
 AUDIO_EXTS = (".wav", ".mp3", ".ogg", ".flac")
+MIXER_SETTINGS = dict(frequency=44100, size=-16, channels=2, buffer=512)
+
+
+def resolve_assets_root(assets_root=None):
+    """project_root/assets/sounds si existe, si no project_root/assets."""
+    # default: project_root/assets or project_root/assets/sounds
+    if assets_root is None:
+        assets_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets"))
+    # preferir assets/sounds si existe
+    if os.path.isdir(os.path.join(assets_root, "sounds")):
+        assets_root = os.path.join(assets_root, "sounds")
+    return assets_root
+
+
+def init_mixer():
+    """Inicializa solo pygame.mixer (sin pygame.init(): no hace falta vídeo ni eventos)."""
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(**MIXER_SETTINGS)
+        log.debug("pygame mixer initialized")
+        return True
+    except Exception as e:
+        log.error("Error init mixer: %s", e)
+        return False
+
+
+def scan_categories(assets_root):
+    """{nombre visible: carpeta} de las subcarpetas de sonidos (sin tocar pygame)."""
+    category_dirs = {}
+    if os.path.isdir(assets_root):
+        for entry in sorted(os.listdir(assets_root)):
+            p = os.path.join(assets_root, entry)
+            if os.path.isdir(p):
+                # normalizar nombre visible de categoría:
+                display_name = entry
+                # reglas pequeñas: querer 'Dreamscapes' en vez de 'Dreamscape' etc.
+                if entry.lower().startswith("dream"):
+                    display_name = "Dreamscapes"
+                elif "rain" in entry.lower():
+                    display_name = "Rain"
+                elif entry.lower().startswith("deep"):
+                    display_name = "Deep Focus"
+                # si ya existe display_name, añadir sufijo
+                base = display_name
+                i = 1
+                while display_name in category_dirs:
+                    display_name = f"{base} {i}"
+                    i += 1
+                category_dirs[display_name] = p
+    else:
+        log.warning("assets root not found: %s", assets_root)
+    return category_dirs
+
 
 class AudioManager:
     """
@@ -11,44 +67,20 @@ class AudioManager:
     - get_categories(): lista de categorías
     - get_tracks(category): lista de archivos (filenames) dentro de la carpeta de la categoría
     - play_track(category, index_or_name): reproduce la pista seleccionada
+    Con categories/mixer_ready (de WarmupJob) no repite el escaneo ni el init del mixer.
     """
 
-    def __init__(self, assets_root=None):
-        self._ensure_mixer_init()
+    def __init__(self, assets_root=None, categories=None, mixer_ready=False):
+        if not mixer_ready:
+            self._ensure_mixer_init()
 
-        # default: project_root/assets or project_root/assets/sounds
-        if assets_root is None:
-            assets_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets"))
-        # preferir assets/sounds si existe
-        if os.path.isdir(os.path.join(assets_root, "sounds")):
-            assets_root = os.path.join(assets_root, "sounds")
-        self.assets_root = assets_root
-        print(f"[AudioManager] assets_root -> {self.assets_root}")
+        self.assets_root = resolve_assets_root(assets_root)
+        log.debug("assets_root -> %s", self.assets_root)
 
         # Construir mapping category -> absolute folder path (detectando subfolders)
-        self._category_dirs = {}
-        if os.path.isdir(self.assets_root):
-            for entry in sorted(os.listdir(self.assets_root)):
-                p = os.path.join(self.assets_root, entry)
-                if os.path.isdir(p):
-                    # normalizar nombre visible de categoría:
-                    display_name = entry
-                    # reglas pequeñas: querer 'Dreamscapes' en vez de 'Dreamscape' etc.
-                    if entry.lower().startswith("dream"):
-                        display_name = "Dreamscapes"
-                    elif "rain" in entry.lower():
-                        display_name = "Rain"
-                    elif entry.lower().startswith("deep"):
-                        display_name = "Deep Focus"
-                    # si ya existe display_name, añadir sufijo
-                    base = display_name
-                    i = 1
-                    while display_name in self._category_dirs:
-                        display_name = f"{base} {i}"
-                        i += 1
-                    self._category_dirs[display_name] = p
-        else:
-            print("[AudioManager] WARNING: assets root not found:", self.assets_root)
+        if categories is None:
+            categories = scan_categories(self.assets_root)
+        self._category_dirs = dict(categories)
 
         # estado de reproducción
         self.current_category = None
@@ -62,14 +94,7 @@ class AudioManager:
             pass
 
     def _ensure_mixer_init(self):
-        try:
-            if not pygame.get_init():
-                pygame.init()
-            if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
-            print("[AudioManager] pygame mixer initialized")
-        except Exception as e:
-            print("[AudioManager] Error init mixer:", e)
+        init_mixer()
 
     # ------------- helpers -------------
     def get_categories(self):
@@ -103,24 +128,24 @@ class AudioManager:
     def play_track(self, category, index_or_name, loop=True):
         tracks = self.get_tracks(category)
         if not tracks:
-            print(f"[AudioManager] no tracks available for category '{category}'")
+            log.warning("no tracks available for category %r", category)
             return
 
         # resolver filename
         if isinstance(index_or_name, int):
             if index_or_name < 0 or index_or_name >= len(tracks):
-                print("[AudioManager] invalid track index", index_or_name)
+                log.warning("invalid track index %s", index_or_name)
                 return
             filename = tracks[index_or_name]
         else:
             filename = str(index_or_name)
             if filename not in tracks:
-                print("[AudioManager] requested track not in available tracks:", filename)
+                log.warning("requested track not in available tracks: %s", filename)
                 return
 
         path = self._candidate_path(filename, category)
         exists = os.path.exists(path) if path else False
-        print(f"[AudioManager] play_track -> category='{category}', filename='{filename}', path='{path}', exists={exists}")
+        log.debug("play_track -> category=%r, filename=%r, path=%r, exists=%s", category, filename, path, exists)
         if not exists:
             return
 
@@ -131,11 +156,11 @@ class AudioManager:
                     pygame.mixer.music.unpause()
                     self._paused = False
                     self._is_playing = True
-                    print("[AudioManager] resumed same track")
+                    log.debug("resumed same track")
                 except Exception as e:
-                    print("[AudioManager] unpause error:", e)
+                    log.error("unpause error: %s", e)
             else:
-                print("[AudioManager] same track already playing -> noop")
+                log.debug("same track already playing -> noop")
             return
 
         # nuevo track: load & play
@@ -151,9 +176,9 @@ class AudioManager:
             self._paused = False
             self._is_playing = True
             time.sleep(0.01)
-            print("[AudioManager] playing:", path)
+            log.info("playing: %s", path)
         except Exception as e:
-            print("[AudioManager] error al cargar/reproducir:", e)
+            log.error("error al cargar/reproducir: %s", e)
 
     def pause_all(self):
         try:
@@ -161,9 +186,9 @@ class AudioManager:
                 pygame.mixer.music.pause()
                 self._paused = True
                 self._is_playing = False
-                print("[AudioManager] paused")
+                log.debug("paused")
         except Exception as e:
-            print("[AudioManager] pause error:", e)
+            log.error("pause error: %s", e)
 
     def resume_all(self):
         try:
@@ -171,14 +196,14 @@ class AudioManager:
                 pygame.mixer.music.unpause()
                 self._paused = False
                 self._is_playing = True
-                print("[AudioManager] resumed")
+                log.debug("resumed")
         except Exception as e:
-            print("[AudioManager] resume error:", e)
+            log.error("resume error: %s", e)
 
     def stop_all(self):
         try:
             pygame.mixer.music.stop()
-            print("[AudioManager] stopped")
+            log.debug("stopped")
         except Exception:
             pass
         self.current_category = None
@@ -191,9 +216,9 @@ class AudioManager:
             v = max(0.0, min(1.0, float(v)))
             pygame.mixer.music.set_volume(v)
             self._volume = v
-            print("[AudioManager] volume set to", v)
+            log.debug("volume set to %s", v)
         except Exception as e:
-            print("[AudioManager] set volume error:", e)
+            log.error("set volume error: %s", e)
 
     def is_playing(self):
         try:
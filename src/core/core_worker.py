@@ -0,0 +1,242 @@
+# src/core/core_worker.py
+import time
+from PySide6.QtCore import QMetaObject, QObject, QThread, QTimer, Qt, Signal, Slot
+from core.focus_scorer import FocusScorer
+from core.scoring_engine import ScoringEngine
+from core.session_journal import SessionJournal, store_session
+from data import database
+from core.log import get_logger
+
+log = get_logger("core")
+
+
+class CoreWorker(QObject):
+    """
+    Estado de scoring fuera del hilo de la GUI.
+    - Vive en su propio QThread junto con FocusScorer y ScoringEngine: los
+      eventos del AppTracker llegan directamente aquí (conexión en cola) y la
+      clasificación, el historial y el score nunca corren al lado del pintado
+    - Publica snapshot(dict) como mucho cada publish_interval_ms y solo si hay
+      algo nuevo: score, segundos de sesión y los eventos de apps acumulados
+      desde el anterior (intervalos consecutivos de la misma app se fusionan)
+    - La GUI manda órdenes con señales (start_tracking, stop_tracking,
+      save_session, reset_session, set_rules); al vivir en un solo hilo se procesan en
+      orden y no hacen falta locks
+    - distraction_detected / rules_changed / session_saved se re-emiten desde
+      aquí para que la GUI solo tenga que dibujar
+    - El tiempo de sesión (elapsed) es el tiempo activo: se suma solo entre
+      start_tracking y stop_tracking y vuelve a cero con una sesión nueva, así
+      que pausar no adelanta el timeline ni reanudar reinicia el score
+    - Cada checkpoint_interval_ms (y al pausar o cerrar) añade al SessionJournal
+      lo que cambió de la sesión en curso; si la app muere, la sesión se
+      recupera al arrancar (session_journal.recover_interrupted)
+    """
+    snapshot = Signal(dict)
+    distraction_detected = Signal(str, str, int)
+    rules_changed = Signal()
+    session_saved = Signal(int, int)  # session_id, final_score
+
+    def __init__(self, tracker, publish_interval_ms=250, rules=None, journal_path=None,
+                 checkpoint_interval_ms=15000):
+        super().__init__()
+        self.tracker = tracker
+        if rules is None:
+            rules = database.get_rules()
+        self.scorer = FocusScorer(rules=rules)
+        self.engine = ScoringEngine(self.scorer, strategy="points")
+        self.scorer.distraction_detected.connect(self.distraction_detected)
+        self.scorer.rules_changed.connect(self.rules_changed)
+
+        self._tracking = False
+        self._last_proc = None
+        self._last_title = None
+        self._last_ts = None  # tracker.clock() hasta donde ya se contabilizó
+        self._session_start = None  # epoch del inicio de la sesión (None: no hay sesión)
+        self._active_seconds = 0.0  # tiempo activo de los tramos ya cerrados (pausas)
+        self._run_start = None  # time.monotonic() al empezar el tramo en curso
+        self._events = []  # [(proc, title, seconds)] pendientes de publicar
+        self._last_published = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(publish_interval_ms)
+        self._timer.timeout.connect(self.publish)
+        self.journal = SessionJournal(journal_path)
+        self._checkpoint_timer = QTimer(self)
+        self._checkpoint_timer.setInterval(checkpoint_interval_ms)
+        self._checkpoint_timer.timeout.connect(self.checkpoint)
+        self._thread = QThread()
+        self._thread.setObjectName("FocuslyCore")
+        self._thread.started.connect(self._timer.start)
+        self._thread.started.connect(self._checkpoint_timer.start)
+
+    # ------------------ ciclo de vida (hilo de la GUI) ------------------
+    def start(self):
+        for obj in (self, self.scorer, self.engine):
+            obj.moveToThread(self._thread)
+        self._thread.start()
+
+    def shutdown(self, timeout_ms=2000):
+        if self._thread.isRunning():
+            # los timers y el diario viven en el hilo del core: cerrarlos allí antes de salir
+            QMetaObject.invokeMethod(self, "_close", Qt.BlockingQueuedConnection)
+        self._thread.quit()
+        return self._thread.wait(timeout_ms)
+
+    @Slot()
+    def _close(self):
+        self._timer.stop()
+        self._checkpoint_timer.stop()
+        self.checkpoint()
+        self.journal.close()
+
+    # ------------------ eventos del tracker ------------------
+    @Slot(str, str)
+    def on_active_changed(self, process, title):
+        if not self._tracking:
+            return
+        self._last_proc = process or ""
+        self._last_title = title or ""
+        self._queue_event(process, title, 0.0)
+
+    @Slot(str, str, float, float)
+    def on_active_interval(self, process, title, start, end):
+        """Intervalo [start, end] (tracker.clock()) que la ventana estuvo activa."""
+        if not self._tracking:
+            return
+        # no contar dos veces lo que ya se cerró en stop_tracking
+        if self._last_ts is not None:
+            start = max(start, self._last_ts)
+        seconds = end - start
+        if seconds <= 0:
+            return
+        self._last_ts = end
+        self.engine.push(process, title, seconds)
+        self._queue_event(process, title, seconds)
+
+    def _queue_event(self, process, title, seconds):
+        key = (process or "unknown", title or "")
+        if seconds > 0 and self._events and self._events[-1][:2] == key:
+            self._events[-1] = (key[0], key[1], self._events[-1][2] + seconds)
+        else:
+            self._events.append((key[0], key[1], seconds))
+
+    # ------------------ órdenes de la GUI ------------------
+    @Slot(float, float, int)
+    def start_tracking(self, clock_now, session_start, target_minutes):
+        if self.engine.session_start is None:
+            self._active_seconds = 0.0  # sesión nueva (no es una reanudación)
+        self._session_start = session_start
+        self.engine.set_target_minutes(target_minutes)
+        if self.engine.session_start is None or not self.journal.active:
+            self.journal.begin(session_start, int(self.engine.target_minutes * 60),
+                               self.engine.timeline_interval)
+        self.engine.start_session()
+        if not self._tracking:
+            self._tracking = True
+            self._last_ts = clock_now
+            self._run_start = time.monotonic()
+
+    @Slot(float)
+    def stop_tracking(self, clock_now):
+        """Cierra el tramo abierto hasta clock_now (el tracker ya está en pausa)."""
+        if not self._tracking:
+            return
+        if self._last_proc is not None and self._last_ts is not None:
+            delta = clock_now - self._last_ts
+            if delta > 0:
+                self.engine.push(self._last_proc, self._last_title, delta)
+                self._queue_event(self._last_proc, self._last_title, delta)
+        self.publish()  # último update del tramo antes de cerrarlo
+        self._tracking = False
+        self._last_proc = None
+        self._last_title = None
+        self._last_ts = None
+        self._active_seconds = self._elapsed()
+        self._run_start = None
+        self.checkpoint()
+
+    @Slot(list)
+    def set_rules(self, rules):
+        """Reglas editadas en la página de configuración (ya guardadas en la DB)."""
+        self.scorer.set_rules(rules)
+
+    @Slot(int)
+    def set_target_minutes(self, minutes):
+        self.engine.set_target_minutes(minutes)
+
+    @Slot()
+    def reset_session(self):
+        self.scorer.last_notified_score = 100
+        self._session_start = None
+        self._active_seconds = 0.0
+        self._run_start = time.monotonic() if self._tracking else None
+        self._events.clear()
+        self.engine.reset_session()
+        self.journal.clear()
+
+    @Slot(str, str, int, int)
+    def save_session(self, start_iso, end_iso, duration, target_seconds):
+        """
+        Guarda la sesión con el mismo score que muestra el anillo. La duración
+        guardada es el tiempo activo (la de la GUI solo si no hay sesión en el core).
+        """
+        try:
+            if self._session_start is not None:
+                duration = int(self._elapsed())
+                final_score = self.engine.update(duration)
+            else:
+                final_score = self.engine.score
+            log.info("Guardando sesión - Duración: %ss, Score: %s%%", duration, final_score)
+
+            session_id = store_session(
+                start_iso, end_iso, duration, final_score, self.engine.usage, target_seconds,
+                self.engine.timeline_interval, self.engine.timeline_bytes(),
+            )
+            # el detalle ya está en la base de datos: no arrastrarlo a la siguiente sesión
+            self._session_start = None
+            self._active_seconds = 0.0
+            self.engine.reset_session()
+            self.journal.clear()
+            log.info("Sesión guardada - ID: %s, Duración: %ss, Score: %s%%", session_id, duration, final_score)
+            self.publish()
+            self.session_saved.emit(session_id, final_score)
+        except Exception as e:
+            log.exception("Error guardando sesión: %s", e)
+
+    @Slot()
+    def checkpoint(self):
+        """Añade al diario lo que cambió de la sesión en curso (nada si no hay sesión)."""
+        if self._session_start is None or not self.journal.active:
+            return
+        self.journal.checkpoint(self._elapsed(), self.engine.score, self.engine.usage,
+                                self.engine.timeline, int(self.engine.target_minutes * 60))
+
+    # ------------------ publicación ------------------
+    def _elapsed(self):
+        """Segundos activos de la sesión (sin las pausas)."""
+        if self._session_start is None:
+            return 0.0
+        if self._run_start is None:
+            return self._active_seconds
+        return self._active_seconds + time.monotonic() - self._run_start
+
+    @Slot()
+    def publish(self):
+        """Emite un snapshot si cambió el score o hay eventos nuevos."""
+        if self._session_start is not None and self._tracking:
+            score = self.engine.update(self._elapsed())
+            if score != self._last_published:
+                self.scorer.check_score_notification(score)
+        else:
+            score = self.engine.score
+        if score == self._last_published and not self._events:
+            return
+        self._last_published = score
+        events, self._events = self._events, []
+        self.snapshot.emit({
+            "score": score,
+            "elapsed": self._elapsed(),
+            "events": events,
+            "apps": len(self.engine.usage),
+            "history": len(self.scorer.history),
+        })
@@ -0,0 +1,197 @@
+# src/core/event_store.py
+import sys
+from array import array
+from typing import Iterator, Tuple
+
+Event = Tuple[float, float, str, str, float]  # (start_ts, end_ts, proc, title, seconds)
+
+
+class StringTable:
+    """
+    Tabla de cadenas internadas con conteo de referencias.
+    - intern(s): id entero estable mientras haya referencias
+    - release(id): al llegar a 0 la cadena se libera y su id se reutiliza,
+      así la tabla no crece con cada título de pestaña que ya expiró
+    """
+
+    def __init__(self):
+        self._ids = {}  # str -> id
+        self._strings = []  # id -> str (None si está libre)
+        self._refs = array("I")
+        self._free = []
+
+    def intern(self, s: str) -> int:
+        sid = self._ids.get(s)
+        if sid is None:
+            if self._free:
+                sid = self._free.pop()
+                self._strings[sid] = s
+                self._refs[sid] = 0
+            else:
+                sid = len(self._strings)
+                self._strings.append(s)
+                self._refs.append(0)
+            self._ids[s] = sid
+        self._refs[sid] += 1
+        return sid
+
+    def release(self, sid: int):
+        self._refs[sid] -= 1
+        if self._refs[sid] == 0:
+            del self._ids[self._strings[sid]]
+            self._strings[sid] = None
+            self._free.append(sid)
+
+    def get(self, sid: int) -> str:
+        return self._strings[sid]
+
+    def clear(self):
+        self._ids.clear()
+        self._strings.clear()
+        self._refs = array("I")
+        self._free.clear()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def nbytes(self) -> int:
+        """Estimación: cadenas vivas + dict de ids + lista + contadores."""
+        strings = sum(sys.getsizeof(s) for s in self._ids)
+        return (strings + sys.getsizeof(self._ids) + sys.getsizeof(self._strings)
+                + self._refs.itemsize * len(self._refs))
+
+
+class EventHistory:
+    """
+    Historial compacto de eventos (start_ts, end_ts, proc, title, seconds).
+    - Timestamps y duración en arrays float64; proc/title como ids uint32 de
+      una StringTable: BYTES_PER_EVENT = 32 bytes por evento (3 x 8 + 2 x 4)
+      frente a ~200 bytes de una tupla de 5 con sus floats
+    - Cada cadena distinta se guarda una sola vez y se libera cuando expira el
+      último evento que la usa, así la memoria depende de la ventana y no de
+      cuántos títulos distintos se vieron
+    - API tipo deque: append, pop, popleft, [i], iteración, len, clear;
+      popleft es O(1) (avanza un offset y compacta en bloque de vez en cuando)
+    """
+    BYTES_PER_EVENT = 32
+    COMPACT_MIN = 4096  # eventos expirados antes de plantearse compactar
+
+    def __init__(self):
+        self.strings = StringTable()
+        self._start = array("d")
+        self._end = array("d")
+        self._seconds = array("d")
+        self._proc = array("I")
+        self._title = array("I")
+        self._head = 0
+
+    def __len__(self):
+        return len(self._start) - self._head
+
+    def __bool__(self):
+        return len(self._start) > self._head
+
+    def _event(self, i: int) -> Event:
+        get = self.strings.get
+        return (self._start[i], self._end[i], get(self._proc[i]), get(self._title[i]), self._seconds[i])
+
+    def __getitem__(self, index: int) -> Event:
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("EventHistory index out of range")
+        return self._event(self._head + index)
+
+    def __iter__(self) -> Iterator[Event]:
+        for i in range(self._head, len(self._start)):
+            yield self._event(i)
+
+    def append(self, event: Event):
+        start_ts, end_ts, proc, title, seconds = event
+        self._start.append(start_ts)
+        self._end.append(end_ts)
+        self._seconds.append(seconds)
+        self._proc.append(self.strings.intern(proc))
+        self._title.append(self.strings.intern(title))
+
+    def pop(self) -> Event:
+        if not self:
+            raise IndexError("pop from an empty EventHistory")
+        event = self._event(len(self._start) - 1)
+        self._release(len(self._start) - 1)
+        for arr in (self._start, self._end, self._seconds, self._proc, self._title):
+            arr.pop()
+        if not self:
+            self.clear()
+        return event
+
+    def popleft(self) -> Event:
+        if not self:
+            raise IndexError("pop from an empty EventHistory")
+        event = self._event(self._head)
+        self._release(self._head)
+        self._head += 1
+        if not self:
+            self.clear()
+        elif self._head >= self.COMPACT_MIN and self._head * 2 >= len(self._start):
+            self._compact()
+        return event
+
+    def _release(self, i: int):
+        self.strings.release(self._proc[i])
+        self.strings.release(self._title[i])
+
+    def _compact(self):
+        head = self._head
+        for arr in (self._start, self._end, self._seconds, self._proc, self._title):
+            del arr[:head]
+        self._head = 0
+
+    def clear(self):
+        self._start = array("d")
+        self._end = array("d")
+        self._seconds = array("d")
+        self._proc = array("I")
+        self._title = array("I")
+        self._head = 0
+        self.strings.clear()
+
+    def iter_columns(self, chunksize: int = 50000, start_ts: float = None, end_ts: float = None):
+        """
+        Recorre el historial en bloques columnares (dicts de arrays NumPy):
+        start_ts, end_ts, seconds, proc, title. Solo eventos que solapan
+        [start_ts, end_ts]. La memoria extra es la de un bloque.
+        """
+        import numpy as np  # solo al exportar
+        strings = np.array(self.strings._strings + [None], dtype=object)
+        for lo in range(self._head, len(self._start), chunksize):
+            hi = min(lo + chunksize, len(self._start))
+            starts = np.frombuffer(self._start, dtype=np.float64)[lo:hi].copy()
+            ends = np.frombuffer(self._end, dtype=np.float64)[lo:hi].copy()
+            mask = np.ones(hi - lo, dtype=bool)
+            if start_ts is not None:
+                mask &= ends >= start_ts
+            if end_ts is not None:
+                mask &= starts <= end_ts
+            if not mask.any():
+                continue
+            yield {
+                "start_ts": starts[mask],
+                "end_ts": ends[mask],
+                "proc": strings[np.frombuffer(self._proc, dtype=np.uint32)[lo:hi][mask]],
+                "title": strings[np.frombuffer(self._title, dtype=np.uint32)[lo:hi][mask]],
+                "seconds": np.frombuffer(self._seconds, dtype=np.float64)[lo:hi][mask],
+            }
+
+    def memory_stats(self) -> dict:
+        """Bytes usados: arrays de eventos (incluye huecos sin compactar) y tabla de cadenas."""
+        slots = len(self._start)
+        event_bytes = sum(arr.itemsize * slots for arr in
+                          (self._start, self._end, self._seconds, self._proc, self._title))
+        return {
+            "events": len(self),
+            "event_bytes": event_bytes,
+            "strings": len(self.strings),
+            "string_bytes": self.strings.nbytes(),
+        }
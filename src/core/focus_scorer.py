@@ -1,10 +1,75 @@
 # src/core/focus_scorer.py
 import time
 import re
-import csv
-from collections import deque
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
 from PySide6.QtCore import QObject, Signal
+from core.event_store import EventHistory
+from core.keyword_matcher import KeywordMatcher, PRODUCTIVE, DISTRACTOR, BROWSER, WEBSITE, GAME, MEDIA
+from core.rules import Rule, RuleMatcher
+from core.log import get_logger
+
+log = get_logger("scorer")
+
+# Heurísticas fijas (se compilan junto con productive/distractors)
+BROWSER_KEYWORDS = ["chrome", "firefox", "edge", "opera", "safari", "brave", "browser"]
+
+# Lista ampliada de sitios web distractores (solo cuenta si el proceso es un navegador).
+# Los títulos de YouTube suelen ser: "Nombre del video - YouTube"
+WEBSITE_DISTRACTORS = [
+    "youtube", "youtu.be", "netflix", "twitch", "tiktok", "instagram",
+    "facebook", "twitter", "x.com", "reddit", "9gag", "whatsapp",
+    "telegram", "discord", "spotify", "pinterest", "tumblr",
+    "prime video", "hulu", "disney+", "hbomax", "crunchyroll",
+    "facebook.com", "instagram.com", "twitter.com"
+]
+
+GAME_PROCESSES = [
+    "steam", "steamwebhelper", "epicgameslauncher", "minecraft",
+    "roblox", "lol", "league of legends", "valorant", "csgo",
+    "overwatch", "fortnite", "game", "launcher"
+]
+
+MEDIA_PLAYERS = ["vlc", "spotify", "windowsmediaplayer", "itunes", "quicktime"]
+
+
+def flags_are_distractor(flags: int) -> bool:
+    """Distractor por nombre: palabra distractora, juego, reproductor o web en navegador."""
+    if flags & (DISTRACTOR | GAME | MEDIA):
+        return True
+    return bool(flags & BROWSER) and bool(flags & WEBSITE)
+
+
+def build_matcher(productive: List[str], distractors: List[str], rules: Iterable[Rule] = ()):
+    """
+    Compila las listas del usuario junto con las heurísticas fijas. Con
+    reglas de la base de datos devuelve un RuleMatcher que las aplica
+    primero y usa las listas cuando no coincide ninguna.
+    """
+    matcher = KeywordMatcher(
+        {
+            PRODUCTIVE: productive,
+            DISTRACTOR: distractors,
+            BROWSER: BROWSER_KEYWORDS,
+            GAME: GAME_PROCESSES,
+            MEDIA: MEDIA_PLAYERS,
+        },
+        {
+            PRODUCTIVE: productive,
+            DISTRACTOR: distractors,
+            WEBSITE: WEBSITE_DISTRACTORS,
+        },
+    )
+    rules = [Rule._make(r) for r in rules]
+    if not rules:
+        return matcher
+    try:
+        return RuleMatcher(rules, matcher)
+    except (re.error, ValueError) as e:
+        # una regla rota no puede dejar sin clasificar: seguir solo con las listas
+        log.error("no se pudieron compilar las reglas del usuario, se ignoran: %s", e)
+        return matcher
+
 
 class FocusScorer(QObject):
     """
@@ -13,8 +78,15 @@ class FocusScorer(QObject):
     - get_current_score(window_seconds=1800): calcula el score en la ventana
     - configurable: productive list, distractors list, umbral de distracción por chunk
     - util: exportar historial, resetear, añadir/quitar palabras
+    - clasificación memoizada por (proc, title); classification_cache_stats()
+    - score incremental: acumuladores de segundos totales/distractores que se
+      actualizan en push_active y _prune_old (sin recorrer history)
+    - rules: reglas del usuario (tabla `rules`: keyword / process /
+      title_regex con peso) que mandan sobre las listas; set_rules() las
+      cambia en caliente
     """
     distraction_detected = Signal(str, str, int)
+    rules_changed = Signal()  # productive/distractors/rules modificados
 
     def __init__(
         self,
@@ -22,6 +94,7 @@ class FocusScorer(QObject):
         distracting_list: Optional[List[str]] = None,
         window_seconds: int = 1800,
         distractor_threshold_seconds: int = 60,
+        rules: Optional[Iterable[tuple]] = None,
     ):
         super().__init__()  
         
@@ -34,8 +107,31 @@ class FocusScorer(QObject):
             "youtube", "facebook", "instagram", "netflix", "tiktok", "discord", "reddit", "twitter", "steam"
         ])]
 
-        # historial como deque de items (start_ts, end_ts, proc, title, seconds)
-        self.history = deque()
+        # reglas del usuario (Rule) que se compilan junto con las listas
+        self.rules = [Rule._make(r) for r in (rules or [])]
+
+        # matcher compilado de todas las listas; se reconstruye al cambiar reglas
+        self._matcher = None
+        self._rules_version = 0
+
+        # caché LRU (proc, title) normalizados -> flags del matcher, sellada con
+        # la versión de reglas: si cambian las reglas se descarta entera
+        self.classification_cache_size = 4096
+        self._class_cache = OrderedDict()
+        self._class_cache_version = 0
+        self._class_cache_hits = 0
+        self._class_cache_misses = 0
+
+        # historial compacto (arrays + cadenas internadas) con API tipo deque;
+        # cada item es (start_ts, end_ts, proc, title, seconds)
+        self.history = EventHistory()
+
+        # acumuladores incrementales de todo history (segundos totales y
+        # distractores), calculados con (rules_version, umbral) = _acc_key
+        self._acc_total = 0.0
+        self._acc_distractor = 0.0
+        self._acc_key = None
+        self._history_ordered = True  # start_ts no decreciente en history
         self.window_seconds = window_seconds
         self.distractor_threshold_seconds = distractor_threshold_seconds
         
@@ -49,27 +145,29 @@ class FocusScorer(QObject):
 
     # En focus_scorer.py - AGREGAR este método:
 
-    def _check_score_notification(self, current_score: int):
+    def check_score_notification(self, current_score: int):
         """
         Notifica SOLO cuando el score llega exactamente a umbrales de 5%
+        (distraction_detected con "score_alert"). La llama el CoreWorker con
+        cada score nuevo.
         """
         try:
-            print(f"[SCORE CHECK] Score: {current_score}% | Último: {self.last_notified_score}%")
+            log.debug("Score check: %s%% | último notificado: %s%%", current_score, self.last_notified_score)
             
             # ⭐⭐ CONDICIÓN MÁS SIMPLE: Solo notificar en múltiplos exactos de 5 ⭐⭐
             if current_score % 5 == 0 and current_score < self.last_notified_score:
-                print(f"✅ NOTIFICANDO {current_score}%")
+                log.info("Notificando score %s%%", current_score)
                 message = self._get_notification_message(current_score)
                 self.distraction_detected.emit("score_alert", message, 0)
                 self.last_notified_score = current_score
             
             # Resetear cuando el score suba por encima del último notificado
             elif current_score > self.last_notified_score:
-                print(f"🔼 Score subió a {current_score}%, reseteando notificaciones")
+                log.debug("Score subió a %s%%, reseteando notificaciones", current_score)
                 self.last_notified_score = current_score
                 
         except Exception as e:
-            print("[FocusScorer] Error en notificación de score:", e)
+            log.error("Error en notificación de score: %s", e)
 
 
     # En _get_notification_message - mensajes más cortos para ventanas:
@@ -100,26 +198,33 @@ class FocusScorer(QObject):
         return messages.get(threshold, f"Focus: {threshold}%")
 
     # ------------------ registro ------------------
-    def push_active(self, proc: Optional[str], title: Optional[str], seconds: int = 0):
+    def push_active(self, proc: Optional[str], title: Optional[str], seconds: float = 0):
         """
-        Registra que la ventana/proceso estuvo activo `seconds` segundos.
+        Registra que la ventana/proceso estuvo activo `seconds` segundos
+        (admite fracciones: los intervalos del tracker son timestamps exactos).
         """
         try:
+            seconds = max(0.0, float(seconds))
             end_ts = time.time()
-            start_ts = end_ts - max(0, int(seconds))
+            start_ts = end_ts - seconds
             proc = (proc or "").strip()
             title = (title or "").strip()
+            self._sync_accumulators()
             
             # Acumular tiempo para la misma ventana
             if self.history:
                 last_start, last_end, last_proc, last_title, last_seconds = self.history[-1]
                 if last_proc == proc and last_title == title:
                     # Fusionar con el último evento
-                    self.history.pop()
+                    self._account(self.history.pop(), -1)
                     start_ts = last_start
-                    seconds = int(last_seconds + seconds)
-            
-            self.history.append((start_ts, end_ts, proc, title, int(seconds)))
+                    seconds = last_seconds + seconds
+
+            if self.history and start_ts < self.history[-1][0]:
+                self._history_ordered = False
+            event = (start_ts, end_ts, proc, title, seconds)
+            self.history.append(event)
+            self._account(event, 1)
             self._prune_old()
             
             # DETECTAR DISTRACCIONES (código existente)
@@ -131,82 +236,112 @@ class FocusScorer(QObject):
                 (current_time - self.last_notification_time) >= self.notification_cooldown):
                 
                 self.last_notification_time = current_time
-                self.distraction_detected.emit(proc, title, seconds)
+                self.distraction_detected.emit(proc, title, int(seconds))
                 
         except Exception as e:
-            print("[FocusScorer] push_active error:", e)
+            log.error("push_active error: %s", e)
 
     def _prune_old(self):
         """Eliminar eventos completamente fuera de la ventana actual (usar window_seconds)."""
         cutoff = time.time() - self.window_seconds
+        self._sync_accumulators()
         while self.history and self.history[0][1] < cutoff:
-            self.history.popleft()
+            self._account(self.history.popleft(), -1)
+        if not self.history:
+            self._reset_accumulators()
+
+    # ------------------ acumuladores del score ------------------
+    def _reset_accumulators(self):
+        self._acc_total = 0.0
+        self._acc_distractor = 0.0
+        self._history_ordered = True
+
+    def _account(self, event, sign: int):
+        """Suma (sign=1) o resta (sign=-1) un evento de los acumuladores."""
+        start_ts, end_ts, proc, title, seconds = event
+        duration = end_ts - start_ts
+        self._acc_total += sign * duration
+        if self._classify_event(start_ts, end_ts, proc, title, int(seconds)) == "distractor":
+            self._acc_distractor += sign * duration
+
+    def _sync_accumulators(self):
+        """Recalcula los acumuladores (O(n)) solo si cambiaron las reglas o el umbral."""
+        key = (self._rules_version, self.distractor_threshold_seconds)
+        if self._acc_key == key:
+            return
+        self._acc_key = key
+        self._reset_accumulators()
+        prev_start = None
+        for event in self.history:
+            if prev_start is not None and event[0] < prev_start:
+                self._history_ordered = False
+            prev_start = event[0]
+            self._account(event, 1)
 
     # ------------------ clasificación ------------------
+    def _get_matcher(self):
+        """Compila (una vez) las reglas y todas las listas de palabras en un solo matcher."""
+        if self._matcher is None:
+            self._matcher = build_matcher(self.productive, self.distractors, self.rules)
+        return self._matcher
+
+    def _invalidate_rules(self):
+        """Llamar tras cualquier cambio en productive/distractors/rules."""
+        self._matcher = None
+        self._rules_version += 1
+        self.rules_changed.emit()
+
+    @property
+    def rules_version(self) -> int:
+        """Se incrementa con cada cambio de reglas (para cachés externas)."""
+        return self._rules_version
+
+    def match_flags(self, proc: str, title: str) -> int:
+        """Flags de categoría de (proc, title), memoizados por par normalizado."""
+        key = ((proc or "").lower(), (title or "").strip().lower())
+        cache = self._class_cache
+        if self._class_cache_version != self._rules_version:
+            cache.clear()
+            self._class_cache_version = self._rules_version
+        flags = cache.get(key)
+        if flags is not None:
+            cache.move_to_end(key)
+            self._class_cache_hits += 1
+            return flags
+        self._class_cache_misses += 1
+        flags = self._get_matcher().match(*key)
+        cache[key] = flags
+        if len(cache) > self.classification_cache_size:
+            cache.popitem(last=False)
+        return flags
+
+    def classification_cache_stats(self) -> dict:
+        """Contadores de la caché de clasificación: hits, misses, tamaño y hit_rate."""
+        total = self._class_cache_hits + self._class_cache_misses
+        return {
+            "hits": self._class_cache_hits,
+            "misses": self._class_cache_misses,
+            "size": len(self._class_cache),
+            "hit_rate": (self._class_cache_hits / total) if total else 0.0,
+            "rules_version": self._rules_version,
+        }
+
     def _is_productive(self, proc: str, title: str) -> bool:
-        lowp = (proc or "").lower()
-        lowt = (title or "").lower()
-        return any(k in lowp or k in lowt for k in self.productive)
+        return bool(self.match_flags(proc, title) & PRODUCTIVE)
 
     def _is_distractor_by_name(self, proc: str, title: str) -> bool:
-        lowp = (proc or "").lower()
-        lowt = (title or "").strip().lower()
-        
-        # Detectar por nombre de aplicación
-        app_distractors = any(k in lowp or k in lowt for k in self.distractors)
-        if app_distractors:
-            return True
-        
-        # MEJORAR detección de navegadores
-        browser_keywords = ["chrome", "firefox", "edge", "opera", "safari", "brave", "browser"]
-        is_browser = any(k in lowp for k in browser_keywords)
-        
-        if is_browser:
-            # Lista ampliada de sitios web distractores
-            website_distractors = [
-                "youtube", "youtu.be", "netflix", "twitch", "tiktok", "instagram",
-                "facebook", "twitter", "x.com", "reddit", "9gag", "whatsapp",
-                "telegram", "discord", "spotify", "pinterest", "tumblr",
-                "prime video", "hulu", "disney+", "hbomax", "crunchyroll",
-                "facebook.com", "instagram.com", "twitter.com", "x.com"
-            ]
-            
-            # DETECTAR YOUTUBE EN TÍTULOS DE PESTAÑAS
-            # Los títulos de YouTube suelen ser: "Nombre del video - YouTube"
-            if "youtube" in lowt or " - youtube" in lowt:
-                return True
-                
-            # Detectar otros sitios en el título
-            title_has_distractor = any(site in lowt for site in website_distractors)
-            if title_has_distractor:
-                return True
-        
-        # DETECTAR VIDEOJUEGOS
-        game_processes = [
-            "steam", "steamwebhelper", "epicgameslauncher", "minecraft", 
-            "roblox", "lol", "league of legends", "valorant", "csgo", 
-            "overwatch", "fortnite", "game", "launcher"
-        ]
-        
-        if any(game in lowp for game in game_processes):
-            return True
-            
-        # DETECTAR REPRODUCTORES DE VIDEO/MÚSICA 
-        media_players = ["vlc", "spotify", "windowsmediaplayer", "itunes", "quicktime"]
-        if any(player in lowp for player in media_players):
-            return True
-            
-        return False
+        return flags_are_distractor(self.match_flags(proc, title))
 
     def _classify_event(self, start_ts: float, end_ts: float, proc: str, title: str, seconds: int) -> str:
         """
         Devuelve: 'productive', 'distractor' o 'neutral'
         """
         classification = "neutral"
+        flags = self.match_flags(proc, title)  # una sola pasada
         
-        if self._is_productive(proc, title):
+        if flags & PRODUCTIVE:
             classification = "productive"
-        elif self._is_distractor_by_name(proc, title):
+        elif flags_are_distractor(flags):
             classification = "distractor"
         elif seconds >= self.distractor_threshold_seconds:
             classification = "distractor"
@@ -232,14 +367,55 @@ class FocusScorer(QObject):
             now = time.time()
             cutoff = now - w
 
-        print(f"[SCORE CALC] Ventana: {w}s, Cutoff: {cutoff}")
+        log.debug("Score calc: ventana %ss, cutoff %s", w, cutoff)
+
+        self._sync_accumulators()
+        if self._history_ordered and not (self.history and self.history[-1][1] > now):
+            total, distractor = self._window_totals(cutoff)
+        else:
+            # history desordenado o reloj hacia atrás: recorrido completo
+            total, distractor = self._scan_window(cutoff, now)
+
+        # ⭐⭐ PRIMERO CALCULAR RATIO Y SCORE, LUEGO HACER DEBUG ⭐⭐
+        if total <= 0:
+            return 100
+        
+        ratio = distractor / total
+        score = max(0, int((1.0 - ratio) * 100))
+        
+        # ⭐⭐ AHORA SÍ HACER EL DEBUG CON LOS VALORES CALCULADOS ⭐⭐
+        log.debug("Score: total %.1fs, distracciones %.1fs, ratio %.3f -> %s%%", total, distractor, ratio, score)
+        
+        return score
 
+    def _window_totals(self, cutoff: float) -> Tuple[float, float]:
+        """
+        (total, distractor) en [cutoff, ahora] a partir de los acumuladores:
+        solo se descuenta la parte anterior a cutoff de los eventos de cabeza.
+        Con la ventana por defecto (cutoff = ahora - window_seconds) _prune_old
+        deja uno como mucho, el que cruza la frontera, y es O(1). Con un cutoff
+        posterior (inicio de sesión en RatioStrategy, ventana más corta) se
+        recorren los eventos anteriores a cutoff que siguen en history: como
+        mucho los de una window_seconds, porque los más viejos se podan.
+        Requiere history ordenado por start_ts.
+        """
+        total = self._acc_total
+        distractor = self._acc_distractor
+        for start_ts, end_ts, proc, title, seconds in self.history:
+            if start_ts >= cutoff:
+                break
+            outside = min(end_ts, cutoff) - start_ts
+            total -= outside
+            if self._classify_event(start_ts, end_ts, proc, title, int(seconds)) == "distractor":
+                distractor -= outside
+        return max(0.0, total), max(0.0, distractor)
+
+    def _scan_window(self, cutoff: float, now: float) -> Tuple[float, float]:
+        """Recorrido completo de history (referencia exacta de _window_totals)."""
         # sumar segundos totales y distractores con recuento parcial si el evento cruza frontera
         total = 0.0
         distractor = 0.0
-
-        # recorrer history (ya pruned normalmente pero aquí aseguramos recálculo correcto)
-        for start_ts, end_ts, proc, title, seconds in list(self.history):
+        for start_ts, end_ts, proc, title, seconds in self.history:
             # calcular overlap con la ventana [cutoff, now]
             ov_start = max(start_ts, cutoff)
             ov_end = min(end_ts, now)
@@ -250,51 +426,49 @@ class FocusScorer(QObject):
             cls = self._classify_event(start_ts, end_ts, proc, title, int(seconds))
             if cls == "distractor":
                 distractor += ov_seconds
-
-        # ⭐⭐ PRIMERO CALCULAR RATIO Y SCORE, LUEGO HACER DEBUG ⭐⭐
-        if total <= 0:
-            return 100
-        
-        ratio = distractor / total
-        score = max(0, int((1.0 - ratio) * 100))
-        
-        # ⭐⭐ AHORA SÍ HACER EL DEBUG CON LOS VALORES CALCULADOS ⭐⭐
-        # print(f"[SCORE DEBUG] Ventana: {w:.1f}s | Total tiempo: {total:.1f}s | Distracciones: {distractor:.1f}s | Ratio: {ratio:.3f} | Score: {score}%")
-        
-        return score
-    
+        return total, distractor
 
     # ------------------ utilitarios ------------------
     def clear_history(self):
         """Borra todo el historial."""
         self.history.clear()
+        self._reset_accumulators()
 
-    def export_history_csv(self, path: str):
-        """Exporta history a CSV (start, end, proc, title, seconds, class)"""
+    def export_history_csv(self, path: str, start=None, end=None):
+        """
+        Exporta history a CSV (start, end, proc, title, seconds, class).
+        Por bloques con clasificación vectorizada; ver reports.export_history
+        para JSON Lines / Parquet.
+        """
         try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["start_ts", "end_ts", "proc", "title", "seconds", "class"])
-                for start_ts, end_ts, proc, title, seconds in list(self.history):
-                    cls = self._classify_event(start_ts, end_ts, proc, title, seconds)
-                    writer.writerow([start_ts, end_ts, proc, title, seconds, cls])
+            from reports.reports import export_history  # pandas solo al exportar
+            export_history(self, path, start, end, fmt="csv")
             return True
         except Exception as e:
-            print("[FocusScorer] export error:", e)
+            log.error("export error: %s", e)
             return False
 
     # ajustes en runtime
     def add_productive(self, keyword: str):
         self.productive.append(keyword.lower())
+        self._invalidate_rules()
 
     def remove_productive(self, keyword: str):
         self.productive = [k for k in self.productive if k != keyword.lower()]
+        self._invalidate_rules()
 
     def add_distractor(self, keyword: str):
         self.distractors.append(keyword.lower())
+        self._invalidate_rules()
 
     def remove_distractor(self, keyword: str):
         self.distractors = [k for k in self.distractors if k != keyword.lower()]
+        self._invalidate_rules()
+
+    def set_rules(self, rules: Iterable[tuple]):
+        """Reemplaza las reglas del usuario: (id, kind, pattern, category, weight)."""
+        self.rules = [Rule._make(r) for r in rules]
+        self._invalidate_rules()
 
     def set_window_seconds(self, seconds: int):
         self.window_seconds = int(seconds)
@@ -0,0 +1,125 @@
+# src/core/log.py
+import collections
+import logging
+import os
+import sys
+import threading
+from typing import Dict, List, Optional
+
+ROOT = "focusly"
+# subsistemas con logger propio (focusly.<nombre>); el nivel se ajusta por separado
+SUBSYSTEMS = ("core", "scorer", "tracker", "db", "audio", "notifier", "rescore", "ui")
+DEFAULT_LEVEL = logging.INFO
+RING_SIZE = 2000
+FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+_configured = False
+_ring = None
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """Logger de un subsistema. Usar formato perezoso: log.debug("score %s", x)."""
+    return logging.getLogger(f"{ROOT}.{subsystem}")
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Últimos `capacity` registros en memoria (para verlos desde la app).
+    Guarda el LogRecord tal cual: el mensaje solo se formatea al leerlo.
+    """
+
+    def __init__(self, capacity: int = RING_SIZE):
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+        self._lock_ring = threading.Lock()
+        self.setFormatter(logging.Formatter(FORMAT))
+
+    def emit(self, record: logging.LogRecord):
+        if record.exc_info:
+            # el traceback se formatea ya para no retener los frames en el buffer
+            self.format(record)
+            record.exc_info = None
+        with self._lock_ring:
+            self.records.append(record)
+
+    def lines(self, limit: Optional[int] = None) -> List[str]:
+        with self._lock_ring:
+            records = list(self.records)
+        if limit is not None:
+            records = records[-limit:]
+        out = []
+        for record in records:
+            try:
+                out.append(self.format(record))
+            except Exception as e:
+                out.append(f"<registro ilegible: {e}>")
+        return out
+
+    def clear(self):
+        with self._lock_ring:
+            self.records.clear()
+
+
+def _parse_levels(spec: str) -> Dict[str, int]:
+    """'debug' o 'scorer=debug,db=warning' -> {subsistema|'': nivel}."""
+    levels = {}
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, level = part.rpartition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+    return levels
+
+
+def configure(level: int = DEFAULT_LEVEL, levels: Optional[Dict[str, int]] = None,
+              console: bool = True, ring_size: int = RING_SIZE):
+    """
+    Configura el logging de Focusly (una vez; llamadas posteriores solo
+    cambian niveles). FOCUSLY_LOG=debug o FOCUSLY_LOG=scorer=debug,db=warning
+    tiene prioridad sobre los argumentos.
+    """
+    global _configured, _ring
+    root = logging.getLogger(ROOT)
+    env = _parse_levels(os.environ.get("FOCUSLY_LOG", ""))
+    levels = dict(levels or {})
+    levels.update({k: v for k, v in env.items() if k})
+    root.setLevel(env.get("", level))
+    for subsystem, value in levels.items():
+        set_level(subsystem, value)
+    if _configured:
+        return
+    _configured = True
+    root.propagate = False
+    _ring = RingBufferHandler(ring_size)
+    root.addHandler(_ring)
+    if console:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter(FORMAT, "%H:%M:%S"))
+        root.addHandler(handler)
+
+
+def set_level(subsystem: str, level):
+    """Nivel de un subsistema ('scorer', 'db'...) o de todo Focusly con subsystem=''."""
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    logger = logging.getLogger(ROOT) if not subsystem else get_logger(subsystem)
+    logger.setLevel(level)
+
+
+def get_level(subsystem: str = "") -> str:
+    """Nombre del nivel efectivo de un subsistema (o de todo Focusly)."""
+    logger = logging.getLogger(ROOT) if not subsystem else get_logger(subsystem)
+    return logging.getLevelName(logger.getEffectiveLevel())
+
+
+def recent(limit: Optional[int] = None) -> List[str]:
+    """Líneas del buffer en memoria (más antigua primero)."""
+    return _ring.lines(limit) if _ring is not None else []
+
+
+def clear_recent():
+    if _ring is not None:
+        _ring.clear()
@@ -3,26 +3,37 @@ from PySide6.QtCore import QObject, Signal, QUrl
 from ui.notification_window import NotificationWindow 
 from PySide6.QtMultimedia import QSoundEffect
 import os
+from core.log import get_logger
+
+log = get_logger("notifier")
+
+
+def notification_sound_path():
+    """Ruta de assets/notification.wav o None si no existe."""
+    sound_path = os.path.abspath(os.path.join(
+        os.path.dirname(__file__), "..", "..", "assets", "notification.wav"
+    ))
+    return sound_path if os.path.exists(sound_path) else None
+
 
 class Notifier(QObject):
     notify_signal = Signal(str, str)
 
-    def __init__(self):
+    def __init__(self, sound_path=None):
         super().__init__()
         self.notification_windows = []  # Para mantener referencia
         self.sound_effect = QSoundEffect()
-        sound_path = os.path.abspath(os.path.join(
-            os.path.dirname(__file__), "..", "..", "assets", "notification.wav"
-        ))
+        if sound_path is None:  # sin warm-up: buscarlo aquí
+            sound_path = notification_sound_path()
         
-        if os.path.exists(sound_path):
+        if sound_path:
             self.sound_effect.setSource(QUrl.fromLocalFile(sound_path))
             self.sound_effect.setVolume(0.7)  # Volumen al 70%
         else:
-            print("[Notifier] Sonido de notificación no encontrado")
+            log.warning("Sonido de notificación no encontrado")
 
     def notify(self, message, kind="info"):
-        print(f"[Notifier] {kind}: {message}")
+        log.info("%s: %s", kind, message)
         self.notify_signal.emit(kind, message)
         
         #
@@ -38,7 +49,7 @@ class Notifier(QObject):
             if self.sound_effect.source().isValid():
                 self.sound_effect.play()
         except Exception as e:
-            print(f"[Notifier] Error reproduciendo sonido: {e}")
+            log.error("Error reproduciendo sonido: %s", e)
 
     def _show_visual_notification(self, message, kind):
         """Muestra notificación visual"""
@@ -61,4 +72,4 @@ class Notifier(QObject):
             notification.show_notification(duration)
             
         except Exception as e:
-            print(f"[Notifier] Error mostrando notificación visual: {e}")
\ No newline at end of file
+            log.error("Error mostrando notificación visual: %s", e)
\ No newline at end of file
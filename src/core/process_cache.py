@@ -0,0 +1,110 @@
+# src/core/process_cache.py
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Union
+import psutil
+
+
+class ProcessInfo(NamedTuple):
+    pid: int
+    create_time: float
+    name: str
+    exe: str
+    window_class: str
+
+
+class ProcessInfoCache:
+    """
+    Caché LRU acotada de metadatos de proceso, keyed por (pid, create_time).
+    - lookup(pid, window_id, window_class): devuelve ProcessInfo o None
+    - Si un PID se reutiliza, create_time cambia y la entrada vieja no se usa
+      (queda huérfana y sale por LRU)
+    - Camino rápido: si se repite la misma ventana (window_id) con el mismo pid,
+      el proceso sigue vivo (es dueño de la ventana) y basta un lookup en dict,
+      sin ninguna syscall
+    - hits / misses: contadores para instrumentación (ver stats())
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (pid, create_time) -> ProcessInfo
+        self._windows = OrderedDict()  # (window_id, pid) -> ProcessInfo
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(
+        self,
+        pid: Optional[int],
+        window_id=None,
+        window_class: Union[str, Callable[[], str], None] = None,
+    ) -> Optional[ProcessInfo]:
+        """
+        Devuelve los metadatos del proceso `pid`.
+        `window_class` puede ser un callable: solo se evalúa en un fallo de caché.
+        """
+        if not pid:
+            return None
+
+        # 1) camino rápido: misma ventana, mismo pid -> mismo proceso
+        if window_id is not None:
+            info = self._windows.get((window_id, pid))
+            if info is not None:
+                self._windows.move_to_end((window_id, pid))
+                self.hits += 1
+                return info
+
+        # 2) validar identidad del proceso con create_time (detecta PIDs reutilizados)
+        try:
+            proc = psutil.Process(pid)
+            key = (pid, proc.create_time())
+        except Exception:
+            return None
+
+        info = self._entries.get(key)
+        if info is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            try:
+                name = proc.name()
+            except Exception:
+                return None
+            try:
+                exe = proc.exe() or ""
+            except Exception:
+                exe = ""  # AccessDenied en procesos de sistema
+            info = ProcessInfo(pid, key[1], name, exe, self._resolve_class(window_class))
+            self._entries[key] = info
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if window_id is not None:
+            if window_class is not None:
+                info = info._replace(window_class=self._resolve_class(window_class))
+            self._windows[(window_id, pid)] = info
+            if len(self._windows) > self.max_entries:
+                self._windows.popitem(last=False)
+        return info
+
+    @staticmethod
+    def _resolve_class(window_class) -> str:
+        if callable(window_class):
+            try:
+                window_class = window_class()
+            except Exception:
+                window_class = ""
+        return window_class or ""
+
+    def clear(self):
+        self._entries.clear()
+        self._windows.clear()
+
+    def stats(self) -> dict:
+        """Contadores de la caché: hits, misses, tamaño y hit_rate."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_rate": (self.hits / total) if total else 0.0,
+        }
@@ -0,0 +1,103 @@
+# src/core/rescore_job.py
+from typing import Callable, List, Optional, Tuple
+from PySide6.QtCore import QThread, Signal
+from core.focus_scorer import build_matcher, flags_are_distractor
+from data import database
+from core.log import get_logger
+
+log = get_logger("rescore")
+
+
+def rescore_sessions(
+    sessions: List[tuple],
+    apps: List[tuple],
+    is_distractor: Callable[[str, str], bool],
+    progress: Optional[Callable[[int, str], None]] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Recalcula el score por puntos de todas las sesiones con las reglas actuales.
+    - sessions: [(id, duration_seconds, target_seconds)]
+    - apps: [(session_id, app_name, app_title, total_seconds)]
+    - is_distractor(proc, title): se llama una vez por par distinto
+    Devuelve [(session_id, score)]. Misma fórmula que PointsStrategy:
+    100 - int(minutos_distracción * 100 / minutos_objetivo), con la duración
+    de la sesión como objetivo si no se guardó target_seconds.
+    """
+    import numpy as np  # solo al recalcular (no en el arranque)
+    report = progress or (lambda pct, msg: None)
+    if not sessions:
+        return []
+
+    ids = np.fromiter((s[0] for s in sessions), dtype=np.int64, count=len(sessions))
+    duration = np.fromiter((s[1] or 0 for s in sessions), dtype=np.float64, count=len(sessions))
+    target = np.fromiter((s[2] or 0 for s in sessions), dtype=np.float64, count=len(sessions))
+    target = np.where(target > 0, target, duration)
+
+    # factorizar (app_name, app_title): cada par distinto se clasifica una vez
+    pair_index = {}
+    codes = np.fromiter(
+        (pair_index.setdefault((a[1], a[2]), len(pair_index)) for a in apps),
+        dtype=np.int64, count=len(apps),
+    )
+    report(10, f"Clasificando {len(pair_index)} apps distintas")
+    pair_distractor = np.zeros(len(pair_index), dtype=bool)
+    chunk = max(1, len(pair_index) // 10)
+    for i, (proc, title) in enumerate(pair_index):
+        pair_distractor[i] = is_distractor(proc or "", title or "")
+        if i % chunk == chunk - 1:
+            report(10 + 60 * (i + 1) // len(pair_index), "Clasificando apps")
+
+    # segundos de distracción por sesión (bincount sobre la posición de la sesión)
+    report(70, f"Recalculando {len(ids)} sesiones")
+    app_session = np.fromiter((a[0] for a in apps), dtype=np.int64, count=len(apps))
+    app_seconds = np.fromiter((a[3] or 0 for a in apps), dtype=np.float64, count=len(apps))
+    order = np.argsort(ids)
+    pos = np.searchsorted(ids, app_session, sorter=order)
+    pos = np.minimum(pos, len(ids) - 1)
+    known = ids[order[pos]] == app_session  # apps de sesiones borradas se ignoran
+    weights = np.where(known & pair_distractor[codes], app_seconds, 0.0)
+    distracting = np.bincount(order[pos[known]], weights=weights[known], minlength=len(ids))
+
+    # mismo orden de operaciones que PointsStrategy.score
+    target_minutes = target / 60
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lost = np.floor((distracting / 60) * (100 / target_minutes))
+    scores = np.where(target_minutes > 0, np.maximum(0, 100 - lost), 100).astype(np.int64)
+    report(90, "Guardando scores")
+    return list(zip(ids.tolist(), scores.tolist()))
+
+
+class RescoreJob(QThread):
+    """
+    Recalcula en segundo plano el final_score de todas las sesiones guardadas
+    cuando cambian las reglas productive/distractors.
+    - Las listas se copian al crear el job y las reglas se leen de la base de
+      datos: el hilo compila su propio matcher y no toca el FocusScorer
+    - progress(porcentaje, mensaje), done(sesiones actualizadas), failed(error)
+    - Escribe todos los scores en una sola transacción
+    """
+    progress = Signal(int, str)
+    done = Signal(int)
+    failed = Signal(str)
+
+    def __init__(self, productive: List[str], distractors: List[str], parent=None):
+        super().__init__(parent)
+        self.productive = list(productive)
+        self.distractors = list(distractors)
+
+    def run(self):
+        try:
+            self.progress.emit(0, "Cargando sesiones")
+            sessions, apps = database.get_rescore_inputs()
+            matcher = build_matcher(self.productive, self.distractors, database.get_rules())
+            scores = rescore_sessions(
+                sessions, apps,
+                lambda proc, title: flags_are_distractor(matcher.match(proc, title)),
+                self.progress.emit,
+            )
+            database.update_session_scores(scores)
+            self.progress.emit(100, "Scores actualizados")
+            self.done.emit(len(scores))
+        except Exception as e:
+            log.exception("error recalculando scores: %s", e)
+            self.failed.emit(str(e))
@@ -0,0 +1,168 @@
+# src/core/rules.py
+import re
+from typing import Iterable, List, NamedTuple, Optional
+from core.keyword_matcher import KeywordMatcher, PRODUCTIVE, DISTRACTOR
+from core.log import get_logger
+
+log = get_logger("scorer")
+
+# Tipos y categorías que admite la tabla `rules`
+RULE_KINDS = ("keyword", "process", "title_regex")
+RULE_CATEGORIES = ("productive", "distractor")
+
+
+class Rule(NamedTuple):
+    """Regla de clasificación del usuario (una fila de la tabla `rules`)."""
+    id: Optional[int]
+    kind: str  # keyword: subcadena en proceso o título; process: nombre exacto; title_regex
+    pattern: str
+    category: str  # productive / distractor
+    weight: float = 1.0
+
+
+def validate_rule(kind: str, pattern: str, category: str, weight: float):
+    """Lanza ValueError si la regla no es válida (para la página de configuración)."""
+    if kind not in RULE_KINDS:
+        raise ValueError(f"Tipo de regla desconocido: {kind!r}")
+    if category not in RULE_CATEGORIES:
+        raise ValueError(f"Categoría desconocida: {category!r}")
+    if not (pattern or "").strip():
+        raise ValueError("El patrón está vacío")
+    if weight <= 0:
+        raise ValueError("El peso tiene que ser mayor que 0")
+    if kind == "title_regex":
+        # todas las regex se combinan en una (RuleMatcher): lo que solo vale
+        # al principio de un patrón o una vez por patrón no se puede usar
+        if re.search(r"\(\?[aiLmsux]+\)", pattern):
+            raise ValueError("Los flags globales ((?i), (?s)...) no están soportados: "
+                             "usa (?i:...) o nada (ya se ignoran mayúsculas)")
+        if "(?P<" in pattern:
+            raise ValueError("Los grupos con nombre ((?P<nombre>...)) no están soportados: usa (?:...)")
+        try:
+            _compile_title_regex(pattern)
+        except re.error as e:
+            raise ValueError(f"Regex inválida: {e}") from None
+        if re.search(r"\\\d|\(\?P=", pattern):
+            # los números de grupo cambian al combinar todas las regex en una
+            raise ValueError("Las referencias a grupos (\\1, (?P=...)) no están soportadas")
+
+
+def validate_rules(rules: Iterable[tuple]):
+    """
+    Lanza ValueError si alguna regla no es válida o si el conjunto completo
+    no compila junto. Llamar con todas las reglas antes de guardar una.
+    """
+    rules = [Rule._make(r) for r in rules]
+    for rule in rules:
+        validate_rule(rule.kind, rule.pattern, rule.category, rule.weight)
+    matcher = RuleMatcher(rules)
+    if matcher.invalid:
+        raise ValueError(f"Regex inválida: {matcher.invalid[0].pattern!r}")
+    if not matcher.combined:
+        raise ValueError("Las regex de título no compilan juntas con las demás reglas")
+
+
+def _compile_title_regex(pattern: str):
+    """Una regex de título sola, igual que dentro de la combinada."""
+    return re.compile(f"(?:{pattern})", re.IGNORECASE | re.DOTALL)
+
+
+class RuleMatcher:
+    """
+    Reglas del usuario compiladas en un solo matcher.
+    - keyword: todas en un KeywordMatcher (un findall por campo)
+    - process: dict nombre exacto -> reglas (un lookup)
+    - title_regex: una alternancia de todas las regex como filtro previo (la
+      mayoría de títulos no coincide con ninguna y se descartan en una
+      búsqueda) y, si pasa, una regex con un lookahead opcional por regla
+      que en un solo re.match dice cuáles coinciden
+    Cada regla es un bit de una máscara, así la evaluación es una pasada por
+    evento tenga 5 o 500 reglas.
+
+    Una regex que no compila (reglas guardadas antes de validar el conjunto)
+    se descarta con un aviso en el registro y queda en `invalid`; si las
+    válidas no compilan juntas se evalúan una a una con su propio search.
+
+    match(proc, title) devuelve PRODUCTIVE o DISTRACTOR según la categoría
+    con más peso entre las reglas que coinciden (empate: productive, como
+    con las listas). Si no coincide ninguna, los flags de `fallback` (el
+    KeywordMatcher de las listas y heurísticas fijas).
+    """
+
+    def __init__(self, rules: Iterable[Rule], fallback: Optional[KeywordMatcher] = None):
+        self.rules: List[Rule] = list(rules)
+        self.fallback = fallback
+        self.invalid: List[Rule] = []
+        keyword, regex = {}, []
+        self._process = {}
+        for i, rule in enumerate(self.rules):
+            bit = 1 << i
+            if rule.kind == "keyword":
+                keyword[bit] = [rule.pattern.lower()]
+            elif rule.kind == "process":
+                name = rule.pattern.strip().lower()
+                self._process[name] = self._process.get(name, 0) | bit
+            elif rule.kind == "title_regex":
+                try:
+                    regex.append((bit, rule.pattern, _compile_title_regex(rule.pattern).search))
+                except re.error as e:
+                    log.warning("regla %s ignorada, regex inválida %r: %s", rule.id, rule.pattern, e)
+                    self.invalid.append(rule)
+        self._keywords = KeywordMatcher(keyword, keyword) if keyword else None
+        self._regex_bits = [bit for bit, _, _ in regex]
+        self._regex = None
+        self._regex_any = None
+        self._regex_each = None
+        if regex:
+            try:
+                # (?:(?=.*?(?:patrón))(?P<_ruleN>))? por regla: el grupo vacío queda
+                # definido solo si esa regla coincide en algún punto del título
+                body = "".join(f"(?:(?=.*?(?:{pattern}))(?P<_rule{n}>))?"
+                               for n, (_, pattern, _) in enumerate(regex))
+                self._regex = re.compile(body, re.IGNORECASE | re.DOTALL).match
+                self._regex_any = re.compile("|".join(f"(?:{pattern})" for _, pattern, _ in regex),
+                                             re.IGNORECASE | re.DOTALL).search
+            except re.error as e:
+                log.warning("las regex de título no compilan juntas (%s): se evalúan una a una", e)
+                self._regex = None
+                self._regex_each = [(bit, search) for bit, _, search in regex]
+
+    @property
+    def combined(self) -> bool:
+        """False si las regex de título válidas no compilaron juntas (se evalúan una a una)."""
+        return self._regex_each is None
+
+    def matched(self, proc: str, title: str) -> int:
+        """Máscara de las reglas que coinciden (bit i = self.rules[i])."""
+        proc = (proc or "").strip().lower()
+        title = (title or "").strip()
+        mask = self._process.get(proc, 0)
+        if self._keywords is not None:
+            mask |= self._keywords.match(proc, title)
+        if self._regex is not None and self._regex_any(title):
+            groups = self._regex(title).groupdict()
+            for n, bit in enumerate(self._regex_bits):
+                if groups[f"_rule{n}"] is not None:
+                    mask |= bit
+        elif self._regex_each is not None:
+            for bit, search in self._regex_each:
+                if search(title):
+                    mask |= bit
+        return mask
+
+    def match(self, proc: str, title: str) -> int:
+        mask = self.matched(proc, title)
+        if not mask:
+            return self.fallback.match(proc, title) if self.fallback is not None else 0
+        productive = distractor = 0.0
+        i = 0
+        while mask:
+            if mask & 1:
+                rule = self.rules[i]
+                if rule.category == "productive":
+                    productive += rule.weight
+                else:
+                    distractor += rule.weight
+            mask >>= 1
+            i += 1
+        return PRODUCTIVE if productive >= distractor else DISTRACTOR
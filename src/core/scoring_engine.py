@@ -0,0 +1,196 @@
+# src/core/scoring_engine.py
+import time
+from array import array
+from typing import Dict, Optional, Tuple
+from PySide6.QtCore import QObject, Signal
+from core.focus_scorer import FocusScorer, flags_are_distractor
+from core.keyword_matcher import PRODUCTIVE
+from core.log import get_logger
+
+log = get_logger("scorer")
+
+
+class ScoreStrategy:
+    """
+    Estrategia de score incremental.
+    - add(flags, seconds): acumula un intervalo ya clasificado (flags del matcher)
+    - score(elapsed): valor actual en O(1)
+    - reset(): vuelve a cero (inicio de sesión o cambio de reglas)
+    """
+    name = ""
+
+    def __init__(self, engine: "ScoringEngine"):
+        self.engine = engine
+        self.reset()
+
+    def reset(self):
+        pass
+
+    def add(self, flags: int, seconds: float):
+        pass
+
+    def score(self, elapsed: float) -> int:
+        return 100
+
+
+class PointsStrategy(ScoreStrategy):
+    """Cada minuto de distracción quita 100 / minutos_objetivo puntos."""
+    name = "points"
+
+    def reset(self):
+        self.distracting_seconds = 0.0
+
+    def add(self, flags, seconds):
+        if flags_are_distractor(flags):
+            self.distracting_seconds += seconds
+
+    def score(self, elapsed):
+        distracting_minutes = self.distracting_seconds / 60
+        points_per_distraction_minute = 100 / self.engine.target_minutes
+        return max(0, 100 - int(distracting_minutes * points_per_distraction_minute))
+
+
+class RatioStrategy(ScoreStrategy):
+    """Proporción de tiempo no distractor en la ventana deslizante del FocusScorer."""
+    name = "ratio"
+
+    def score(self, elapsed):
+        # FocusScorer ya mantiene los acumuladores de su ventana (O(1))
+        return self.engine.scorer.get_current_score(session_start_time=self.engine.session_start)
+
+
+class WeightedCategoryStrategy(ScoreStrategy):
+    """Media ponderada del tiempo por categoría (productivo / neutral / distractor)."""
+    name = "weighted"
+    DEFAULT_WEIGHTS = {"productive": 1.0, "neutral": 0.6, "distractor": 0.0}
+
+    def __init__(self, engine, weights: Optional[Dict[str, float]] = None):
+        self.weights = dict(self.DEFAULT_WEIGHTS, **(weights or {}))
+        super().__init__(engine)
+
+    def reset(self):
+        self.seconds = {"productive": 0.0, "neutral": 0.0, "distractor": 0.0}
+
+    def add(self, flags, seconds):
+        # mismo orden que FocusScorer._classify_event: productivo gana
+        if flags & PRODUCTIVE:
+            cls = "productive"
+        elif flags_are_distractor(flags):
+            cls = "distractor"
+        else:
+            cls = "neutral"
+        self.seconds[cls] += seconds
+
+    def score(self, elapsed):
+        total = sum(self.seconds.values())
+        if total <= 0:
+            return 100
+        weighted = sum(self.weights[c] * s for c, s in self.seconds.items())
+        return max(0, min(100, int(100 * weighted / total)))
+
+
+STRATEGIES = {cls.name: cls for cls in (PointsStrategy, RatioStrategy, WeightedCategoryStrategy)}
+
+
+class ScoringEngine(QObject):
+    """
+    Único punto de cálculo del score de la sesión.
+    - push(proc, title, seconds): entrada única de intervalos; alimenta el
+      historial del FocusScorer (ventana y alertas de distracción), el uso por
+      app de la sesión (usage) y la estrategia activa, todo incremental
+    - update(elapsed): recalcula el valor cacheado en O(1) y emite
+      score_changed si cambió; score lo devuelve sin recalcular
+    - Estrategias: "points" (por defecto), "ratio", "weighted"
+    - Si cambian las reglas del scorer, la estrategia se reconstruye desde usage
+    - timeline: una muestra del score cada timeline_interval segundos de
+      sesión, empaquetada en un array de bytes (0-100 cabe en uno); se guarda
+      entera al final de la sesión (database.save_session_timeline)
+    """
+    score_changed = Signal(int)
+
+    def __init__(self, scorer: FocusScorer, strategy: str = "points", target_minutes: float = 25,
+                 timeline_interval: int = 30):
+        super().__init__()
+        self.scorer = scorer
+        self.target_minutes = target_minutes
+        self.usage: Dict[Tuple[str, str], float] = {}  # (proc, title) -> segundos en la sesión
+        self.session_start = None  # time.time() al iniciar la sesión
+        self._elapsed = 0.0
+        self._score = 100
+        self.timeline_interval = timeline_interval
+        self.timeline = array("B")  # muestra i = score a los i * timeline_interval segundos
+        self._next_sample = 0.0
+        self.strategy = STRATEGIES[strategy](self)
+        scorer.rules_changed.connect(self._rebuild)
+
+    @property
+    def score(self) -> int:
+        """Último score calculado (lo que muestra el anillo)."""
+        return self._score
+
+    # ------------------ entrada de eventos ------------------
+    def push(self, proc: Optional[str], title: Optional[str], seconds: float):
+        self.scorer.push_active(proc, title, seconds)
+        if seconds <= 0:
+            return
+        key = (proc or "unknown", title or "")
+        self.usage[key] = self.usage.get(key, 0) + seconds
+        self.strategy.add(self.scorer.match_flags(*key), seconds)
+
+    def start_session(self):
+        """Empieza a contar una sesión nueva (si no hay una en curso)."""
+        if self.session_start is None:
+            self.session_start = time.time()
+
+    def reset_session(self):
+        """
+        Descarta el uso acumulado (tras guardar o reiniciar la sesión). El score
+        cacheado se conserva hasta el próximo update() para que el anillo siga
+        mostrando el valor guardado.
+        """
+        self.usage.clear()
+        self.session_start = None
+        self.strategy.reset()
+        self._elapsed = 0.0
+        self.timeline = array("B")
+        self._next_sample = 0.0
+
+    # ------------------ configuración ------------------
+    def set_target_minutes(self, minutes: float):
+        self.target_minutes = max(1, minutes)
+
+    def set_strategy(self, name: str, **kwargs):
+        self.strategy = STRATEGIES[name](self, **kwargs)
+        self._rebuild()
+
+    def _rebuild(self):
+        """Reacumula la estrategia desde usage (reglas nuevas o estrategia nueva)."""
+        self.strategy.reset()
+        for (proc, title), seconds in self.usage.items():
+            self.strategy.add(self.scorer.match_flags(proc, title), seconds)
+        self.update(self._elapsed)
+
+    # ------------------ score ------------------
+    def update(self, elapsed: float) -> int:
+        """Recalcula el score para `elapsed` segundos de sesión y lo cachea."""
+        self._elapsed = elapsed
+        try:
+            score = 100 if elapsed < 10 else self.strategy.score(elapsed)
+        except Exception as e:
+            log.error("error calculando score: %s", e)
+            score = self._score
+        self._set_score(score)
+        # muestras pendientes del timeline (varias si hubo un hueco sin updates)
+        while elapsed >= self._next_sample:
+            self.timeline.append(score)
+            self._next_sample += self.timeline_interval
+        return score
+
+    def timeline_bytes(self) -> bytes:
+        """Timeline de la sesión empaquetado (un byte por muestra)."""
+        return self.timeline.tobytes()
+
+    def _set_score(self, score: int):
+        if score != self._score:
+            self._score = score
+            self.score_changed.emit(score)
@@ -0,0 +1,211 @@
+# src/core/session_journal.py
+import datetime
+import json
+import os
+from typing import Dict, Optional, Tuple
+from data import database
+from core.log import get_logger
+
+log = get_logger("core")
+
+JOURNAL_NAME = "focusly.session.jsonl"
+MIN_SESSION_SECONDS = 10  # igual que _save_session: sesiones más cortas no se guardan
+MIN_APP_SECONDS = 5  # apps con menos tiempo no se guardan en session_apps
+
+
+def default_path() -> str:
+    """Diario junto a la base de datos (database.DB_PATH)."""
+    return os.path.join(os.path.dirname(database.DB_PATH), JOURNAL_NAME)
+
+
+def store_session(start_iso, end_iso, duration, final_score, usage, target_seconds,
+                  timeline_interval, timeline) -> int:
+    """Guarda una sesión terminada (o recuperada) con sus apps y su timeline."""
+    app_data = [(proc, title, seconds) for (proc, title), seconds in usage.items()
+                if seconds > MIN_APP_SECONDS]
+    log.debug("Apps registradas: %d", len(app_data))
+    apps_used_str = ", ".join([f"{proc}({secs}s)" for proc, title, secs in app_data[:5]])
+    session_id = database.save_session(
+        start_iso, end_iso, duration, final_score, apps_used_str,
+        target_seconds=target_seconds,
+    )
+    database.save_session_apps(session_id, app_data)
+    database.save_session_timeline(session_id, timeline_interval, bytes(timeline))
+    return session_id
+
+
+class SessionJournal:
+    """
+    Diario en disco de la sesión en curso (JSON lines, solo se añade al final).
+    - begin(): abre una sesión nueva (trunca lo anterior)
+    - checkpoint(): añade una línea solo con lo que cambió desde la anterior:
+      total de segundos de las apps que sumaron tiempo, muestras nuevas del
+      timeline, score y segundos activos de sesión (sin pausas: es la
+      duración con la que se recupera). Cada app se declara una vez con un
+      índice y después solo se escribe el índice
+    - clear(): la sesión se guardó o se descartó; el diario queda vacío
+    Si la app muere a mitad de sesión, load() reconstruye el estado desde el
+    diario (una última línea cortada se ignora) y recover_interrupted() la
+    guarda en la base de datos al arrancar.
+    Lo usa el CoreWorker desde su hilo: la escritura nunca bloquea la GUI.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_path()
+        self._file = None
+        self._apps: Dict[Tuple[str, str], int] = {}  # (proc, title) -> índice en el diario
+        self._written: Dict[Tuple[str, str], float] = {}  # último total escrito por app
+        self._timeline_written = 0
+        self._score = None
+        self._target = None
+        self._elapsed = 0.0
+        self.bytes_written = 0
+
+    @property
+    def active(self) -> bool:
+        return self._file is not None
+
+    def _write(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        self._file.write(line)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.bytes_written += len(line)
+
+    def begin(self, session_start: float, target_seconds: int, timeline_interval: int):
+        self.close()
+        self._apps.clear()
+        self._written.clear()
+        self._timeline_written = 0
+        self._score = None
+        self._target = target_seconds
+        self._elapsed = 0.0
+        try:
+            self._file = open(self.path, "w", encoding="utf-8")
+            self._write({"t": "begin", "start": session_start, "target": target_seconds,
+                         "interval": timeline_interval})
+        except OSError as e:
+            log.error("no se pudo abrir el diario de sesión %s: %s", self.path, e)
+            self.close()
+
+    def checkpoint(self, elapsed: float, score: int, usage: Dict[Tuple[str, str], float],
+                   timeline, target_seconds: Optional[int] = None) -> bool:
+        """Añade el delta desde el último checkpoint. False si no había nada nuevo."""
+        if self._file is None:
+            return False
+        record = {}
+        changed = []
+        for key, seconds in usage.items():
+            if self._written.get(key) == seconds:
+                continue
+            index = self._apps.get(key)
+            if index is None:
+                index = self._apps[key] = len(self._apps)
+                record.setdefault("new", []).append([index, key[0], key[1]])
+            changed.append([index, round(seconds, 2)])
+            self._written[key] = seconds
+        if changed:
+            record["u"] = changed
+        if len(timeline) > self._timeline_written:
+            record["tl"] = list(timeline[self._timeline_written:])
+            self._timeline_written = len(timeline)
+        if score != self._score:
+            record["s"] = self._score = score
+        if target_seconds is not None and target_seconds != self._target:
+            record["target"] = self._target = target_seconds
+        elapsed = round(elapsed, 1)
+        # sin ventana activa no cambia nada más, pero el tiempo activo sigue contando
+        if not record and elapsed == self._elapsed:
+            return False
+        record["t"] = "d"
+        record["e"] = self._elapsed = elapsed
+        try:
+            self._write(record)
+        except OSError as e:
+            log.error("error escribiendo el diario de sesión: %s", e)
+            return False
+        return True
+
+    def clear(self):
+        """Sesión guardada o descartada: vaciar el diario."""
+        self.close()
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            log.warning("no se pudo borrar el diario de sesión: %s", e)
+
+    def close(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+
+def load(path: Optional[str] = None) -> Optional[dict]:
+    """
+    Estado de la sesión del diario o None si no hay sesión a medias:
+    {start, target, interval, elapsed, score, usage {(proc, title): s}, timeline [int]}
+    """
+    path = path or default_path()
+    if not os.path.exists(path):
+        return None
+    state = None
+    apps = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # línea cortada por el cierre brusco
+            kind = record.get("t")
+            if kind == "begin":
+                apps = {}
+                state = {
+                    "start": record["start"], "target": record.get("target"),
+                    "interval": record.get("interval", 30), "elapsed": 0.0,
+                    "score": 100, "usage": {}, "timeline": [],
+                }
+            elif kind == "d" and state is not None:
+                for index, proc, title in record.get("new", ()):
+                    apps[index] = (proc, title)
+                for index, seconds in record.get("u", ()):
+                    if index in apps:
+                        state["usage"][apps[index]] = seconds
+                state["timeline"].extend(record.get("tl", ()))
+                state["score"] = record.get("s", state["score"])
+                state["target"] = record.get("target", state["target"])
+                state["elapsed"] = record.get("e", state["elapsed"])
+    return state
+
+
+def recover_interrupted(path: Optional[str] = None) -> Optional[Tuple[int, int, int]]:
+    """
+    Guarda la sesión que quedó a medias en el diario (cierre inesperado) y
+    vacía el diario. Devuelve (session_id, duración, score) o None.
+    """
+    path = path or default_path()
+    try:
+        state = load(path)
+        if state is None:
+            return None
+        duration = int(state["elapsed"])
+        if duration < MIN_SESSION_SECONDS:
+            log.info("Sesión interrumpida demasiado corta (%ss), se descarta", duration)
+            os.remove(path)
+            return None
+        start = datetime.datetime.fromtimestamp(state["start"])
+        end = start + datetime.timedelta(seconds=duration)
+        session_id = store_session(
+            start.isoformat(), end.isoformat(), duration, state["score"], state["usage"],
+            state["target"], state["interval"], state["timeline"],
+        )
+        os.remove(path)
+        log.info("Sesión interrumpida recuperada - ID: %s, Duración: %ss, Score: %s%%",
+                 session_id, duration, state["score"])
+        return session_id, duration, state["score"]
+    except Exception as e:
+        log.exception("Error recuperando la sesión interrumpida: %s", e)
+        return None
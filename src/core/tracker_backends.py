@@ -0,0 +1,394 @@
+# src/core/tracker_backends.py
+import csv
+import os
+import select
+import threading
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+from core.process_cache import ProcessInfoCache
+
+# Import Windows APIs if on Windows
+try:
+    import win32gui
+    import win32process
+except Exception:
+    win32gui = None
+    win32process = None
+
+# Import X11 (python-xlib) si estamos en Linux con servidor X
+try:
+    from Xlib import X
+    from Xlib import display as xdisplay
+    from Xlib import error as xerror
+except Exception:
+    X = None
+    xdisplay = None
+    xerror = None
+
+
+class TrackerBackend:
+    """
+    Interfaz de los backends de AppTracker. Todo se llama desde el hilo del
+    tracker salvo wake(), que puede llamarse desde cualquier hilo.
+    - open() / close(): adquirir / liberar recursos
+    - sample(): (process_name, window_title) de la ventana activa, o None
+    - wait(timeout): bloquea hasta `timeout` segundos del reloj del backend;
+      True si sabe que cambió la ventana (solo backends event_driven)
+    - wake(): interrumpe un wait() en curso
+    - clock(): reloj monotónico del backend (virtual en el replay)
+    - finished: True cuando no habrá más muestras (fin de una traza)
+    """
+    event_driven = False
+
+    def __init__(self):
+        self.finished = False
+        self._wake_event = threading.Event()
+
+    def open(self):
+        self.finished = False
+        self._wake_event.clear()
+
+    def close(self):
+        pass
+
+    def sample(self) -> Optional[Tuple[str, str]]:
+        raise NotImplementedError
+
+    def wait(self, timeout: float) -> bool:
+        self._wake_event.wait(max(0.0, timeout))
+        self._wake_event.clear()
+        return False
+
+    def wake(self):
+        self._wake_event.set()
+
+    def clock(self) -> float:
+        return time.monotonic()
+
+
+class NullBackend(TrackerBackend):
+    """Plataforma sin soporte: no hay muestras, solo espera."""
+
+    def sample(self):
+        return None
+
+
+class Win32Backend(TrackerBackend):
+    """Sondeo de la ventana en primer plano con win32gui."""
+
+    def __init__(self, process_cache: Optional[ProcessInfoCache] = None):
+        super().__init__()
+        self.process_cache = process_cache or ProcessInfoCache()
+
+    @staticmethod
+    def available():
+        return win32gui is not None
+
+    def sample(self):
+        hwnd = win32gui.GetForegroundWindow()
+        title = win32gui.GetWindowText(hwnd) if hwnd else ""
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        info = self.process_cache.lookup(pid, hwnd, lambda: win32gui.GetClassName(hwnd))
+        return (info.name if info else ""), (title or "")
+
+
+class X11ActiveWindowWatcher:
+    """
+    Watcher EWMH basado en eventos para X11.
+    - Se suscribe a PropertyNotify de _NET_ACTIVE_WINDOW en la ventana raíz
+    - Se suscribe a PropertyNotify de _NET_WM_NAME / WM_NAME en la ventana activa
+    - wait(timeout) bloquea en el socket de X hasta que cambie el foco o el título
+    """
+
+    def __init__(self, display_name=None):
+        self.display = xdisplay.Display(display_name)
+        self.root = self.display.screen().root
+        self.NET_ACTIVE_WINDOW = self.display.intern_atom("_NET_ACTIVE_WINDOW")
+        self.NET_WM_NAME = self.display.intern_atom("_NET_WM_NAME")
+        self.NET_WM_PID = self.display.intern_atom("_NET_WM_PID")
+        self.UTF8_STRING = self.display.intern_atom("UTF8_STRING")
+        self.WM_NAME = self.display.intern_atom("WM_NAME")
+        self._watched_atoms = (self.NET_ACTIVE_WINDOW, self.NET_WM_NAME, self.WM_NAME)
+
+        self.root.change_attributes(event_mask=X.PropertyChangeMask)
+        self.display.flush()
+
+        self._active = None  # ventana activa a la que estamos suscritos
+        # pipe para despertar wait() desde otro hilo (stop)
+        self._wake_r, self._wake_w = os.pipe()
+
+    @staticmethod
+    def available():
+        """True si python-xlib está instalado y hay un DISPLAY configurado."""
+        return xdisplay is not None and bool(os.environ.get("DISPLAY"))
+
+    # ------------------ lectura ------------------
+    def _active_window(self):
+        prop = self.root.get_full_property(self.NET_ACTIVE_WINDOW, X.AnyPropertyType)
+        if not prop or not prop.value:
+            return None
+        wid = int(prop.value[0])
+        if wid == 0:
+            return None
+        return self.display.create_resource_object("window", wid)
+
+    def _window_title(self, win):
+        prop = win.get_full_property(self.NET_WM_NAME, self.UTF8_STRING)
+        if prop and prop.value:
+            value = prop.value
+            return value.decode("utf-8", "replace") if isinstance(value, bytes) else str(value)
+        name = win.get_wm_name()
+        if isinstance(name, bytes):
+            return name.decode("latin-1", "replace")
+        return name or ""
+
+    def _window_pid(self, win):
+        prop = win.get_full_property(self.NET_WM_PID, X.AnyPropertyType)
+        if prop and prop.value:
+            return int(prop.value[0])
+        return None
+
+    def _follow(self, win):
+        """Mover la suscripción de cambios de título a la nueva ventana activa."""
+        if self._active is not None and (win is None or self._active.id != win.id):
+            try:
+                self._active.change_attributes(event_mask=X.NoEventMask)
+            except Exception:
+                pass  # la ventana anterior ya no existe
+        if win is not None and (self._active is None or self._active.id != win.id):
+            win.change_attributes(event_mask=X.PropertyChangeMask)
+        self._active = win
+        self.display.flush()
+
+    def current(self):
+        """Devuelve (window_id, pid, title) de la ventana activa y re-suscribe si cambió."""
+        try:
+            win = self._active_window()
+            self._follow(win)
+            if win is None:
+                return None, None, ""
+            return win.id, self._window_pid(win), self._window_title(win)
+        except xerror.XError:
+            # la ventana se destruyó entre el evento y la consulta
+            self._active = None
+            return None, None, ""
+
+    def window_class(self, window_id):
+        """WM_CLASS (clase) de la ventana, "" si no se puede leer."""
+        try:
+            wm_class = self.display.create_resource_object("window", window_id).get_wm_class()
+            return wm_class[1] if wm_class else ""
+        except Exception:
+            return ""
+
+    # ------------------ espera ------------------
+    def _drain(self):
+        changed = False
+        while self.display.pending_events():
+            ev = self.display.next_event()
+            if ev.type == X.PropertyNotify and ev.atom in self._watched_atoms:
+                changed = True
+        return changed
+
+    def wait(self, timeout):
+        """
+        Bloquea hasta `timeout` segundos. Devuelve True si cambió el foco o el título.
+        """
+        if self._drain():
+            return True
+        readable, _, _ = select.select([self.display.fileno(), self._wake_r], [], [], timeout)
+        if self._wake_r in readable:
+            os.read(self._wake_r, 64)
+        if self.display.fileno() in readable:
+            return self._drain()
+        return False
+
+    def wake(self):
+        """Despierta un wait() en curso (llamable desde otro hilo)."""
+        try:
+            os.write(self._wake_w, b"x")
+        except OSError:
+            pass
+
+    def close(self):
+        try:
+            self.display.close()
+        except Exception:
+            pass
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class X11Backend(TrackerBackend):
+    """
+    Backend basado en eventos X11/EWMH: wait() solo retorna antes del timeout
+    cuando cambia el foco o el título de la ventana activa.
+    """
+    event_driven = True
+
+    def __init__(self, display_name=None, process_cache: Optional[ProcessInfoCache] = None):
+        super().__init__()
+        self.display_name = display_name
+        self.process_cache = process_cache or ProcessInfoCache()
+        self._watcher = None
+
+    @staticmethod
+    def available():
+        return X11ActiveWindowWatcher.available()
+
+    def open(self):
+        super().open()
+        self._watcher = X11ActiveWindowWatcher(self.display_name)
+
+    def close(self):
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.close()
+
+    def sample(self):
+        watcher = self._watcher
+        wid, pid, title = watcher.current()
+        info = self.process_cache.lookup(pid, wid, lambda: watcher.window_class(wid))
+        return (info.name if info else ""), (title or "")
+
+    def wait(self, timeout):
+        return self._watcher.wait(max(0.0, timeout))
+
+    def wake(self):
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.wake()
+
+
+# ------------------ trazas grabadas ------------------
+TRACE_HEADER = ["timestamp", "process", "title"]
+
+
+class TraceRecord(NamedTuple):
+    timestamp: float
+    process: str
+    title: str
+
+
+def load_trace(path: str) -> List[TraceRecord]:
+    """
+    Lee una traza CSV (timestamp, process, title) ordenada por timestamp.
+    Cada fila indica que desde `timestamp` la ventana activa es (process, title);
+    la última fila marca el final de la traza.
+    """
+    records = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if not row or row[0] == TRACE_HEADER[0]:
+                continue
+            ts = float(row[0])
+            proc = row[1] if len(row) > 1 else ""
+            title = row[2] if len(row) > 2 else ""
+            records.append(TraceRecord(ts, proc, title))
+    records.sort(key=lambda r: r.timestamp)
+    return records
+
+
+class TraceWriter:
+    """Graba transiciones de ventana en el formato que lee ReplayBackend."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(TRACE_HEADER)
+
+    def write(self, process: str, title: str, timestamp: Optional[float] = None):
+        self._writer.writerow([f"{time.time() if timestamp is None else timestamp:.3f}", process, title])
+        self._file.flush()
+
+    def close(self):
+        try:
+            self._file.close()
+        except Exception:
+            pass
+
+
+class ReplayBackend(TrackerBackend):
+    """
+    Reproduce una traza grabada de forma determinista.
+    - speed=1.0: tiempo real; speed=N: N veces más rápido
+    - speed=None o 0: sin esperas reales (lo más rápido posible)
+    El reloj es virtual: arranca en time.monotonic() al abrir y avanza con los
+    offsets de la traza, así los intervalos emitidos reflejan los tiempos grabados.
+    """
+    event_driven = True
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0):
+        super().__init__()
+        self.path = path
+        self.speed = speed
+        self._records: List[TraceRecord] = []
+        self._index = 0
+        self._now = 0.0
+        self._offset = 0.0  # clock() = timestamp de la traza + offset
+
+    def open(self):
+        super().open()
+        self._records = load_trace(self.path)
+        self._index = 0
+        if not self._records:
+            self.finished = True
+            return
+        self._offset = time.monotonic() - self._records[0].timestamp
+        self._now = self._records[0].timestamp
+        self._advance()
+
+    def _advance(self):
+        """Consumir los registros cuyo timestamp ya pasó. True si alguno cambió la ventana."""
+        moved = False
+        while self._index < len(self._records) and self._records[self._index].timestamp <= self._now:
+            self._index += 1
+            moved = True
+        return moved
+
+    def sample(self):
+        if self._index == 0:
+            return None
+        rec = self._records[self._index - 1]
+        return rec.process, rec.title
+
+    def clock(self):
+        return self._now + self._offset
+
+    def wait(self, timeout):
+        if self._index >= len(self._records):
+            self.finished = True
+            return False
+        step = min(max(0.0, timeout), self._records[self._index].timestamp - self._now)
+        if self.speed:
+            started = time.monotonic()
+            interrupted = self._wake_event.wait(step / self.speed)
+            self._wake_event.clear()
+            if interrupted:
+                step = min(step, (time.monotonic() - started) * self.speed)
+        self._now += step
+        changed = self._advance()
+        if self._index >= len(self._records):
+            # la última fila solo marca el final de la traza
+            self.finished = True
+        return changed
+
+
+def default_backend() -> TrackerBackend:
+    """
+    Backend según la plataforma. FOCUSLY_REPLAY_TRACE=<ruta.csv> fuerza el
+    replay de una traza (FOCUSLY_REPLAY_SPEED=N para acelerarla, 0 = sin esperas).
+    """
+    trace = os.environ.get("FOCUSLY_REPLAY_TRACE")
+    if trace:
+        speed = float(os.environ.get("FOCUSLY_REPLAY_SPEED", "1") or 0)
+        return ReplayBackend(trace, speed=speed)
+    if Win32Backend.available():
+        return Win32Backend()
+    if X11Backend.available():
+        return X11Backend()
+    return NullBackend()
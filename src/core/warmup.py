@@ -0,0 +1,54 @@
+# src/core/warmup.py
+import time
+from PySide6.QtCore import QThread
+from core.audio_manager import init_mixer, resolve_assets_root, scan_categories
+from core.notifier import notification_sound_path
+from core.session_journal import recover_interrupted
+from data import database
+from core.log import get_logger
+
+log = get_logger("core")
+
+
+class WarmupJob(QThread):
+    """
+    Inicialización que no necesita la GUI, en segundo plano mientras el
+    splash está en pantalla:
+    - database.init_db(), lectura de las reglas del usuario y recuperación de
+      una sesión que quedó a medias en el diario (cierre inesperado)
+    - pygame.mixer (solo el mixer) y escaneo de las carpetas de sonidos
+    - ruta del sonido de notificación (el QSoundEffect se crea en la GUI)
+    FocuslyMain(warmup=job) hace wait() (normalmente ya terminó) y reutiliza
+    los resultados. Cada paso es independiente: si uno falla queda en su
+    valor por defecto y FocuslyMain lo repite por el camino normal.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.db_ready = False
+        self.rules = None
+        self.recovered = None  # (session_id, duración, score) de recover_interrupted
+        self.mixer_ready = False
+        self.assets_root = None
+        self.categories = None
+        self.notification_sound = None
+        self.elapsed_ms = 0.0
+
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            database.init_db()
+            self.db_ready = True
+            self.rules = database.get_rules()
+            self.recovered = recover_interrupted()
+        except Exception as e:
+            log.exception("warm-up: error inicializando la base de datos: %s", e)
+        self.mixer_ready = init_mixer()
+        try:
+            self.assets_root = resolve_assets_root()
+            self.categories = scan_categories(self.assets_root)
+        except Exception as e:
+            log.warning("warm-up: error escaneando sonidos: %s", e)
+        self.notification_sound = notification_sound_path()
+        self.elapsed_ms = (time.perf_counter() - t0) * 1000
+        log.debug("warm-up terminado en %.0f ms", self.elapsed_ms)
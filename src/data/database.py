@@ -1,144 +1,462 @@
 # src/data/database.py
+import contextlib
+import datetime
+import logging
 import sqlite3
 import os
+import threading
+from core.log import get_logger
+
+log = get_logger("db")
 
 DB_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "focusly.db"))
 
+# Pragmas de cada conexión. journal_mode=WAL queda guardado en el archivo:
+# lectores y escritor no se bloquean entre sí y un commit no reescribe la
+# base de datos entera; con WAL, synchronous=NORMAL sigue siendo seguro ante
+# cortes (como mucho se pierde el último commit)
+PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8000",  # 8 MB de caché de páginas
+    "PRAGMA mmap_size = 67108864",  # 64 MB mapeados en memoria
+)
+BUSY_TIMEOUT = 5.0  # segundos esperando al escritor antes de "database is locked"
+STATEMENT_CACHE = 128  # sentencias preparadas por conexión (caché de sqlite3)
+BACKFILL_BATCH = 20000  # ids por transacción al rellenar columnas nuevas
+# texto ISO local de sessions -> epoch entero, dentro de SQLite ('utc' usa la
+# zona horaria del sistema, como datetime.timestamp(); los decimales se
+# descartan para truncar igual). Texto no válido -> NULL
+EPOCH_SQL = "CAST(strftime('%s', substr({}, 1, 19), 'utc') AS INTEGER)"
+
+
+class ConnectionManager:
+    """
+    Conexiones a DB_PATH reutilizadas en vez de abrir una por llamada.
+    - write(): una sola conexión de escritura para toda la app, compartida
+      entre hilos (GUI, core, rescore, warm-up) y serializada con un lock;
+      el bloque es una transacción (commit al salir, rollback si falla)
+    - read(): una conexión de lectura por hilo (query_only), sin lock; con
+      WAL ve lo último que confirmó el escritor. Se libera con el hilo
+    - Cada conexión guarda sus sentencias preparadas (cached_statements):
+      al reutilizarla, el mismo SQL no se vuelve a compilar
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._write_lock = threading.RLock()
+        self._writer = None
+        self._local = threading.local()
+
+    def _connect(self, read_only=False):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE)
+        if not read_only:
+            conn.execute("PRAGMA journal_mode = WAL")
+        for pragma in PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextlib.contextmanager
+    def write(self):
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            with self._writer:
+                yield self._writer
+
+    def vacuum(self):
+        """VACUUM con el escritor (no puede ir dentro de una transacción)."""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            self._writer.execute("VACUUM")
+
+    def read(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect(read_only=True)
+        return conn
+
+    def close(self):
+        """Cierra el escritor y el lector de este hilo (los de otros hilos se liberan con ellos)."""
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def connections():
+    """ConnectionManager de DB_PATH (se recrea si DB_PATH cambió)."""
+    global _manager
+    manager = _manager
+    if manager is None or manager.path != DB_PATH:
+        with _manager_lock:
+            if _manager is None or _manager.path != DB_PATH:
+                if _manager is not None:
+                    _manager.close()
+                _manager = ConnectionManager(DB_PATH)
+            manager = _manager
+    return manager
+
+
+def _write():
+    return connections().write()
+
+
+def _read():
+    return connections().read()
+
+
+def close():
+    """Cerrar las conexiones (al salir de la app)."""
+    if _manager is not None:
+        _manager.close()
+
+
 def get_conn():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    return conn
+    """Conexión propia con los mismos pragmas (la cierra quien la pide; p. ej. los exports)."""
+    return connections()._connect(read_only=True)
+
+
+def to_timestamp(value):
+    """
+    None, epoch, datetime o texto ISO (como se guarda en sessions) -> epoch
+    con decimales (float) o None. ValueError si el valor no es una fecha.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        if isinstance(value, str):
+            value = datetime.datetime.fromisoformat(value)
+        return value.timestamp()
+    except (ValueError, TypeError, AttributeError, OverflowError, OSError):
+        raise ValueError(f"Fecha no válida: {value!r}") from None
+
+
+def to_epoch(value):
+    """
+    Como to_timestamp pero en segundos enteros, como las columnas
+    start_epoch/end_epoch (para filtrar en SQL). ValueError si no es una fecha.
+    """
+    timestamp = to_timestamp(value)
+    return None if timestamp is None else int(timestamp)
+
 
 def init_db():
     """Inicializar base de datos con tablas para sesiones"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
     try:
-        # Verificar si la tabla sessions existe y tiene las columnas correctas
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sessions'")
-        table_exists = cursor.fetchone()
-        
-        if table_exists:
-            # Verificar si tiene las columnas nuevas
+        with _write() as conn:
+            cursor = conn.cursor()
+
+            # Verificar si la tabla sessions existe y tiene las columnas correctas
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sessions'")
+            table_exists = cursor.fetchone()
+            
+            if table_exists:
+                # Verificar si tiene las columnas nuevas
+                cursor.execute("PRAGMA table_info(sessions)")
+                columns = [col[1] for col in cursor.fetchall()]
+                
+                if 'duration_seconds' not in columns:
+                    log.info("Actualizando esquema de base de datos...")
+                    # Backup de datos existentes si los hay
+                    cursor.execute("ALTER TABLE sessions RENAME TO sessions_old")
+            
+            # Crear tablas nuevas
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    start_time TEXT NOT NULL,
+                    end_time TEXT NOT NULL,
+                    duration_seconds INTEGER NOT NULL,
+                    final_score INTEGER NOT NULL,
+                    apps_used TEXT
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS session_apps (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id INTEGER,
+                    app_name TEXT NOT NULL,
+                    app_title TEXT NOT NULL,
+                    total_seconds INTEGER NOT NULL,
+                    FOREIGN KEY (session_id) REFERENCES sessions (id)
+                )
+            ''')
+            
+            # Timeline del score: una fila por sesión, muestras empaquetadas (1 byte
+            # por muestra) en un BLOB; session_id es la clave primaria (lectura indexada)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS session_timelines (
+                    session_id INTEGER PRIMARY KEY,
+                    interval_seconds INTEGER NOT NULL,
+                    samples BLOB NOT NULL,
+                    FOREIGN KEY (session_id) REFERENCES sessions (id)
+                )
+            ''')
+
+            # Reglas de clasificación del usuario (ver core/rules.py)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS rules (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL CHECK (kind IN ('keyword', 'process', 'title_regex')),
+                    pattern TEXT NOT NULL,
+                    category TEXT NOT NULL CHECK (category IN ('productive', 'distractor')),
+                    weight REAL NOT NULL DEFAULT 1.0
+                )
+            ''')
+
+            # Duración objetivo del pomodoro (para recalcular scores); NULL en
+            # sesiones antiguas
             cursor.execute("PRAGMA table_info(sessions)")
             columns = [col[1] for col in cursor.fetchall()]
-            
-            if 'duration_seconds' not in columns:
-                print("[DB] Actualizando esquema de base de datos...")
-                # Backup de datos existentes si los hay
-                cursor.execute("ALTER TABLE sessions RENAME TO sessions_old")
-        
-        # Crear tablas nuevas
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                start_time TEXT NOT NULL,
-                end_time TEXT NOT NULL,
-                duration_seconds INTEGER NOT NULL,
-                final_score INTEGER NOT NULL,
-                apps_used TEXT
-            )
-        ''')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS session_apps (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                session_id INTEGER,
-                app_name TEXT NOT NULL,
-                app_title TEXT NOT NULL,
-                total_seconds INTEGER NOT NULL,
-                FOREIGN KEY (session_id) REFERENCES sessions (id)
-            )
-        ''')
-        
-        # Si había tabla old, migrar datos (opcional)
-        # ...
-        
-        conn.commit()
-        print("[DB] Base de datos inicializada correctamente")
+            if 'target_seconds' not in columns:
+                cursor.execute("ALTER TABLE sessions ADD COLUMN target_seconds INTEGER")
+                columns.append('target_seconds')
+
+            # Si había tabla old, migrar datos (opcional)
+            # ...
+
+            if log.isEnabledFor(logging.DEBUG):
+                # diagnóstico del esquema (una vez, solo con el log de db en DEBUG)
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                log.debug("Tablas existentes: %s", [table[0] for table in cursor.fetchall()])
+                log.debug("Columnas de 'sessions': %s", columns)
+
+        log.info("Base de datos inicializada correctamente")
         
     except Exception as e:
-        print(f"[DB] Error inicializando base de datos: {e}")
-        conn.rollback()
-    finally:
-        conn.close()
+        log.error("Error inicializando base de datos: %s", e)
+        return
+    try:
+        migrate()
+    except Exception as e:
+        log.exception("Error migrando base de datos: %s", e)
+
+# ------------------ migraciones (PRAGMA user_version) ------------------
+def _migrate_epoch_columns():
+    """
+    v1: start_epoch / end_epoch enteros en sessions (rango y orden por fecha
+    con índice, sin comparar texto ISO) e índices:
+    - sessions(start_epoch): get_all_sessions, get_latest_sessions y
+      get_sessions_between recorren el índice en vez de ordenar la tabla
+    - session_apps(session_id, total_seconds DESC, app_name, app_title):
+      cubre get_session_apps (búsqueda y orden sin leer la tabla)
+    El relleno va por lotes de BACKFILL_BATCH ids, cada uno en su
+    transacción: no retiene el escritor y si se corta sigue donde quedó.
+    """
+    with _write() as conn:
+        columns = [col[1] for col in conn.execute("PRAGMA table_info(sessions)").fetchall()]
+        for column in ("start_epoch", "end_epoch"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE sessions ADD COLUMN {column} INTEGER")
+
+    max_id = _read().execute("SELECT COALESCE(MAX(id), 0) FROM sessions").fetchone()[0]
+    filled = 0
+    for first_id in range(1, max_id + 1, BACKFILL_BATCH):
+        with _write() as conn:
+            filled += conn.execute(
+                f"UPDATE sessions SET start_epoch = {EPOCH_SQL.format('start_time')}, "
+                f"end_epoch = {EPOCH_SQL.format('end_time')} "
+                "WHERE id >= ? AND id < ? AND start_epoch IS NULL",
+                (first_id, first_id + BACKFILL_BATCH),
+            ).rowcount
+    log.info("Migración v1: epoch rellenado en %d sesiones", filled)
+
+    with _write() as conn:
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start_epoch ON sessions (start_epoch)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_session_apps_session "
+            "ON session_apps (session_id, total_seconds DESC, app_name, app_title)"
+        )
+
+# (versión, función): cada una se aplica una vez, en orden
+MIGRATIONS = (
+    (1, _migrate_epoch_columns),
+)
+
+def migrate():
+    """Aplicar las migraciones pendientes según PRAGMA user_version."""
+    with _write() as conn:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for target, migration in MIGRATIONS:
+        if version >= target:
+            continue
+        log.info("Migrando base de datos a la versión %d...", target)
+        migration()
+        with _write() as conn:
+            conn.execute(f"PRAGMA user_version = {target}")
+        version = target
+
+def reset_db():
+    """
+    Borrar todo el historial (sesiones, apps y timelines) sin tocar el archivo
+    ni las reglas del usuario; las conexiones abiertas siguen valiendo.
+    """
+    with _write() as conn:
+        conn.execute("DELETE FROM session_timelines")
+        conn.execute("DELETE FROM session_apps")
+        conn.execute("DELETE FROM sessions")
+        conn.execute("DELETE FROM sqlite_sequence WHERE name IN ('sessions', 'session_apps')")
+    # devolver el espacio al disco
+    connections().vacuum()
+    log.info("Historial de sesiones eliminado")
 
-def save_session(start_time, end_time, duration_seconds, final_score, apps_used):
+def save_session(start_time, end_time, duration_seconds, final_score, apps_used, target_seconds=None):
     """Guardar una sesión completada"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO sessions (start_time, end_time, duration_seconds, final_score, apps_used)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (start_time, end_time, duration_seconds, final_score, apps_used))
-    
-    session_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
-    return session_id
+    with _write() as conn:
+        cursor = conn.execute(f'''
+            INSERT INTO sessions (start_time, end_time, duration_seconds, final_score, apps_used, target_seconds,
+                                  start_epoch, end_epoch)
+            VALUES (?, ?, ?, ?, ?, ?, {EPOCH_SQL.format('?1')}, {EPOCH_SQL.format('?2')})
+        ''', (start_time, end_time, duration_seconds, final_score, apps_used, target_seconds))
+    return cursor.lastrowid
 
 def save_session_apps(session_id, app_data):
     """Guardar datos de apps usadas en una sesión"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    for app_name, app_title, total_seconds in app_data:
-        cursor.execute('''
+    with _write() as conn:
+        conn.executemany('''
             INSERT INTO session_apps (session_id, app_name, app_title, total_seconds)
             VALUES (?, ?, ?, ?)
-        ''', (session_id, app_name, app_title, total_seconds))
-    
-    conn.commit()
-    conn.close()
+        ''', [(session_id, app_name, app_title, total_seconds)
+              for app_name, app_title, total_seconds in app_data])
+
+def save_session_timeline(session_id, interval_seconds, samples):
+    """Guardar el timeline del score de una sesión (bytes, una muestra 0-100 por byte)"""
+    with _write() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO session_timelines (session_id, interval_seconds, samples) VALUES (?, ?, ?)",
+            (session_id, interval_seconds, sqlite3.Binary(samples)),
+        )
+
+def get_session_timeline(session_id):
+    """Timeline de una sesión: (interval_seconds, [scores]) o None si no hay"""
+    row = _read().execute(
+        "SELECT interval_seconds, samples FROM session_timelines WHERE session_id = ?",
+        (session_id,),
+    ).fetchone()
+    if row is None:
+        return None
+    return row[0], list(bytes(row[1]))
+
+def get_rules():
+    """Reglas de clasificación: [(id, kind, pattern, category, weight)] en orden de creación"""
+    return _read().execute(
+        "SELECT id, kind, pattern, category, weight FROM rules ORDER BY id"
+    ).fetchall()
+
+def add_rule(kind, pattern, category, weight=1.0):
+    """Guardar una regla y devolver su id"""
+    with _write() as conn:
+        cursor = conn.execute(
+            "INSERT INTO rules (kind, pattern, category, weight) VALUES (?, ?, ?, ?)",
+            (kind, pattern, category, weight),
+        )
+    return cursor.lastrowid
+
+def update_rule(rule_id, kind, pattern, category, weight):
+    """Modificar una regla existente"""
+    with _write() as conn:
+        conn.execute(
+            "UPDATE rules SET kind = ?, pattern = ?, category = ?, weight = ? WHERE id = ?",
+            (kind, pattern, category, weight, rule_id),
+        )
+
+def delete_rule(rule_id):
+    """Borrar una regla"""
+    with _write() as conn:
+        conn.execute("DELETE FROM rules WHERE id = ?", (rule_id,))
+
+SESSION_COLUMNS = "id, start_time, end_time, duration_seconds, final_score, apps_used"
 
 def get_all_sessions():
     """Obtener todas las sesiones ordenadas por fecha"""
-    print("🔍 [DATABASE] get_all_sessions llamado")
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
     try:
-        # Primero verificar qué tablas existen
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = cursor.fetchall()
-        print(f"📊 [DATABASE] Tablas existentes: {[table[0] for table in tables]}")
-        
-        # Verificar estructura de la tabla sessions
-        if 'sessions' in [table[0] for table in tables]:
-            cursor.execute("PRAGMA table_info(sessions)")
-            columns = cursor.fetchall()
-            print(f"📋 [DATABASE] Columnas de 'sessions': {[col[1] for col in columns]}")
-        
-        cursor.execute('''
-            SELECT id, start_time, end_time, duration_seconds, final_score, apps_used
+        sessions = _read().execute(f'''
+            SELECT {SESSION_COLUMNS}
             FROM sessions 
-            ORDER BY start_time DESC
-        ''')
-        
-        sessions = cursor.fetchall()
-        print(f"✅ [DATABASE] Sesiones obtenidas: {len(sessions)}")
-        
+            ORDER BY start_epoch DESC, id DESC
+        ''').fetchall()
+        log.debug("Sesiones obtenidas: %d", len(sessions))
         return sessions
         
     except Exception as e:
-        print(f"❌ [DATABASE] Error en get_all_sessions: {e}")
+        log.error("Error en get_all_sessions: %s", e)
         return []
-    finally:
-        conn.close()
+
+def get_session(session_id):
+    """Una sesión por id (mismas columnas que get_all_sessions) o None"""
+    return _read().execute(
+        f"SELECT {SESSION_COLUMNS} FROM sessions WHERE id = ?", (session_id,)
+    ).fetchone()
+
+def get_latest_sessions(limit):
+    """Las `limit` sesiones más recientes (más reciente primero)"""
+    return _read().execute(
+        f"SELECT {SESSION_COLUMNS} FROM sessions ORDER BY start_epoch DESC, id DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+
+def get_sessions_between(start, end=None):
+    """
+    Sesiones que empezaron en [start, end) (más reciente primero). start/end:
+    epoch, datetime o texto ISO (ValueError si no lo son); end=None es sin
+    límite superior.
+    """
+    start, end = to_epoch(start), to_epoch(end)
+    if end is None:
+        return _read().execute(
+            f"SELECT {SESSION_COLUMNS} FROM sessions WHERE start_epoch >= ? "
+            "ORDER BY start_epoch DESC, id DESC", (start,),
+        ).fetchall()
+    return _read().execute(
+        f"SELECT {SESSION_COLUMNS} FROM sessions WHERE start_epoch >= ? AND start_epoch < ? "
+        "ORDER BY start_epoch DESC, id DESC", (start, end),
+    ).fetchall()
 
 def get_session_apps(session_id):
     """Obtener apps usadas en una sesión específica"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    return _read().execute('''
         SELECT app_name, app_title, total_seconds
         FROM session_apps
         WHERE session_id = ?
         ORDER BY total_seconds DESC
-    ''', (session_id,))
-    
-    apps = cursor.fetchall()
-    conn.close()
-    return apps
+    ''', (session_id,)).fetchall()
+
+def get_rescore_inputs():
+    """
+    Carga en bloque lo necesario para recalcular scores:
+    - sessions: [(id, duration_seconds, target_seconds)]
+    - apps: [(session_id, app_name, app_title, total_seconds)]
+    Dos consultas en total, sin una consulta por sesión.
+    """
+    conn = _read()
+    sessions = conn.execute(
+        "SELECT id, duration_seconds, target_seconds FROM sessions ORDER BY id"
+    ).fetchall()
+    apps = conn.execute(
+        "SELECT session_id, app_name, app_title, total_seconds FROM session_apps"
+    ).fetchall()
+    return sessions, apps
+
+def update_session_scores(scores):
+    """Actualiza final_score de muchas sesiones [(session_id, score)] en una sola transacción"""
+    with _write() as conn:
+        conn.executemany(
+            "UPDATE sessions SET final_score = ? WHERE id = ?",
+            [(score, session_id) for session_id, score in scores],
+        )
@@ -1,7 +1,16 @@
 # src/reports/reports.py
-import pandas as pd
 import os
-from ..data import database
+from typing import Iterable, Iterator, Optional
+import numpy as np
+import pandas as pd
+from data import database
+from core.keyword_matcher import PRODUCTIVE, DISTRACTOR, BROWSER, WEBSITE, GAME, MEDIA
+
+EXPORT_CHUNKSIZE = 50000
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+HISTORY_COLUMNS = ["start_ts", "end_ts", "proc", "title", "seconds", "class"]
+SESSION_EVENT_COLUMNS = ["session_id", "start_time", "end_time", "proc", "title", "seconds", "class"]
+
 
 def export_sessions_csv(path="focusly_sessions_export.csv"):
     # ejemplo simple que lee la DB y genera CSV
@@ -10,3 +19,153 @@ def export_sessions_csv(path="focusly_sessions_export.csv"):
     conn.close()
     df.to_csv(path, index=False)
     return path
+
+
+# ------------------ clasificación vectorizada ------------------
+def classify_column(scorer, proc: pd.Series, title: pd.Series, seconds: Optional[pd.Series] = None,
+                    memo: Optional[dict] = None) -> np.ndarray:
+    """
+    Columna 'productive' / 'distractor' / 'neutral' para un bloque completo.
+    Cada par (proc, title) distinto se clasifica una sola vez y el resultado
+    se expande con los códigos de pd.factorize. `memo` (clave -> flags) se
+    reutiliza entre bloques de un mismo export: crece con los pares
+    distintos, no con las filas.
+    Con `seconds` se aplica además el umbral de tiempo de _classify_event.
+    """
+    if memo is None:
+        memo = {}
+    keys = proc.fillna("").astype(str) + "\x1f" + title.fillna("").astype(str)
+    codes, uniques = pd.factorize(keys, sort=False)
+
+    def flags_for(key):
+        flags = memo.get(key)
+        if flags is None:
+            flags = memo[key] = scorer.match_flags(*key.split("\x1f", 1))
+        return flags
+
+    unique_flags = np.fromiter((flags_for(k) for k in uniques), dtype=np.int64, count=len(uniques))
+    flags = unique_flags[codes]
+    productive = (flags & PRODUCTIVE) != 0
+    distractor = ((flags & (DISTRACTOR | GAME | MEDIA)) != 0) | (((flags & BROWSER) != 0) & ((flags & WEBSITE) != 0))
+    if seconds is not None:
+        distractor |= seconds.to_numpy() >= scorer.distractor_threshold_seconds
+    return np.select([productive, distractor], ["productive", "distractor"], "neutral")
+
+
+# ------------------ fuentes (generadores de DataFrames) ------------------
+def history_chunks(scorer, start=None, end=None, chunksize=EXPORT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Historial en memoria del FocusScorer por bloques:
+    start_ts, end_ts, proc, title, seconds, class. start/end como en
+    database.to_timestamp (con decimales; ValueError si no son fechas).
+    Llamar desde el hilo que es dueño del scorer (el CoreWorker).
+    """
+    # fechas convertidas ya, no al pedir el primer bloque: un error no deja
+    # un archivo de export a medias
+    return _history_chunks(scorer, database.to_timestamp(start), database.to_timestamp(end), chunksize)
+
+
+def _history_chunks(scorer, start_ts, end_ts, chunksize) -> Iterator[pd.DataFrame]:
+    memo = {}
+    for cols in scorer.history.iter_columns(chunksize, start_ts, end_ts):
+        df = pd.DataFrame(cols, columns=HISTORY_COLUMNS[:-1])
+        df["class"] = classify_column(scorer, df["proc"], df["title"], df["seconds"], memo)
+        yield df
+
+
+def session_event_chunks(scorer, start=None, end=None, chunksize=EXPORT_CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """
+    Apps de las sesiones guardadas por bloques (read_sql_query con chunksize):
+    session_id, start_time, end_time, proc, title, seconds, class. El filtro
+    de tiempo es sobre el inicio de la sesión. La clase es solo por nombre
+    (seconds es el total de la sesión, el umbral por evento no aplica).
+    ValueError si start/end no son fechas.
+    """
+    where, params = [], []
+    # start_epoch/end_epoch enteros con índice (database.migrate v1)
+    if start is not None:
+        where.append("s.start_epoch >= ?")
+        params.append(database.to_epoch(start))
+    if end is not None:
+        where.append("s.start_epoch <= ?")
+        params.append(database.to_epoch(end))
+    query = (
+        "SELECT a.session_id, s.start_time, s.end_time, a.app_name AS proc, "
+        "a.app_title AS title, a.total_seconds AS seconds "
+        "FROM session_apps a JOIN sessions s ON s.id = a.session_id"
+        + (" WHERE " + " AND ".join(where) if where else "")
+        + " ORDER BY s.start_epoch, a.session_id"
+    )
+    return _session_event_chunks(scorer, query, params, chunksize)
+
+
+def _session_event_chunks(scorer, query, params, chunksize) -> Iterator[pd.DataFrame]:
+    memo = {}
+    conn = database.get_conn()
+    try:
+        for df in pd.read_sql_query(query, conn, params=params, chunksize=chunksize):
+            df["class"] = classify_column(scorer, df["proc"], df["title"], memo=memo)
+            yield df
+    finally:
+        conn.close()
+
+
+# ------------------ escritura por bloques ------------------
+def _format_for(path: str, fmt: Optional[str]) -> str:
+    fmt = (fmt or os.path.splitext(path)[1].lstrip(".")).lower()
+    if fmt == "json":
+        fmt = "jsonl"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de export no soportado: {fmt!r} (usa {', '.join(EXPORT_FORMATS)})")
+    return fmt
+
+
+def write_chunks(chunks: Iterable[pd.DataFrame], path: str, fmt: Optional[str] = None,
+                 columns: Optional[Iterable[str]] = None) -> int:
+    """
+    Escribe bloques a CSV, JSON Lines o Parquet sin juntarlos en memoria.
+    Devuelve el número de filas escritas. Sin filas, el Parquet se escribe
+    igual como tabla vacía con `columns`.
+    """
+    fmt = _format_for(path, fmt)
+    rows = 0
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for df in chunks:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+                rows += len(df)
+            if writer is None:
+                empty = pd.DataFrame(columns=list(columns or []))
+                pq.write_table(pa.Table.from_pandas(empty, preserve_index=False), path)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        for df in chunks:
+            if fmt == "csv":
+                df.to_csv(f, index=False, header=(rows == 0))
+            else:
+                df.to_json(f, orient="records", lines=True, force_ascii=False)
+            rows += len(df)
+    return rows
+
+
+def export_history(scorer, path: str, start=None, end=None, fmt: Optional[str] = None,
+                   chunksize=EXPORT_CHUNKSIZE) -> int:
+    """Exporta el historial en memoria del scorer (filtrado por [start, end])."""
+    return write_chunks(history_chunks(scorer, start, end, chunksize), path, fmt, HISTORY_COLUMNS)
+
+
+def export_session_events(scorer, path: str, start=None, end=None, fmt: Optional[str] = None,
+                          chunksize=EXPORT_CHUNKSIZE) -> int:
+    """Exporta las apps de las sesiones guardadas (filtradas por inicio de sesión)."""
+    return write_chunks(session_event_chunks(scorer, start, end, chunksize), path, fmt,
+                        SESSION_EVENT_COLUMNS)
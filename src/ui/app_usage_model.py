@@ -0,0 +1,91 @@
+# src/ui/app_usage_model.py
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtGui import QFont
+
+TITLE_MAX = 40
+
+
+def format_duration(seconds: float) -> str:
+    """45s / 3m 05s / 1h 02m"""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, secs = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
+class AppUsageModel(QAbstractListModel):
+    """
+    Monitor de apps de la sesión: una fila por (proceso, título) con sus
+    segundos acumulados.
+    - add_time(proc, title, seconds) suma al acumulador de esa app y emite
+      dataChanged solo para su fila (o inserta una fila nueva arriba): coste
+      constante por evento, sin releer ni parsear texto
+    - Las filas se guardan en orden de aparición y se muestran al revés (la
+      última app nueva arriba), así insertar es siempre la fila 0 y las demás
+      conservan su posición relativa
+    - La app activa se marca en negrita; el texto se genera al pintar solo
+      para las filas visibles (QListView con setUniformItemSizes)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # [[proc, title, seconds]] en orden de aparición
+        self._index = {}  # (proc, title) -> posición en _rows
+        self._active = None  # posición en _rows de la app activa
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    # ------------------ API de QAbstractListModel ------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pos = len(self._rows) - 1 - index.row()
+        proc, title, seconds = self._rows[pos]
+        if role == Qt.DisplayRole:
+            if len(title) > TITLE_MAX:
+                title = title[:TITLE_MAX - 3] + "..."
+            return f"{proc} | {title} | {format_duration(seconds)}"
+        if role == Qt.ToolTipRole:
+            return f"{proc}\n{title}\n{format_duration(seconds)}"
+        if role == Qt.FontRole and pos == self._active:
+            return self._bold
+        if role == Qt.UserRole:
+            return seconds
+        return None
+
+    # ------------------ actualización ------------------
+    def _row_changed(self, pos):
+        index = self.index(len(self._rows) - 1 - pos)
+        self.dataChanged.emit(index, index)
+
+    def add_time(self, proc, title, seconds):
+        """Suma `seconds` a la app (proc, title) y la marca como activa."""
+        key = (proc or "unknown", title or "")
+        pos = self._index.get(key)
+        if pos is None:
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            pos = self._index[key] = len(self._rows)
+            self._rows.append([key[0], key[1], seconds])
+            self.endInsertRows()
+        elif seconds:
+            self._rows[pos][2] += seconds
+            self._row_changed(pos)
+        if pos != self._active:
+            previous, self._active = self._active, pos
+            if previous is not None:
+                self._row_changed(previous)
+            self._row_changed(pos)
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._index = {}
+        self._active = None
+        self.endResetModel()
@@ -0,0 +1,229 @@
+# src/ui/config_page.py
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                              QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView,
+                              QComboBox, QLineEdit, QDoubleSpinBox, QMessageBox, QPlainTextEdit)
+from PySide6.QtCore import Qt, Signal
+from core import log
+from core.rules import RULE_KINDS, RULE_CATEGORIES, validate_rule, validate_rules
+from data import database
+
+KIND_LABELS = {
+    "keyword": "Palabra clave",
+    "process": "Proceso exacto",
+    "title_regex": "Regex en título",
+}
+CATEGORY_LABELS = {
+    "productive": "Productiva",
+    "distractor": "Distractora",
+}
+LOG_LEVELS = ("INFO", "DEBUG", "WARNING", "ERROR")
+
+BUTTON_STYLE = """
+    QPushButton {
+        background: rgba(124,58,237,0.2);
+        color: white;
+        border: 1px solid rgba(124,58,237,0.4);
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background: rgba(124,58,237,0.3);
+    }
+"""
+
+
+class ConfigPage(QWidget):
+    """
+    Reglas de clasificación del usuario (tabla `rules`).
+    Cada cambio se guarda en la base de datos y se emite rules_edited con la
+    lista completa para que el CoreWorker recompile su matcher en caliente.
+    Debajo, el registro en memoria de core.log con su nivel.
+    """
+    rules_edited = Signal(list)  # [(id, kind, pattern, category, weight)]
+
+    def __init__(self):
+        super().__init__()
+        self.layout = QVBoxLayout()
+        self.setLayout(self.layout)
+
+        self._setup_ui()
+        self.load_rules()
+
+    def _setup_ui(self):
+        header_layout = QHBoxLayout()
+        title = QLabel("Reglas de Clasificación")
+        title.setStyleSheet("font-size: 24px; font-weight: bold;")
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+        self.layout.addLayout(header_layout)
+
+        hint = QLabel("Las reglas mandan sobre las listas por defecto. Si coinciden reglas de las dos "
+                      "categorías, gana la que sume más peso.")
+        hint.setWordWrap(True)
+        hint.setStyleSheet("color: #9aa0c7;")
+        self.layout.addWidget(hint)
+
+        # Tabla de reglas
+        self.rules_table = QTableWidget(0, 4)
+        self.rules_table.setHorizontalHeaderLabels(["Tipo", "Patrón", "Categoría", "Peso"])
+        self.rules_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.rules_table.verticalHeader().setVisible(False)
+        self.rules_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.rules_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.rules_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.rules_table.itemSelectionChanged.connect(self.on_rule_selected)
+        self.layout.addWidget(self.rules_table)
+
+        # Formulario: nueva regla / regla seleccionada
+        form_layout = QHBoxLayout()
+        self.kind_combo = QComboBox()
+        for kind in RULE_KINDS:
+            self.kind_combo.addItem(KIND_LABELS[kind], kind)
+        self.pattern_edit = QLineEdit()
+        self.pattern_edit.setPlaceholderText("youtube, code.exe, ^Jira - .*")
+        self.category_combo = QComboBox()
+        for category in RULE_CATEGORIES:
+            self.category_combo.addItem(CATEGORY_LABELS[category], category)
+        self.weight_spin = QDoubleSpinBox()
+        self.weight_spin.setRange(0.1, 100.0)
+        self.weight_spin.setSingleStep(0.5)
+        self.weight_spin.setValue(1.0)
+
+        form_layout.addWidget(self.kind_combo)
+        form_layout.addWidget(self.pattern_edit, 1)
+        form_layout.addWidget(self.category_combo)
+        form_layout.addWidget(self.weight_spin)
+        self.layout.addLayout(form_layout)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        add_btn = QPushButton("➕ Añadir")
+        add_btn.clicked.connect(self.add_rule)
+        self.update_btn = QPushButton("💾 Guardar cambios")
+        self.update_btn.clicked.connect(self.update_rule)
+        self.delete_btn = QPushButton("🗑️ Eliminar")
+        self.delete_btn.clicked.connect(self.delete_rule)
+        for btn in (add_btn, self.update_btn, self.delete_btn):
+            btn.setStyleSheet(BUTTON_STYLE)
+            buttons_layout.addWidget(btn)
+        self.layout.addLayout(buttons_layout)
+        self._set_selection_buttons(False)
+
+        # Registro (buffer en memoria de core.log)
+        log_header = QHBoxLayout()
+        log_title = QLabel("Registro")
+        log_title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        log_header.addWidget(log_title)
+        log_header.addStretch()
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(LOG_LEVELS)
+        self.log_level_combo.setCurrentText(log.get_level())
+        self.log_level_combo.currentTextChanged.connect(self.on_log_level_changed)
+        log_header.addWidget(self.log_level_combo)
+        refresh_log_btn = QPushButton("🔄 Actualizar")
+        refresh_log_btn.setStyleSheet(BUTTON_STYLE)
+        refresh_log_btn.clicked.connect(self.load_log)
+        log_header.addWidget(refresh_log_btn)
+        self.layout.addLayout(log_header)
+
+        self.log_view = QPlainTextEdit()
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(log.RING_SIZE)
+        self.layout.addWidget(self.log_view)
+
+    # ------------------ datos ------------------
+    def load_rules(self):
+        """Cargar las reglas desde la base de datos"""
+        self.rules = database.get_rules()
+        self.rules_table.setRowCount(len(self.rules))
+        for row, (rule_id, kind, pattern, category, weight) in enumerate(self.rules):
+            kind_item = QTableWidgetItem(KIND_LABELS.get(kind, kind))
+            kind_item.setData(Qt.UserRole, rule_id)
+            self.rules_table.setItem(row, 0, kind_item)
+            self.rules_table.setItem(row, 1, QTableWidgetItem(pattern))
+            self.rules_table.setItem(row, 2, QTableWidgetItem(CATEGORY_LABELS.get(category, category)))
+            self.rules_table.setItem(row, 3, QTableWidgetItem(f"{weight:g}"))
+        self.rules_table.clearSelection()
+        self._set_selection_buttons(False)
+
+    def _form_values(self, replacing=None):
+        """
+        Valores del formulario, validados junto con el resto de reglas (todas
+        se compilan juntas). `replacing`: id de la regla que se edita.
+        """
+        kind = self.kind_combo.currentData()
+        pattern = self.pattern_edit.text().strip()
+        category = self.category_combo.currentData()
+        weight = self.weight_spin.value()
+        validate_rule(kind, pattern, category, weight)
+        others = [r for r in self.rules if replacing is None or r[0] != replacing]
+        validate_rules(others + [(replacing, kind, pattern, category, weight)])
+        return kind, pattern, category, weight
+
+    def _selected_rule(self):
+        rows = self.rules_table.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.rules[rows[0].row()]
+
+    def _set_selection_buttons(self, enabled):
+        self.update_btn.setEnabled(enabled)
+        self.delete_btn.setEnabled(enabled)
+
+    def _rules_saved(self):
+        self.load_rules()
+        self.rules_edited.emit(list(self.rules))
+
+    def load_log(self):
+        """Volcar el buffer de registro (se formatea aquí, no al registrar)"""
+        self.log_view.setPlainText("\n".join(log.recent()))
+        self.log_view.verticalScrollBar().setValue(self.log_view.verticalScrollBar().maximum())
+
+    def on_log_level_changed(self, level):
+        log.set_level("", level)
+        self.load_log()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.load_log()
+
+    # ------------------ acciones ------------------
+    def on_rule_selected(self):
+        rule = self._selected_rule()
+        self._set_selection_buttons(rule is not None)
+        if rule is None:
+            return
+        _, kind, pattern, category, weight = rule
+        self.kind_combo.setCurrentIndex(self.kind_combo.findData(kind))
+        self.pattern_edit.setText(pattern)
+        self.category_combo.setCurrentIndex(self.category_combo.findData(category))
+        self.weight_spin.setValue(weight)
+
+    def add_rule(self):
+        try:
+            database.add_rule(*self._form_values())
+        except ValueError as e:
+            QMessageBox.warning(self, "Regla inválida", str(e))
+            return
+        self.pattern_edit.clear()
+        self._rules_saved()
+
+    def update_rule(self):
+        rule = self._selected_rule()
+        if rule is None:
+            return
+        try:
+            database.update_rule(rule[0], *self._form_values(replacing=rule[0]))
+        except ValueError as e:
+            QMessageBox.warning(self, "Regla inválida", str(e))
+            return
+        self._rules_saved()
+
+    def delete_rule(self):
+        rule = self._selected_rule()
+        if rule is None:
+            return
+        database.delete_rule(rule[0])
+        self.pattern_edit.clear()
+        self._rules_saved()
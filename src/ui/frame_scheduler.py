@@ -0,0 +1,70 @@
+# src/ui/frame_scheduler.py
+from typing import Any, Callable, Dict
+from PySide6.QtCore import QObject, QTimer
+from core.log import get_logger
+
+log = get_logger("ui")
+
+_UNSET = object()
+
+
+class FrameScheduler(QObject):
+    """
+    Bucle de refresco único de la GUI con dirty flags.
+    - register(key, render): render(valor) dibuja ese elemento
+    - mark(key, valor): guarda el último valor (pomodoro, core, tracker...) y
+      programa un frame; varias marcas entre frames se agrupan
+    - En cada frame solo se llama a render de las claves cuyo valor cambió
+      respecto al último dibujado: sin setText/update() redundantes
+    - Sin marcas no hay timer activo; set_paused(True) (ventana minimizada u
+      oculta) deja de dibujar y al reanudar se pinta una vez el último estado
+    """
+
+    def __init__(self, interval_ms: int = 100, parent=None):
+        super().__init__(parent)
+        self._renderers: Dict[str, Callable[[Any], None]] = {}
+        self._pending: Dict[str, Any] = {}
+        self._rendered: Dict[str, Any] = {}
+        self._paused = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.render)
+
+    def register(self, key: str, render: Callable[[Any], None]):
+        self._renderers[key] = render
+
+    def mark(self, key: str, value):
+        self._pending[key] = value
+        if not self._paused and not self._timer.isActive():
+            self._timer.start()
+
+    def set_paused(self, paused: bool):
+        if paused == self._paused:
+            return
+        self._paused = paused
+        if paused:
+            self._timer.stop()
+        elif self._pending:
+            self._timer.start()
+
+    @property
+    def paused(self) -> bool:
+        return self._paused
+
+    def render(self):
+        """Dibuja las claves pendientes cuyo valor cambió."""
+        if self._paused:
+            return
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            if self._rendered.get(key, _UNSET) == value:
+                continue
+            render = self._renderers.get(key)
+            if render is None:
+                continue
+            try:
+                render(value)
+                self._rendered[key] = value
+            except Exception as e:
+                log.error("error dibujando %s: %s", key, e)
@@ -1,8 +1,6 @@
 # src/ui/main_window.py
 import sys
 import os
-import time
-import re
 import datetime
 # permitir imports relativos desde src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -11,40 +9,67 @@ from ui.theme import ThemeManager
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QListWidget, QStackedWidget, QSlider, QComboBox,
+    QPushButton, QLabel, QListWidget, QListView, QStackedWidget, QSlider, QComboBox,
     QToolButton, QGraphicsDropShadowEffect, QSizePolicy
 )
-from PySide6.QtCore import Qt, Slot, QPointF, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QColor, QPainter, QPolygonF, QBrush, QFont, QPainterPath, QPen
-from PySide6.QtCharts import QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
+from PySide6.QtCore import Qt, Slot, Signal, QPointF, QTimer, QEvent
+from PySide6.QtGui import QIcon, QPixmap, QColor, QPainter, QPolygonF, QBrush, QFont, QFontMetrics, QPainterPath, QPen
 
 # Imports de los módulos core (esqueletos)
 from core.app_tracker import AppTracker
 from core.pomodoro import Pomodoro
 from core.audio_manager import AudioManager
-from core.focus_scorer import FocusScorer
+from core.core_worker import CoreWorker
 from core.notifier import Notifier
+from core.rescore_job import RescoreJob
+from core.session_journal import recover_interrupted
 from data import database
 
-# imports StatsPage y SessionsPage:
-from ui.sessions_page import SessionsPage
-from ui.stats_page import StatsPage
+# helpers de la GUI (Sesiones/Estadísticas/Configuración se importan al abrirlas)
+from ui.app_usage_model import AppUsageModel
+from ui.frame_scheduler import FrameScheduler
+from core.log import get_logger, configure as configure_logging
+
+log = get_logger("ui")
 
 
 # Nuevo helper: Background con patrón (dibujado por QPainter)
 
 class PatternBackground(QWidget):
-    """Widget contenedor que dibuja líneas asimétricas en el fondo."""
+    """
+    Widget contenedor que dibuja líneas asimétricas en el fondo.
+    El patrón es estático: se pinta una vez en un QPixmap por (tamaño, tema,
+    devicePixelRatio) y cada repintado solo copia el pixmap.
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
         self.dark_mode = True
+        self._cache = None
+        self._cache_key = None
 
     def set_dark_mode(self, is_dark):
         self.dark_mode = is_dark
         self.update()
 
     def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self.dark_mode, dpr)
+        if key != self._cache_key:
+            self._cache = self._render_pattern(dpr)
+            self._cache_key = key
         p = QPainter(self)
+        p.drawPixmap(0, 0, self._cache)
+        p.end()
+
+    def _render_pattern(self, dpr):
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        p = QPainter(pixmap)
+        self._draw_pattern(p)
+        p.end()
+        return pixmap
+
+    def _draw_pattern(self, p):
         p.setRenderHint(QPainter.Antialiasing)
 
         # Fondo base que cambia con el tema
@@ -116,12 +141,15 @@ class PatternBackground(QWidget):
             x = w * (0.7 + i * 0.15)
             p.drawLine(QPointF(x, h*0.6), QPointF(x, h*0.8))
 
-        p.end()
-
 
 # Score circular: CircleScore widget
 
 class CircleScore(QWidget):
+    """
+    Anillo de score. El disco de fondo se cachea en un QPixmap por (tamaño,
+    tema, devicePixelRatio); en cada paint solo se dibujan el arco y el texto
+    con pen, fuente y métricas creados una sola vez.
+    """
     def __init__(self, parent=None, size=120):
         super().__init__(parent)
         self._value = 100
@@ -129,18 +157,37 @@ class CircleScore(QWidget):
         self.dark_mode = True
         self.setFixedSize(size, size)
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self._font = QFont("Segoe UI", 11, QFont.Bold)
+        self._metrics = QFontMetrics(self._font)
+        self._arc_pen = QPen(QColor(124, 58, 237, 220))  # morado opaco
+        self._arc_pen.setWidth(8)
+        self._text_color = QColor(230, 230, 240)
+        self._cache = None
+        self._cache_key = None
 
     def set_dark_mode(self, is_dark):
         self.dark_mode = is_dark
         self.update()
 
     def setValue(self, v:int):
-        self._value = max(0, min(100, int(v)))
+        v = max(0, min(100, int(v)))
+        if v == self._value:
+            return
+        self._value = v
         self.update()
 
-    def paintEvent(self, event):
+    def _render_static(self, dpr):
+        """Disco de fondo (cambia con el tema)"""
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        self._draw_static(p)
+        p.end()
+        return pixmap
+
+    def _draw_static(self, p):
         r = min(self.width(), self.height())
-        p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing)
 
         # fondo circular que cambia con el tema
@@ -148,36 +195,40 @@ class CircleScore(QWidget):
         radius = r//2 - 2
         if self.dark_mode:
             bg_color = QColor(16, 11, 20)  # oscuro interior
-            text_color = QColor(230, 230, 240)
+            self._text_color = QColor(230, 230, 240)
         else:
             bg_color = QColor(245, 245, 250)  # claro interior
-            text_color = QColor(60, 60, 80)
-        
+            self._text_color = QColor(60, 60, 80)
+
         p.setBrush(QBrush(bg_color))
         p.setPen(QColor(0,0,0,0))
         p.drawEllipse(center, radius, radius)
 
-        # arco (progresivo) en morado
-        pen = p.pen()
-        pen.setWidth(8)
-        pen.setColor(QColor(124, 58, 237, 220))  # morado opaco
-        p.setPen(pen)
+    def paintEvent(self, event):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self.dark_mode, dpr)
+        if key != self._cache_key:
+            self._cache = self._render_static(dpr)
+            self._cache_key = key
+
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._cache)
+        p.setRenderHint(QPainter.Antialiasing)
 
-        # draw arc proportional to value (start at -90deg)
-        import math
+        # arco (progresivo) en morado, proporcional al valor (empieza en -90deg)
+        p.setPen(self._arc_pen)
         start_angle = -90
         span = int(360 * (self._value/100.0))
         p.drawArc(self.rect().adjusted(8,8,-8,-8), (start_angle)*16, -span*16)
 
         # Texto central - ASEGURARSE QUE NO TENGA FONDO
-        p.setPen(text_color)
-        font = QFont("Segoe UI", 11, QFont.Bold)
-        p.setFont(font)
+        p.setPen(self._text_color)
+        p.setFont(self._font)
         txt = f"{self._value}%"
-        metrics = p.fontMetrics()
-        tw = metrics.horizontalAdvance(txt)
-        th = metrics.height()
-        
+        tw = self._metrics.horizontalAdvance(txt)
+        th = self._metrics.height()
+        center = self.rect().center()
+
         # Dibujar texto SIN fondo
         p.setBackgroundMode(Qt.TransparentMode) 
         p.drawText(center.x() - tw/2, center.y() + th/4, txt)
@@ -187,13 +238,28 @@ class CircleScore(QWidget):
 
 # MAIN
 class FocuslyMain(QMainWindow):
-    def __init__(self):
+    # órdenes al CoreWorker (conexión en cola: se ejecutan en su hilo, en orden)
+    core_start = Signal(float, float, int)  # tracker.clock(), inicio (epoch), minutos objetivo
+    core_stop = Signal(float)  # tracker.clock() al pausar
+    core_save = Signal(str, str, int, int)  # inicio, fin, duración, segundos objetivo
+    core_reset = Signal()
+
+    def __init__(self, warmup=None):
         super().__init__()
         self.setWindowTitle("Focusly")
         self.setGeometry(300, 150, 1000, 620)
+
+        # warm-up (core.warmup.WarmupJob) lanzado durante el splash: normalmente
+        # ya terminó y solo se recogen sus resultados
+        if warmup is not None:
+            warmup.wait()
         
         # Inicializar DB PRIMERO
-        database.init_db()
+        if warmup is None or not warmup.db_ready:
+            database.init_db()
+            recovered = recover_interrupted()
+        else:
+            recovered = warmup.recovered
 
         # Theme manager ANTES de construir UI
         self.theme_manager = ThemeManager(QApplication.instance())
@@ -201,45 +267,55 @@ class FocuslyMain(QMainWindow):
         
         # Inicializar componentes core ANTES de UI (pero con valores por defecto)
         self.pomodoro = Pomodoro()
-        self.audio = AudioManager()
+        if warmup is not None:
+            self.audio = AudioManager(warmup.assets_root, warmup.categories, warmup.mixer_ready)
+        else:
+            self.audio = AudioManager()
         self._audio_paused = False
-        self.tracker = AppTracker(poll_interval=2.0)
-        self.scorer = FocusScorer()
-        self.notifier = Notifier()
-
-        self.app_history = {}  # { (proc, title): accumulated_seconds }
-        self.last_app_key = None
+        self.tracker = AppTracker(poll_interval=1.0, max_poll_interval=8.0, heartbeat_interval=5.0)
+        # scorer + motor de score viven en el hilo del CoreWorker; la GUI solo
+        # recibe snapshots (self.scorer queda para leer las listas de reglas)
+        self.core = CoreWorker(self.tracker, rules=warmup.rules if warmup is not None else None)
+        self.scorer = self.core.scorer
+        self.notifier = Notifier(warmup.notification_sound if warmup is not None else None)
 
         self.session_start_time = None
 
-        # Conectar notificaciones de distracciones Y score
-        def on_distraction_detected(proc, title, seconds):
-            if proc == "score_alert":
-                # Es una notificación de score, no de distracción específica
-                self.notifier.notify(title, kind="score_alert")  # title contiene el mensaje
-            else:
-                # Notificación de distracción normal
-                distraction_minutes = seconds / 60
-                message = f"Llevas {distraction_minutes:.1f} minutos en {proc}\n¡Vuelve a enfocarte!"
-                self.notifier.notify(message, kind="distraction")
+        # Conectar notificaciones de distracciones Y score (llegan del hilo del core)
+        self.core.distraction_detected.connect(self.on_distraction_detected)
 
-        self.scorer.distraction_detected.connect(on_distraction_detected)
+        # Recalcular scores históricos cuando cambian las reglas (agrupando
+        # varios cambios seguidos en un solo job)
+        self._rescore_job = None
+        self._rescore_pending = False
+        self._rescore_timer = QTimer(self)
+        self._rescore_timer.setSingleShot(True)
+        self._rescore_timer.setInterval(1500)
+        self._rescore_timer.timeout.connect(self._start_rescore)
+        self.core.rules_changed.connect(self._rescore_timer.start)
 
         # Estado para tracking
         self._tracker_running = False
-        self._last_active_proc = None
-        self._last_active_title = None
-        self._last_active_ts = None
+        # páginas pendientes de construir (índice -> factory); se rellena en
+        # _build_ui, pero setCurrentRow(0) ya llama a on_nav_changed antes
+        self._page_factories = {}
         
-        # Configurar scorer
+        # Configurar scorer (antes de arrancar el hilo del core)
         self.scorer.distractor_threshold_seconds = 60
         self.scorer.window_seconds = 25 * 60
         self.timer_duration = 25 * 60
 
-        print(f"[INIT] Scorer iniciado - Último notificado: {self.scorer.last_notified_score}%")
+        log.debug("Scorer iniciado - último notificado: %s%%", self.scorer.last_notified_score)
 
         # Construir UI DESPUÉS de tener todos los componentes
         self._build_ui()
+
+        # Un solo refresco de la GUI: pomodoro y core marcan valores y se
+        # dibujan como mucho una vez por frame, solo si cambiaron
+        self.frames = FrameScheduler(interval_ms=100, parent=self)
+        self.frames.register("timer", self.label_timer.setText)
+        self.frames.register("progress", self._render_progress)
+        self.frames.register("score", self._render_score)
         
         self.theme_manager.set_pattern_background(self.centralWidget())  # central es el PatternBackground
         self.theme_manager.set_circle_score(self.circle_score)
@@ -250,70 +326,72 @@ class FocuslyMain(QMainWindow):
             self.setWindowIcon(QIcon(icon_path))
 
         # Conectar signals DESPUÉS de construir UI
-        self.tracker.active_changed.connect(self.on_active_changed)
+        # los eventos del tracker van directos al hilo del core, sin pasar por la GUI
+        self.tracker.active_changed.connect(self.core.on_active_changed)
+        self.tracker.active_interval.connect(self.core.on_active_interval)
+        self.core_start.connect(self.core.start_tracking)
+        self.core_stop.connect(self.core.stop_tracking)
+        self.core_save.connect(self.core.save_session)
+        self.core_reset.connect(self.core.reset_session)
+        self.core.snapshot.connect(self.on_core_snapshot)
+        self.core.session_saved.connect(self.on_session_saved)
         self.pomodoro.tick.connect(self.on_tick)
         self.pomodoro.finished.connect(self.on_pomodoro_finished)
         self.notifier.notify_signal.connect(self.on_notify)
+        self.core.start()
         
         # Forzar una actualización inicial
-        self.label_timer.setText(self.pomodoro.format_time())
-
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.force_score_update)
-        self.update_timer.start(5000)  # Actualizar cada 5 segundos
-
-    # Nuevo método:
-    def force_score_update(self):
-        """Forzar actualización del score cada X segundos"""
-        try:
-            print(f"[DEBUG] Force update - Historial tiene {len(self.scorer.history)} eventos")
-            score = self.get_progressive_score()
-            print(f"[DEBUG] Score actual: {score}%")
-            
-            if hasattr(self, "label_score"):
-                self.label_score.setText(f"Score: {score}")
-            if hasattr(self, "circle_score"):
-                self.circle_score.setValue(score)
-        except Exception as e:
-            print("[DEBUG] Error actualizando score:", e)
-
+        self.frames.mark("timer", self.pomodoro.format_time())
+
+        if recovered is not None:
+            _, duration, score = recovered
+            QTimer.singleShot(0, lambda: self.notifier.notify(
+                f"Se recuperó una sesión interrumpida ({duration // 60} min, score {score}%)", kind="info"))
+
+    @Slot(dict)
+    def on_core_snapshot(self, snap):
+        """Snapshot coalescido del CoreWorker: apps al modelo, score al próximo frame."""
+        for process, title, seconds in snap["events"]:
+            self.app_model.add_time(process, title, seconds)
+        self.frames.mark("score", snap["score"])
+
+    # ---------- render (llamados por FrameScheduler) ----------
+    def _render_score(self, score):
+        self.label_score.setText(f"Score: {score}")
+        self.circle_score.setValue(score)
+
+    def _render_progress(self, percent):
+        if hasattr(self, "session_progress"):
+            self.session_progress.setValue(percent)
+
+    def changeEvent(self, event):
+        # minimizada: no dibujar nada hasta volver
+        if event.type() == QEvent.WindowStateChange:
+            self.frames.set_paused(self.isMinimized() or not self.isVisible())
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.frames.set_paused(self.isMinimized())
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.frames.set_paused(True)
+
+    @Slot(str, str, int)
+    def on_distraction_detected(self, proc, title, seconds):
+        if proc == "score_alert":
+            # Es una notificación de score, no de distracción específica
+            self.notifier.notify(title, kind="score_alert")  # title contiene el mensaje
+        else:
+            # Notificación de distracción normal
+            distraction_minutes = seconds / 60
+            message = f"Llevas {distraction_minutes:.1f} minutos en {proc}\n¡Vuelve a enfocarte!"
+            self.notifier.notify(message, kind="distraction")
 
-    def get_progressive_score(self):
-        """Score por puntos - cada minuto de distracción quita puntos fijos"""
-        try:
-            target_minutes = self.input_minutes.value()
-            
-            # Calcular tiempo transcurrido
-            if hasattr(self, 'session_start_time') and self.session_start_time:
-                elapsed = (datetime.datetime.now() - self.session_start_time).total_seconds()
-            else:
-                elapsed = getattr(self.pomodoro, 'elapsed_seconds', 0)
-            
-            if elapsed < 10:
-                return 100
-            
-            # Calcular tiempo en distracciones (en minutos)
-            distracting_time = 0
-            for (proc, title), seconds in self.app_history.items():
-                if self.scorer._is_distractor_by_name(proc, title):
-                    distracting_time += seconds
-            
-            distracting_minutes = distracting_time / 60
-            
-            print(f"[SCORE PUNTOS] Objetivo: {target_minutes}min | Distracción: {distracting_minutes:.1f}min")
-            
-            # ⭐⭐ SISTEMA DE PUNTOS SUPER SIMPLE ⭐⭐
-            # Cada minuto de distracción quita puntos según la duración objetivo:
-            points_per_distraction_minute = 100 / target_minutes
-            
-            score = max(0, 100 - int(distracting_minutes * points_per_distraction_minute))
-            
-            print(f"[SCORE PUNTOS] Puntos/min: {points_per_distraction_minute:.1f} | Score: {score}%")
-            return score
-            
-        except Exception as e:
-            print("[DEBUG] Error calculando score:", e)
-            return 100
+    @Slot(int, int)
+    def on_session_saved(self, session_id, final_score):
+        log.info("Sesión guardada en el core - ID: %s, Score: %s%%", session_id, final_score)
 
     def _on_category_changed(self, category):
         """Método reutilizable para rellenar pistas desde fuera."""
@@ -341,7 +419,7 @@ class FocuslyMain(QMainWindow):
             if self.track_selector.count() > 0:
                 self.track_selector.setCurrentIndex(0)
         except Exception as e:
-            print("[Audio] _on_category_changed error:", e)
+            log.error("_on_category_changed error: %s", e)
 
     def _on_track_changed(self, track):
         """Reproduce un track dado (track = filename)."""
@@ -366,10 +444,10 @@ class FocuslyMain(QMainWindow):
                 if os.path.exists(p):
                     self.audio.play(p)
         except Exception as e:
-            print("[Audio] _on_track_changed error:", e)
+            log.error("_on_track_changed error: %s", e)
 
     def _build_ui(self):
-        print("[DEBUG] Iniciando _build_ui...")
+        log.debug("Iniciando _build_ui...")
         # --- central con pattern background ---
         central = PatternBackground()
         main_layout = QHBoxLayout()
@@ -583,7 +661,14 @@ class FocuslyMain(QMainWindow):
         # ----------------- RIGHT COLUMN: monitor + score -----------------
         right_col = QVBoxLayout()
         right_col.addWidget(QLabel("Monitor de Apps (en vivo)"))
-        self.list_apps = QListWidget()
+        # una fila por app con su tiempo acumulado (modelo/vista: solo se
+        # repinta la fila que cambió)
+        self.app_model = AppUsageModel(self)
+        self.list_apps = QListView()
+        self.list_apps.setObjectName("app_monitor")
+        self.list_apps.setModel(self.app_model)
+        self.list_apps.setUniformItemSizes(True)
+        self.list_apps.setEditTriggers(QListView.NoEditTriggers)
         right_col.addWidget(self.list_apps)
 
         # CircleScore
@@ -665,7 +750,7 @@ class FocuslyMain(QMainWindow):
                             if f.lower().endswith((".wav", ".mp3", ".ogg")):
                                 tracks.append(f)
             except Exception as e:
-                print("[DEBUG] Error llenando tracks:", e)
+                log.error("Error llenando tracks: %s", e)
                 tracks = []
 
             # poner items legibles en el combobox y guardar filename en data
@@ -722,31 +807,64 @@ class FocuslyMain(QMainWindow):
                             try:
                                 self.audio.play(p)
                             except Exception as e:
-                                print("[Audio] play fallback error:", e)
+                                log.error("play fallback error: %s", e)
             except Exception as e:
-                print("[Audio] on_track_selected error:", e)
+                log.error("on_track_selected error: %s", e)
 
         self.track_selector.currentIndexChanged.connect(_on_track_selected)
         
-        # Crear las páginas reales
-        self.sessions_page = SessionsPage()      # Índice 1
-        self.stats_page = StatsPage(self.theme_manager)   # Pasar el theme_manager
+        # Sesiones, estadísticas y configuración se construyen al navegar a
+        # ellas por primera vez (_ensure_page): QtCharts y las consultas a la
+        # base de datos no cuentan en el arranque
+        self.sessions_page = None                # Índice 1
+        self.stats_page = None                   # Índice 2
         self.presets_page = QWidget()            # Índice 3 - Presets
-        self.config_page = QWidget()             # Índice 4 - Configuración
+        self.config_page = None                  # Índice 4
+        self._page_factories = {
+            1: self._create_sessions_page,
+            2: self._create_stats_page,
+            4: self._create_config_page,
+        }
 
         # Añadir páginas al stack
         self.stack.addWidget(self.page_dashboard)    # Índice 0 - Dashboard
-        self.stack.addWidget(self.sessions_page)     # Índice 1 - Sesiones  
-        self.stack.addWidget(self.stats_page)        # Índice 2 - Estadísticas
+        self.stack.addWidget(QWidget())              # Índice 1 - Sesiones (pendiente)
+        self.stack.addWidget(QWidget())              # Índice 2 - Estadísticas (pendiente)
         self.stack.addWidget(self.presets_page)      # Índice 3 - Presets
-        self.stack.addWidget(self.config_page)       # Índice 4 - Configuración
+        self.stack.addWidget(QWidget())              # Índice 4 - Configuración (pendiente)
 
         # Setup de las páginas
         self._setup_presets_page()
-        self._setup_config_page()
 
     # ========== SETUP FUNCTIONS FOR PAGES ==========
 
+    def _ensure_page(self, index):
+        """Construye la página `index` si aún es un placeholder."""
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return
+        page = factory()
+        placeholder = self.stack.widget(index)
+        self.stack.insertWidget(index, page)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+
+    def _create_sessions_page(self):
+        from ui.sessions_page import SessionsPage  # QtCharts solo al abrir la página
+        self.sessions_page = SessionsPage()
+        return self.sessions_page
+
+    def _create_stats_page(self):
+        from ui.stats_page import StatsPage
+        self.stats_page = StatsPage(self.theme_manager)   # Pasar el theme_manager
+        return self.stats_page
+
+    def _create_config_page(self):
+        from ui.config_page import ConfigPage
+        self.config_page = ConfigPage()
+        self.config_page.rules_edited.connect(self.core.set_rules)
+        return self.config_page
+
     def _setup_presets_page(self):
         """Página de Presets - Placeholder"""
         layout = QVBoxLayout()
@@ -774,33 +892,6 @@ class FocuslyMain(QMainWindow):
         container_layout.addWidget(soon_label)
         layout.addWidget(container)
 
-    def _setup_config_page(self):
-        """Página de Configuración - Placeholder"""
-        layout = QVBoxLayout()
-        self.config_page.setLayout(layout)
-        
-        # Widget contenedor con estilo
-        container = QWidget()
-        container.setObjectName("soon_container")
-        container_layout = QVBoxLayout()
-        container.setLayout(container_layout)
-        
-        # Cargar imagen "pronto.png" desde assets
-        soon_label = QLabel()
-        icon_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "assets", "pronto.png"))
-        if os.path.exists(icon_path):
-            soon_pixmap = QPixmap(icon_path).scaled(600, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            soon_label.setPixmap(soon_pixmap)
-        else:
-            soon_label.setText("Pronto")
-            soon_label.setStyleSheet("font-size: 48px; color: rgba(124,58,237,0.7); font-weight: bold;")
-        
-        soon_label.setAlignment(Qt.AlignCenter)
-        soon_label.setObjectName("soon_label")
-        
-        container_layout.addWidget(soon_label)
-        layout.addWidget(container)
-
     # ---------- Slots / callbacks ----------
 
     @Slot()
@@ -820,21 +911,24 @@ class FocuslyMain(QMainWindow):
                         if hasattr(self.audio, "play_track"):
                             self.audio.play_track(cat, filename)
                         else:
-                            print("[WARN] audio.play_track no disponible")
+                            log.warning("audio.play_track no disponible")
         except Exception as e:
-            print("[WARN] audio start/resume error:", e)
+            log.warning("audio start/resume error: %s", e)
 
         # Resto del código igual...
         self.pomodoro.start()
 
-        #GUARDAR TIEMPO DE INICIO
-        self.session_start_time = datetime.datetime.now()
-        print(f"⏰ [SESSION] Inicio guardado: {self.session_start_time}")
+        #GUARDAR TIEMPO DE INICIO (solo al empezar: reanudar sigue la misma sesión)
+        if self.session_start_time is None:
+            self.session_start_time = datetime.datetime.now()
+            log.info("Inicio de sesión: %s", self.session_start_time)
         
+        # avisar al core ANTES de reanudar el tracker para no perder el primer evento
+        self.core_start.emit(self.tracker.clock(), self.session_start_time.timestamp(),
+                             int(self.input_minutes.value()))
         if not self._tracker_running:
-            self.tracker.start()
+            self.tracker.resume()  # el hilo es persistente: solo se reanuda
             self._tracker_running = True
-            self._last_active_ts = time.time()
 
 
     @Slot()
@@ -845,7 +939,7 @@ class FocuslyMain(QMainWindow):
             self.audio.pause_all()
             self._audio_paused = True
         except Exception as e:
-            print("[WARN] audio pause error:", e)
+            log.warning("audio pause error: %s", e)
         # detener tracker y salvar último intervalo
         self._stop_tracker_and_flush()
 
@@ -853,31 +947,27 @@ class FocuslyMain(QMainWindow):
     @Slot()
     def on_reset(self):
         self.pomodoro.reset()
-        self.label_timer.setText(self.pomodoro.format_time())
+        self.frames.mark("timer", self.pomodoro.format_time())
         try:
             self.audio.stop_all()
             self._audio_paused = False
         except Exception as e:
-            print("[WARN] audio stop error:", e)
+            log.warning("audio stop error: %s", e)
+        
+        # detener tracker y flush ANTES de guardar/limpiar
+        self._stop_tracker_and_flush()
         
         # RESETEAR TIEMPO DE INICIO
         self.session_start_time = None
         
         # GUARDAR SESIÓN TAMBIÉN EN RESET SI HAY TIEMPO
         if hasattr(self.pomodoro, 'elapsed_seconds') and self.pomodoro.elapsed_seconds > 30:
-            print("[DEBUG] Reset con tiempo acumulado - Guardando sesión...")
+            log.debug("Reset con tiempo acumulado - guardando sesión")
             self._save_session()
         
-        # Resetear notificaciones de score
-        self.scorer.last_notified_score = 100
-        
-        # Limpiar historial de apps
-        self.list_apps.clear()
-        self.last_app_key = None
-        self.app_history.clear()
-        
-        # detener tracker y flush
-        self._stop_tracker_and_flush()
+        # Limpiar historial de apps (el core resetea también las notificaciones de score)
+        self.app_model.clear()
+        self.core_reset.emit()
 
 
     @Slot(int)
@@ -887,211 +977,84 @@ class FocuslyMain(QMainWindow):
         try:
             self.audio.set_master_volume(volume)
         except Exception as e:
-            print("[WARN] Error cambiando volumen:", e)
+            log.warning("Error cambiando volumen: %s", e)
 
     @Slot(int, int)
     def on_tick(self, minutes, seconds):
-        """Actualiza el timer visual desde la señal del pomodoro y refresca el score."""
-        # actualiza el timer grande
-        try:
-            self.label_timer.setText(f"{minutes:02d}:{seconds:02d}")
-        except Exception:
-            pass
+        """Marca el timer (y el progreso) para el próximo frame; el score llega por snapshot."""
+        self.frames.mark("timer", f"{minutes:02d}:{seconds:02d}")
 
-        # actualizar progress si existe
+        # progreso de la sesión
         try:
             total = getattr(self.pomodoro, "total_seconds", None)
             remaining = getattr(self.pomodoro, "remaining", None)
-            if total and remaining is not None and hasattr(self, "session_progress"):
+            if total and remaining is not None:
                 done = total - remaining
-                percent = int((done / total) * 100) if total > 0 else 0
-                self.session_progress.setValue(percent)
+                self.frames.mark("progress", int((done / total) * 100) if total > 0 else 0)
         except Exception:
             pass
 
-        # ---- actualizar score usando el nuevo método progresivo ----
-        try:
-            score = self.get_progressive_score()   #
-            # actualizar label y círculo (si existen)
-            if hasattr(self, "label_score"):
-                self.label_score.setText(f"Score: {score}")
-            if hasattr(self, "circle_score"):
-                self.circle_score.setValue(score)
-
-            self.scorer._check_score_notification(score)
-        except Exception as e:
-            # no queremos romper el tick por un fallo en scorer
-            print("[WARN] on_tick -> error actualizando score:", e)
-
-
 
     @Slot()
     def on_pomodoro_finished(self):
-        print("🎯 [DEBUG] on_pomodoro_finished SE EJECUTÓ")
-        print(f"🎯 [DEBUG] Tiempo transcurrido ANTES de notificar: {getattr(self.pomodoro, 'elapsed_seconds', 'NO EXISTE')}")
+        log.debug("on_pomodoro_finished")
+        log.debug("Tiempo transcurrido antes de notificar: %s", getattr(self.pomodoro, 'elapsed_seconds', None))
         
         self.notifier.notify("Pomodoro terminado", kind="info")
         self.audio.stop_all()
         
-        # ⭐⭐ GUARDAR SESIÓN AL TERMINAR ⭐⭐
-        self._save_session()
-        
-        # flush final intervalo
+        # flush final intervalo (para que entre en la sesión guardada)
         self._stop_tracker_and_flush()
-
-    @Slot(str, str)
-    def on_active_changed(self, process, title):
-        """
-        Este slot es llamado por AppTracker cuando cambia la ventana activa.
-        """
-        now = time.time()
-        
-        # Si hay un último proceso conocido, calcular delta y enviar al scorer
-        if self._last_active_proc is not None and self._last_active_ts is not None:
-            delta = int(now - self._last_active_ts)
-            if delta > 1:  # Solo si el delta es significativo (más de 1 segundo)
-                self.scorer.push_active(self._last_active_proc, self._last_active_title, delta)
         
-        # Actualizar el último proceso
-        self._last_active_proc = process or ""
-        self._last_active_title = title or ""
-        self._last_active_ts = now
-        
-        # Actualizar lista visual COMPACTADA
-        self._update_compact_app_list(process, title)
-
-    def _update_compact_app_list(self, process, title):
-        """Actualiza la lista de apps de forma compacta mostrando tiempo acumulado"""
-        try:
-            current_key = (process or "unknown", title or "")
-            
-            if current_key not in self.app_history:
-                self.app_history[current_key] = 0
-            self.app_history[current_key] += 2  # Sumar 2 segundos (intervalo del tracker)
-            
-            print(f"[DEBUG] App history: {len(self.app_history)} apps, {self.app_history.get(current_key, 0)}s en {current_key}")
-
-            # Si es la misma app que la última, actualizar tiempo
-            if current_key == self.last_app_key and self.list_apps.count() > 0:
-                # Actualizar el último item
-                last_item = self.list_apps.item(0)
-                if last_item:
-                    current_text = last_item.text()
-                    # Extraer el tiempo actual y sumar 2 segundos (intervalo del tracker)
-                    if "| T:" in current_text:
-                        parts = current_text.split("| T:")
-                        if len(parts) == 2:
-                            base_text = parts[0].strip()
-                            # Buscar el tiempo en el texto
-                            time_match = re.search(r'(\d+)s', parts[1])
-                            if time_match:
-                                current_seconds = int(time_match.group(1)) + 2
-                                new_text = f"{base_text} | T: {current_seconds}s"
-                                last_item.setText(new_text)
-                    return
-            
-            # Si es una app nueva, resetear last_app_key y agregar nueva línea
-            self.last_app_key = current_key
-            
-            # Formatear el texto de la app
-            proc_display = process or "unknown"
-            title_display = title or ""
-            
-            # Limitar longitud del título si es muy largo
-            if len(title_display) > 40:
-                title_display = title_display[:37] + "..."
-            
-            item_text = f"{proc_display} | {title_display} | T: 2s"
-            
-            # Insertar al inicio
-            self.list_apps.insertItem(0, item_text)
-            
-            # Limitar a 20 items máximo
-            if self.list_apps.count() > 20:
-                self.list_apps.takeItem(20)
-                
-        except Exception as e:
-            print(f"[AppList] Error actualizando lista: {e}")
+        # ⭐⭐ GUARDAR SESIÓN AL TERMINAR ⭐⭐
+        self._save_session()
 
     def _stop_tracker_and_flush(self):
         """
-        Detener el tracker (si está corriendo) y enviar el último intervalo
+        Pausar el tracker (si está corriendo) y enviar el último intervalo
         que quedó abierto hasta el momento de detenerlo.
         """
         if self._tracker_running:
-            # calcular delta final
-            now = time.time()
-            if self._last_active_proc is not None and self._last_active_ts is not None:
-                delta = int(now - self._last_active_ts)
-                if delta > 0:
-                    self.scorer.push_active(self._last_active_proc, self._last_active_title, seconds=delta)
-
+            self._tracker_running = False
             try:
-                self.tracker.stop()
+                self.tracker.pause()  # no bloquea: el hilo queda dormido
             except Exception:
                 pass
-            self._tracker_running = False
-            self._last_active_proc = None
-            self._last_active_title = None
-            self._last_active_ts = None
+            # el core cierra el tramo abierto hasta este instante (delta final)
+            self.core_stop.emit(self.tracker.clock())
 
     def _save_session(self):
         """Guardar datos de la sesión completada"""
         try:
-            print("[DEBUG] Ejecutando _save_session...")
+            log.debug("Ejecutando _save_session")
             
             # CALCULAR DURACIÓN MANUALMENTE
             if self.session_start_time:
                 end_time = datetime.datetime.now()
                 duration = int((end_time - self.session_start_time).total_seconds())
                 start_time = self.session_start_time
-                print(f"⏰ [SESSION] Duración manual: {duration}s (desde {start_time})")
+                log.debug("Duración manual: %ss (desde %s)", duration, start_time)
             else:
                 # Fallback al método del pomodoro
                 duration = getattr(self.pomodoro, 'elapsed_seconds', 0)
                 start_time = datetime.datetime.now() - datetime.timedelta(seconds=duration)
                 end_time = datetime.datetime.now()
-                print(f"⏰ [SESSION] Duración fallback: {duration}s")
+                log.debug("Duración fallback: %ss", duration)
             
             if duration < 10:  # Menos de 10 segundos no guardar
-                print(f"❌ [SESSION] Duración muy corta ({duration}s), no se guarda sesión")
+                log.info("Duración muy corta (%ss), no se guarda sesión", duration)
                 return
                 
-            final_score = self.get_progressive_score()
-            
-            print(f"✅ [SESSION] Guardando sesión - Duración: {duration}s, Score: {final_score}%")
-            
-            # Preparar datos de apps
-            app_data = []
-            if hasattr(self, 'app_history'):
-                for (proc, title), seconds in self.app_history.items():
-                    if seconds > 5:  # Solo apps con más de 5 segundos
-                        app_data.append((proc, title, seconds))
-            
-            print(f"📱 [SESSION] Apps registradas: {len(app_data)}")
-            
-            # Guardar en base de datos
-            apps_used_str = ", ".join([f"{proc}({secs}s)" for proc, title, secs in app_data[:5]])
-            session_id = database.save_session(
-                start_time.isoformat(),
-                end_time.isoformat(),
-                duration,
-                final_score,
-                apps_used_str
-            )
-            
-            # Guardar apps individuales
-            database.save_session_apps(session_id, app_data)
-            
-            print(f"🎉 [SESSION] Sesión guardada - ID: {session_id}, Duración: {duration}s, Score: {final_score}%")
+            # el core calcula el score final (el mismo del anillo, con el último
+            # flush ya aplicado: las órdenes se procesan en orden) y guarda
+            self.core_save.emit(start_time.isoformat(), end_time.isoformat(), int(duration),
+                                int(self.input_minutes.value()) * 60)
             
             # ⭐⭐ RESETEAR TIEMPO DE INICIO ⭐⭐
             self.session_start_time = None
             
         except Exception as e:
-            print(f"❌ [SESSION] Error guardando sesión: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error guardando sesión: %s", e)
 
 
     def _apply_timer_from_input(self):
@@ -1112,27 +1075,23 @@ class FocuslyMain(QMainWindow):
                 if hasattr(self.pomodoro, "total_seconds"):
                     self.pomodoro.total_seconds = seconds
         except Exception as e:
-            print("[WARN] no se pudo setear la duración en Pomodoro:", e)
+            log.warning("no se pudo setear la duración en Pomodoro: %s", e)
 
         # actualizar display grande
         mm = minutes
-        self.label_timer.setText(f"{mm:02d}:00")
-        # si tienes progress bar, resetearla aquí (si aplica):
-        try:
-            if hasattr(self, "session_progress"):
-                self.session_progress.setValue(0)
-        except Exception:
-            pass
+        self.frames.mark("timer", f"{mm:02d}:00")
+        self.frames.mark("progress", 0)
 
 
     @Slot(str, str)
     def on_notify(self, kind, message):
         # placeholder: mostrar en console por ahora
-        print(f"[NOTIFY] {kind}: {message}")
+        log.debug("notify %s: %s", kind, message)
 
 
     @Slot(int)
     def on_nav_changed(self, index):
+        self._ensure_page(index)
         self.stack.setCurrentIndex(index)
         # si estamos en Dashboard (index == 0) dejar el timer centrado
         if hasattr(self, "dash_layout") and hasattr(self, "timer_card"):
@@ -1150,6 +1109,57 @@ class FocuslyMain(QMainWindow):
                 self.dash_layout.setStretch(1, 1)
 
 
+    # ---------- Re-score de sesiones guardadas ----------
+    def _start_rescore(self):
+        """Lanza el recálculo de scores; si ya hay uno en curso, lo repite al terminar."""
+        if self._rescore_job is not None and self._rescore_job.isRunning():
+            self._rescore_pending = True
+            return
+        self._rescore_pending = False
+        job = RescoreJob(self.scorer.productive, self.scorer.distractors, self)
+        job.progress.connect(self._on_rescore_progress)
+        job.done.connect(self._on_rescore_done)
+        job.finished.connect(self._on_rescore_finished)
+        self._rescore_job = job
+        job.start()
+
+    @Slot(int, str)
+    def _on_rescore_progress(self, percent, message):
+        log.debug("rescore %s%% %s", percent, message)
+
+    @Slot(int)
+    def _on_rescore_done(self, count):
+        log.info("%d sesiones recalculadas", count)
+        try:
+            # las páginas aún no construidas leerán los scores nuevos al abrirse
+            if self.sessions_page is not None:
+                self.sessions_page.load_sessions()
+            if self.stats_page is not None:
+                self.stats_page.load_stats()
+        except Exception as e:
+            log.warning("refresco tras rescore: %s", e)
+
+    @Slot()
+    def _on_rescore_finished(self):
+        if self._rescore_pending:
+            self._start_rescore()
+
+    def closeEvent(self, event):
+        """Al cerrar la app, terminar los hilos del tracker y del core (y esperar un rescore en curso) y cerrar la base de datos."""
+        try:
+            self.tracker.shutdown()
+        except Exception as e:
+            log.warning("tracker shutdown error: %s", e)
+        try:
+            self.core.shutdown()
+        except Exception as e:
+            log.warning("core shutdown error: %s", e)
+        self._rescore_timer.stop()
+        if self._rescore_job is not None:
+            self._rescore_job.wait()
+        database.close()
+        super().closeEvent(event)
+
     # Theme toggle slot
     def on_toggle_theme(self):
         # alterna tema y cambia el icono/texto del botón
@@ -1161,7 +1171,8 @@ class FocuslyMain(QMainWindow):
 
 
 if __name__ == "__main__":
-    print(">>> main_window.py arrancó")
+    configure_logging()
+    log.debug("main_window.py arrancó")
     app = QApplication(sys.argv)
     window = FocuslyMain()
     window.show()
@@ -1,4 +1,7 @@
 # src/ui/run_app.py
+import time
+_T_START = time.perf_counter()  # tiempos de arranque (ver log "Arranque")
+
 import sys
 import os
 
@@ -9,6 +12,9 @@ sys.path.insert(0, current_dir)
 sys.path.insert(0, parent_dir)
 
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
+from core import log
+from core.warmup import WarmupJob
 
 # IMPORT CORREGIDO - funciona en .exe y desarrollo
 try:
@@ -20,15 +26,30 @@ except ImportError:
     from ui.splash import SplashDialog
     from ui.main_window import FocuslyMain
 
+def _ms_since(t0):
+    return (time.perf_counter() - t0) * 1000
+
+
 if __name__ == "__main__":
+    log.configure()
+    startup_log = log.get_logger("ui")
     app = QApplication(sys.argv)
 
     splash = SplashDialog()
+    # base de datos, mixer y sonidos se preparan mientras el splash espera
+    warmup = WarmupJob()
+    warmup.start()
+    # singleShot(0) corre cuando el event loop ya procesó el show
+    QTimer.singleShot(0, lambda: startup_log.info("Arranque: splash visible en %.0f ms", _ms_since(_T_START)))
     result = splash.exec()
 
     if result == 1:
-        window = FocuslyMain()
+        t_main = time.perf_counter()
+        window = FocuslyMain(warmup=warmup)
         window.show()
+        QTimer.singleShot(0, lambda: startup_log.info(
+            "Arranque: ventana principal visible en %.0f ms desde el splash", _ms_since(t_main)))
         sys.exit(app.exec())
     else:
+        warmup.wait()
         sys.exit(0)
\ No newline at end of file
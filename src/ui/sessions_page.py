@@ -2,11 +2,14 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                               QListWidget, QPushButton, QTextEdit, QSplitter,
                               QMessageBox, QScrollArea)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPainter
+from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
 from data import database
+from core.log import get_logger
 import datetime
-import sqlite3
-import os
+
+log = get_logger("ui")
 
 class SessionsPage(QWidget):
     def __init__(self):
@@ -94,6 +97,32 @@ class SessionsPage(QWidget):
 
         details_layout.addWidget(self.session_details)
 
+        # Evolución del score durante la sesión (session_timelines)
+        self.timeline_series = QLineSeries()
+        self.timeline_series.setColor("#7c3aed")
+        timeline_chart = QChart()
+        timeline_chart.addSeries(self.timeline_series)
+        timeline_chart.setTitle("Score durante la sesión")
+        timeline_chart.legend().hide()
+
+        self.timeline_axis_x = QValueAxis()
+        self.timeline_axis_x.setTitleText("min")
+        self.timeline_axis_x.setLabelFormat("%d")
+        timeline_chart.addAxis(self.timeline_axis_x, Qt.AlignBottom)
+        self.timeline_series.attachAxis(self.timeline_axis_x)
+
+        timeline_axis_y = QValueAxis()
+        timeline_axis_y.setRange(0, 100)
+        timeline_axis_y.setLabelFormat("%d")
+        timeline_chart.addAxis(timeline_axis_y, Qt.AlignLeft)
+        self.timeline_series.attachAxis(timeline_axis_y)
+
+        self.timeline_view = QChartView(timeline_chart)
+        self.timeline_view.setRenderHint(QPainter.Antialiasing)
+        self.timeline_view.setMinimumHeight(220)
+        self.timeline_view.hide()
+        details_layout.addWidget(self.timeline_view)
+
         splitter.addWidget(sessions_container)
         splitter.addWidget(self.details_widget)
 
@@ -109,6 +138,7 @@ class SessionsPage(QWidget):
         if not sessions:
             self.sessions_list.addItem("No hay sesiones guardadas todavía")
             self.session_details.clear()
+            self.timeline_view.hide()
             return
         
         for session in sessions:
@@ -133,14 +163,8 @@ class SessionsPage(QWidget):
     def on_session_selected(self, item):
         """Mostrar detalles de la sesión seleccionada"""
         session_id = item.data(Qt.UserRole)
-        sessions = database.get_all_sessions()
-        
-        # Encontrar la sesión seleccionada
-        selected_session = None
-        for session in sessions:
-            if session[0] == session_id:
-                selected_session = session
-                break
+        # Buscar solo la sesión seleccionada (por clave primaria)
+        selected_session = database.get_session(session_id) if session_id is not None else None
         
         if selected_session:
             session_id, start_time, end_time, duration, score, apps_used = selected_session
@@ -225,7 +249,20 @@ class SessionsPage(QWidget):
 </div>
 """
             self.session_details.setHtml(details)
-            
+            self._show_timeline(session_id)
+
+    def _show_timeline(self, session_id):
+        """Dibujar el timeline del score (una sola lectura por session_id)"""
+        timeline = database.get_session_timeline(session_id)
+        if not timeline or not timeline[1]:
+            # sesiones guardadas antes de existir session_timelines
+            self.timeline_view.hide()
+            return
+        interval, samples = timeline
+        self.timeline_series.replace([QPointF(i * interval / 60, score) for i, score in enumerate(samples)])
+        self.timeline_axis_x.setRange(0, max(1, (len(samples) - 1) * interval / 60))
+        self.timeline_view.show()
+
     def clear_history(self):
         """Limpiar todo el historial de sesiones"""
         reply = QMessageBox.question(self, "Limpiar Historial", 
@@ -235,23 +272,17 @@ class SessionsPage(QWidget):
         
         if reply == QMessageBox.Yes:
             try:
-                # Eliminar archivo de base de datos
-                db_path = os.path.join(os.path.dirname(__file__), "..", "..", "focusly.db")
-                if os.path.exists(db_path):
-                    os.remove(db_path)
-                    print("✅ Historial de sesiones eliminado")
-                    
-                    # Recargar la base de datos vacía
-                    import data.database
-                    data.database.init_db()
-                    
-                    # Recargar la lista
-                    self.load_sessions()
-                    self.session_details.clear()
-                    
-                    QMessageBox.information(self, "Listo", "Historial eliminado correctamente")
-                else:
-                    QMessageBox.warning(self, "Error", "No se encontró la base de datos")
+                # Vaciar el historial sin borrar el archivo (las conexiones
+                # siguen abiertas y las reglas del usuario se conservan)
+                database.reset_db()
+                
+                # Recargar la lista
+                self.load_sessions()
+                self.session_details.clear()
+                self.timeline_view.hide()
+                
+                QMessageBox.information(self, "Listo", "Historial eliminado correctamente")
                     
             except Exception as e:
+                log.exception("Error eliminando el historial: %s", e)
                 QMessageBox.critical(self, "Error", f"No se pudo eliminar el historial: {str(e)}")
\ No newline at end of file
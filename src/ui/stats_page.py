@@ -4,8 +4,11 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter
 from PySide6.QtCharts import QChart, QChartView, QPieSeries, QBarSeries, QBarSet, QBarCategoryAxis, QValueAxis
 from data import database
+from core.log import get_logger
 import datetime
 
+log = get_logger("ui")
+
 class StatsPage(QWidget):
     def __init__(self, theme_manager=None):
         super().__init__()
@@ -58,7 +61,7 @@ class StatsPage(QWidget):
         
     def load_stats(self):
         """Cargar y mostrar estadísticas"""
-        print("📊 [STATS] Cargando estadísticas...")
+        log.debug("Cargando estadísticas...")
         
         # ⭐⭐ LIMPIAR LAYOUTS EXISTENTES ⭐⭐
         self._clear_layout(self.metrics_grid)
@@ -48,24 +48,24 @@ QWidget#timer_card {{
   min-width: 340px;
 }}
 
-QListWidget {{
+QListWidget, QListView#app_monitor {{
   background: #160f29;
   border-radius: 10px;
   padding: 6px;
   border: 1px solid rgba(124,58,237,0.15);
   color: {TEXT};
 }}
-QListWidget::item {{
+QListWidget::item, QListView#app_monitor::item {{
   padding: 8px 10px;
   border-radius: 6px;
   margin: 2px;
   background: rgba(255,255,255,0.03);
 }}
-QListWidget::item:selected {{
+QListWidget::item:selected, QListView#app_monitor::item:selected {{
   background: rgba(124,58,237,0.3);
   color: {TEXT};
 }}
-QListWidget::item:hover {{
+QListWidget::item:hover, QListView#app_monitor::item:hover {{
   background: rgba(124,58,237,0.15);
 }}
 
@@ -138,19 +138,19 @@ QLabel#soon_label {{
 }}
 
 /* SIDEBAR (Dashboard, Sesiones, etc) */
-QListWidget {{
+QListWidget, QListView#app_monitor {{
   background: #160f29;
   border-radius: 10px;
   padding: 6px;
   border: 1px solid rgba(124,58,237,0.15);
   color: {TEXT};
 }}
-QListWidget::item {{
+QListWidget::item, QListView#app_monitor::item {{
   padding: 8px 10px;
   border-radius: 6px;
   margin: 2px;
 }}
-QListWidget::item:selected {{
+QListWidget::item:selected, QListView#app_monitor::item:selected {{
   background: rgba(124,58,237,0.3);
   color: {TEXT};
 }}
@@ -279,24 +279,24 @@ QPushButton#secondary {{
   border: 1px solid rgba(0,0,0,0.06);
 }}
 
-QListWidget {{
+QListWidget, QListView#app_monitor {{
   background: {LIGHT_CARD};
   border-radius: 10px;
   padding: 6px;
   border: 1px solid rgba(0,0,0,0.04);
   color: {DARK_TEXT};
 }}
-QListWidget::item {{
+QListWidget::item, QListView#app_monitor::item {{
   padding: 6px 8px;
   border-radius: 6px;
   margin: 2px;
   background: rgba(0,0,0,0.02);
 }}
-QListWidget::item:selected {{
+QListWidget::item:selected, QListView#app_monitor::item:selected {{
   background: rgba(124,58,237,0.15);
   color: {DARK_TEXT};
 }}
-QListWidget::item:hover {{
+QListWidget::item:hover, QListView#app_monitor::item:hover {{
   background: rgba(124,58,237,0.08);
 }}
 
@@ -351,19 +351,19 @@ QLabel#soon_label {{
 }}
 
 /* LIST WIDGET */
-QListWidget {{
+QListWidget, QListView#app_monitor {{
   background: {LIGHT_CARD};
   border-radius: 10px;
   padding: 6px;
   border: 1px solid rgba(0,0,0,0.04);
   color: {DARK_TEXT};
 }}
-QListWidget::item {{
+QListWidget::item, QListView#app_monitor::item {{
   padding: 6px 8px;
   border-radius: 6px;
   margin: 2px;
 }}
-QListWidget::item:selected {{
+QListWidget::item:selected, QListView#app_monitor::item:selected {{
   background: rgba(124,58,237,0.15);
   color: {DARK_TEXT};
 }}
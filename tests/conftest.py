@@ -0,0 +1,44 @@
+# tests/conftest.py
+import os
+import sys
+import types
+
+import pytest
+
+# mismo esquema de imports que la app: "from core.x import Y", "from data import database"
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "fake_clock(module): módulo cuyo `time` sustituye el fixture clock")
+
+
+class FakeClock:
+    """Reloj que solo avanza a mano (clock.now += segundos)."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    monotonic = time
+
+
+@pytest.fixture
+def clock(request, monkeypatch):
+    """
+    FakeClock en lugar del módulo `time` de un módulo de la app. El módulo se
+    indica con parametrize(..., indirect=True) o con @pytest.mark.fake_clock(módulo).
+    """
+    module = getattr(request, "param", None)
+    if module is None:
+        marker = request.node.get_closest_marker("fake_clock")
+        if marker is None:
+            raise pytest.UsageError("el fixture clock necesita el módulo (param o marker fake_clock)")
+        module = marker.args[0]
+    clock = FakeClock()
+    monkeypatch.setattr(module, "time", types.SimpleNamespace(time=clock.time, monotonic=clock.monotonic))
+    return clock
@@ -0,0 +1,99 @@
+# tests/test_focus_scorer.py
+import random
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from core import focus_scorer
+from core.focus_scorer import FocusScorer
+
+pytestmark = pytest.mark.fake_clock(focus_scorer)
+
+APPS = [
+    ("code.exe", "main.py - Visual Studio Code"),
+    ("chrome.exe", "YouTube - Google Chrome"),
+    ("chrome.exe", "Docs - Google Chrome"),
+    ("slack.exe", "general | Slack"),
+    ("vlc.exe", "película.mkv"),
+    ("explorer.exe", ""),
+]
+
+
+def fill(scorer, clock, rnd, events):
+    """Simula el tracker: ventanas activas con duraciones y huecos aleatorios."""
+    for _ in range(events):
+        clock.now += rnd.uniform(0, 5)  # hueco sin ventana activa
+        seconds = rnd.choice([0.5, 1, 3, 20, 45, 90, 400])
+        clock.now += seconds
+        proc, title = rnd.choice(APPS)
+        scorer.push_active(proc, title, seconds)
+
+
+def assert_same_totals(scorer, clock, rnd):
+    scorer._sync_accumulators()
+    assert scorer._history_ordered
+    first = scorer.history[0][0]
+    cutoffs = [first - 10, first, clock.now - scorer.window_seconds, clock.now]
+    cutoffs += [rnd.uniform(first, clock.now) for _ in range(20)]
+    for cutoff in cutoffs:
+        fast = scorer._window_totals(cutoff)
+        full = scorer._scan_window(cutoff, clock.now)
+        assert fast == pytest.approx(full, abs=1e-6), cutoff
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_window_totals_match_full_scan(clock, seed):
+    rnd = random.Random(seed)
+    scorer = FocusScorer(window_seconds=rnd.choice([300, 1800, 3600]))
+    fill(scorer, clock, rnd, 300)
+    assert_same_totals(scorer, clock, rnd)
+
+
+def test_window_totals_after_rule_and_threshold_changes(clock):
+    rnd = random.Random(42)
+    scorer = FocusScorer()
+    fill(scorer, clock, rnd, 200)
+    assert_same_totals(scorer, clock, rnd)
+
+    scorer.add_distractor("slack")
+    assert_same_totals(scorer, clock, rnd)
+
+    scorer.set_rules([(1, "process", "code.exe", "distractor", 1.0)])
+    assert_same_totals(scorer, clock, rnd)
+
+    scorer.set_distractor_threshold_seconds(10)
+    assert_same_totals(scorer, clock, rnd)
+
+    fill(scorer, clock, rnd, 50)
+    assert_same_totals(scorer, clock, rnd)
+
+
+def test_window_totals_after_pruning(clock):
+    rnd = random.Random(7)
+    scorer = FocusScorer(window_seconds=1800)
+    fill(scorer, clock, rnd, 400)
+    scorer.set_window_seconds(300)
+    assert scorer.history[0][1] >= clock.now - 300
+    assert_same_totals(scorer, clock, rnd)
+
+
+def test_window_totals_with_session_start_cutoff_and_long_history(clock):
+    # RatioStrategy: cutoff = inicio de sesión, con una hora de historial previo
+    rnd = random.Random(3)
+    scorer = FocusScorer(window_seconds=7200)
+    fill(scorer, clock, rnd, 600)
+    session_start = clock.now
+    before = len(scorer.history)
+    fill(scorer, clock, rnd, 40)
+    assert scorer.history[0][0] < session_start - 3600
+    assert len(scorer.history) > before
+
+    scorer._sync_accumulators()
+    fast = scorer._window_totals(session_start)
+    full = scorer._scan_window(session_start, clock.now)
+    assert fast == pytest.approx(full, abs=1e-6)
+
+    total, distractor = full
+    expected = max(0, int((1.0 - distractor / total) * 100))
+    assert scorer.get_current_score(session_start_time=session_start) == expected
@@ -0,0 +1,50 @@
+# tests/test_reports.py
+import datetime
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("pandas")
+
+from core import focus_scorer
+from core.focus_scorer import FocusScorer
+from data import database
+from reports import reports
+
+pytestmark = pytest.mark.fake_clock(focus_scorer)
+
+
+def test_to_timestamp_and_to_epoch():
+    moment = datetime.datetime(2024, 5, 1, 10, 0, 0, 750000)
+    assert database.to_timestamp(moment) == moment.timestamp()
+    assert database.to_timestamp(moment.isoformat()) == moment.timestamp()
+    assert database.to_epoch(moment) == int(moment.timestamp())
+    assert database.to_timestamp(None) is None and database.to_epoch(None) is None
+    for bad in ("ayer", "2024-13-01", object()):
+        with pytest.raises(ValueError):
+            database.to_epoch(bad)
+        with pytest.raises(ValueError):
+            database.to_timestamp(bad)
+
+
+def test_history_end_bound_keeps_sub_second_precision(clock):
+    clock.now = 1_700_000_000.0
+    scorer = FocusScorer()
+    scorer.push_active("code.exe", "main.py", 10)
+    clock.now += 0.6  # el siguiente evento empieza en (int(end), end]
+    scorer.push_active("chrome.exe", "YouTube", 0.2)
+    start_second = scorer.history[-1][0]
+    rows = sum(len(df) for df in reports.history_chunks(scorer, end=start_second + 0.1))
+    assert int(start_second) < start_second
+    assert rows == 2
+
+
+def test_invalid_bounds_raise_before_writing(clock, tmp_path):
+    scorer = FocusScorer()
+    scorer.push_active("code.exe", "main.py", 10)
+    path = tmp_path / "history.csv"
+    with pytest.raises(ValueError):
+        reports.export_history(scorer, str(path), start="no es una fecha")
+    assert not path.exists()
+    with pytest.raises(ValueError):
+        reports.session_event_chunks(scorer, end="tampoco")
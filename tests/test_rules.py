@@ -0,0 +1,44 @@
+# tests/test_rules.py
+import pytest
+
+pytest.importorskip("PySide6")
+
+from core.focus_scorer import build_matcher
+from core.keyword_matcher import PRODUCTIVE, DISTRACTOR
+from core.rules import RuleMatcher, validate_rule, validate_rules
+
+
+@pytest.mark.parametrize("pattern", ["(?i)youtube", "you(?s)tube", "(?P<site>youtube)", r"(a)\1"])
+def test_validate_rule_rejects_what_breaks_the_combined_regex(pattern):
+    with pytest.raises(ValueError):
+        validate_rule("title_regex", pattern, "distractor", 1.0)
+
+
+def test_validate_rule_accepts_scoped_flags():
+    validate_rule("title_regex", "(?i:you)tube|net(?:flix)?", "distractor", 1.0)
+
+
+def test_validate_rules_checks_the_whole_set():
+    validate_rules([(1, "title_regex", "git(hub)?", "productive", 1.0),
+                    (2, "keyword", "jira", "productive", 1.0)])
+    with pytest.raises(ValueError):
+        validate_rules([(1, "title_regex", "github", "productive", 1.0),
+                        (2, "title_regex", "(?i)youtube", "distractor", 1.0)])
+
+
+def test_bad_stored_rules_are_skipped_and_classification_goes_on():
+    # filas guardadas antes de validar el conjunto
+    rules = [
+        (1, "title_regex", "(?i)youtube", "distractor", 1.0),
+        (2, "title_regex", "(?P<x>git)lab", "productive", 1.0),
+        (3, "title_regex", "(?P<x>hub)", "productive", 1.0),
+        (4, "title_regex", "net(flix)", "distractor", 1.0),
+    ]
+    matcher = build_matcher(["code"], ["reddit"], rules)
+    assert isinstance(matcher, RuleMatcher)
+    assert [r.id for r in matcher.invalid] == [1]
+    assert not matcher.combined  # (?P<x>...) dos veces
+    assert matcher.match("firefox.exe", "GitLab merge requests") == PRODUCTIVE
+    assert matcher.match("firefox.exe", "GitHub") == PRODUCTIVE
+    assert matcher.match("firefox.exe", "Netflix") == DISTRACTOR
+    assert matcher.match("code.exe", "main.py") == PRODUCTIVE  # listas como respaldo
@@ -0,0 +1,58 @@
+# tests/test_session_journal.py
+import pytest
+
+pytest.importorskip("PySide6")
+
+from core import core_worker, session_journal
+from core.session_journal import SessionJournal
+
+pytestmark = pytest.mark.fake_clock(core_worker)
+
+
+@pytest.fixture(scope="module")
+def qcore_app():
+    from PySide6.QtCore import QCoreApplication
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def worker(qcore_app, tmp_path):
+    worker = core_worker.CoreWorker(tracker=None, rules=[], journal_path=str(tmp_path / "journal.jsonl"))
+    yield worker
+    worker.journal.close()
+
+
+def run(worker, clock, seconds, proc="code.exe", title="main.py"):
+    """El tracker entrega un intervalo por segundo y el core publica."""
+    for _ in range(seconds):
+        worker.on_active_interval(proc, title, clock.now, clock.now + 1)
+        clock.now += 1
+        worker.publish()
+
+
+def test_checkpoint_records_active_time_across_pauses(worker, clock):
+    start = clock.now
+    worker.start_tracking(clock.now, start, 25)
+    run(worker, clock, 600)
+    worker.stop_tracking(clock.now)
+    clock.now += 300  # pausa: no cuenta
+    worker.checkpoint()
+    worker.start_tracking(clock.now, start, 25)
+    run(worker, clock, 900)
+    worker.checkpoint()
+
+    state = session_journal.load(worker.journal.path)
+    assert state["elapsed"] == pytest.approx(1500)
+    assert state["start"] == start
+    assert len(state["timeline"]) == 1500 // worker.engine.timeline_interval + 1
+
+
+def test_checkpoint_without_active_window_still_advances_elapsed(tmp_path):
+    journal = SessionJournal(str(tmp_path / "journal.jsonl"))
+    journal.begin(1_700_000_000.0, 1500, 30)
+    usage = {("code.exe", "main.py"): 20.0}
+    assert journal.checkpoint(20.0, 100, usage, [100])
+    assert journal.checkpoint(45.0, 100, usage, [100])  # solo cambió el tiempo activo
+    assert not journal.checkpoint(45.0, 100, usage, [100])
+    journal.close()
+    assert session_journal.load(journal.path)["elapsed"] == 45.0
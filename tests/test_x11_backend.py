@@ -0,0 +1,150 @@
+# tests/test_x11_backend.py
+"""
+X11Backend contra un servidor Xvfb real: el test hace de gestor de ventanas
+(escribe _NET_ACTIVE_WINDOW y _NET_WM_NAME) y comprueba que wait() despierta
+por PropertyNotify y no por polling. Se salta si no hay Xvfb o python-xlib.
+"""
+import os
+import shutil
+import subprocess
+import threading
+import time
+
+import psutil
+import pytest
+
+pytest.importorskip("Xlib")
+from Xlib import X, Xatom
+from Xlib import display as xdisplay
+
+from core.tracker_backends import X11Backend
+
+XVFB = shutil.which("Xvfb")
+pytestmark = pytest.mark.skipif(XVFB is None, reason="Xvfb no disponible")
+
+
+@pytest.fixture
+def xserver():
+    """Arranca Xvfb en un display libre y devuelve (nombre, conexión)."""
+    number = next(n for n in range(90, 200) if not os.path.exists(f"/tmp/.X{n}-lock"))
+    name = f":{number}"
+    proc = subprocess.Popen([XVFB, name, "-screen", "0", "640x480x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while True:
+        try:
+            conn = xdisplay.Display(name)
+            break
+        except Exception:
+            if proc.poll() is not None or time.monotonic() > deadline:
+                proc.kill()
+                pytest.skip("Xvfb no arrancó")
+            time.sleep(0.05)
+    yield name, conn
+    conn.close()
+    proc.terminate()
+    proc.wait(5)
+
+
+class FakeWindowManager:
+    """Lo mínimo de un gestor de ventanas EWMH: ventanas, foco y títulos."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.root = conn.screen().root
+        self.NET_ACTIVE_WINDOW = conn.intern_atom("_NET_ACTIVE_WINDOW")
+        self.NET_WM_NAME = conn.intern_atom("_NET_WM_NAME")
+        self.NET_WM_PID = conn.intern_atom("_NET_WM_PID")
+        self.UTF8_STRING = conn.intern_atom("UTF8_STRING")
+
+    def window(self, title, pid):
+        win = self.root.create_window(0, 0, 10, 10, 0, X.CopyFromParent)
+        win.change_property(self.NET_WM_PID, Xatom.CARDINAL, 32, [pid])
+        win.set_wm_class("focusly-test", "FocuslyTest")
+        self.rename(win, title)
+        return win
+
+    def rename(self, win, title):
+        win.change_property(self.NET_WM_NAME, self.UTF8_STRING, 8, title.encode("utf-8"))
+        self.conn.flush()
+
+    def activate(self, win):
+        self.root.change_property(self.NET_ACTIVE_WINDOW, Xatom.WINDOW, 32, [win.id])
+        self.conn.flush()
+
+
+@pytest.fixture
+def desktop(xserver):
+    """Dos ventanas: una de este proceso (activa) y otra de un proceso hijo."""
+    name, conn = xserver
+    wm = FakeWindowManager(conn)
+    child = subprocess.Popen(["sleep", "60"])
+    editor = wm.window("main.py — Editor", os.getpid())
+    terminal = wm.window("Terminal ñ", child.pid)
+    wm.activate(editor)
+    backend = X11Backend(display_name=name)
+    backend.open()
+    yield backend, wm, editor, terminal, child
+    backend.close()
+    child.kill()
+    child.wait()
+
+
+def later(delay, action):
+    """Ejecuta action desde otro hilo mientras el backend está bloqueado en wait()."""
+    timer = threading.Timer(delay, action)
+    timer.start()
+    return timer
+
+
+def test_sample_reads_active_window(desktop):
+    backend, wm, editor, terminal, child = desktop
+    assert backend.sample() == (psutil.Process().name(), "main.py — Editor")
+
+
+def test_wait_times_out_without_changes(desktop):
+    backend, wm, editor, terminal, child = desktop
+    backend.sample()
+    t0 = time.monotonic()
+    assert backend.wait(0.3) is False
+    assert time.monotonic() - t0 >= 0.25
+
+
+def test_wait_wakes_on_focus_change(desktop):
+    backend, wm, editor, terminal, child = desktop
+    backend.sample()
+    timer = later(0.2, lambda: wm.activate(terminal))
+    t0 = time.monotonic()
+    assert backend.wait(5.0) is True
+    assert time.monotonic() - t0 < 2.0
+    timer.join()
+    assert backend.sample() == (psutil.Process(child.pid).name(), "Terminal ñ")
+
+
+def test_wait_wakes_on_title_change_of_active_window(desktop):
+    backend, wm, editor, terminal, child = desktop
+    backend.sample()  # suscribe a los cambios de título de la ventana activa
+    timer = later(0.2, lambda: wm.rename(editor, "app.py — Editor"))
+    assert backend.wait(5.0) is True
+    timer.join()
+    assert backend.sample()[1] == "app.py — Editor"
+
+
+def test_title_of_previous_window_is_not_watched(desktop):
+    backend, wm, editor, terminal, child = desktop
+    backend.sample()
+    wm.activate(terminal)
+    assert backend.wait(5.0) is True
+    backend.sample()  # mueve la suscripción a terminal
+    wm.rename(editor, "otro título")
+    assert backend.wait(0.3) is False
+
+
+def test_wake_interrupts_wait(desktop):
+    backend, wm, editor, terminal, child = desktop
+    backend.sample()
+    timer = later(0.2, backend.wake)
+    t0 = time.monotonic()
+    assert backend.wait(5.0) is False
+    assert time.monotonic() - t0 < 2.0
+    timer.join()